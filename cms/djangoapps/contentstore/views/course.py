@@ -24,7 +24,7 @@ from django.urls import reverse
 from django.utils.translation import gettext as _
 from django.views.decorators.csrf import ensure_csrf_cookie
 from django.views.decorators.http import require_GET, require_http_methods
-from edx_django_utils.monitoring import function_trace
+from edx_django_utils.monitoring import function_trace, set_custom_attribute
 from edx_toggles.toggles import WaffleSwitch
 from opaque_keys import InvalidKeyError
 from opaque_keys.edx.keys import CourseKey
@@ -51,6 +51,7 @@ from common.djangoapps.student.roles import (
     CourseInstructorRole,
     CourseStaffRole,
     GlobalStaff,
+    RoleCache,
     UserBasedRole
 )
 from common.djangoapps.util.date_utils import get_default_time_display
@@ -567,6 +568,10 @@ def course_listing(request):
     split_archived = settings.FEATURES.get('ENABLE_SEPARATE_ARCHIVED_COURSES', False)
     active_courses, archived_courses = _process_courses_list(courses_iter, in_process_course_actions, split_archived)
     in_process_course_actions = [format_in_process_course_view(uca) for uca in in_process_course_actions]
+    formatted_libraries = [_format_library_for_view(lib, request) for lib in libraries]
+
+    # Record how many queries were needed to load the user's course roles.
+    set_custom_attribute('course_access_role_queries', RoleCache.query_count())
 
     return render_to_response('index.html', {
         'courses': active_courses,
@@ -576,7 +581,7 @@ def course_listing(request):
         'libraries_enabled': LIBRARIES_ENABLED,
         'redirect_to_library_authoring_mfe': should_redirect_to_library_authoring_mfe(),
         'library_authoring_mfe_url': LIBRARY_AUTHORING_MICROFRONTEND_URL,
-        'libraries': [_format_library_for_view(lib, request) for lib in libraries],
+        'libraries': formatted_libraries,
         'show_new_library_button': user_can_create_library(user) and not should_redirect_to_library_authoring_mfe(),
         'user': user,
         'request_course_creator_url': reverse('request_course_creator'),
@@ -69,6 +69,7 @@ urlpatterns = oauth2_urlpatterns + [
 
     # noop to squelch ajax errors
     path('event', contentstore_views.event, name='event'),
+    path('event/batch', contentstore_views.event, name='event_batch'),
     path('heartbeat', include('openedx.core.djangoapps.heartbeat.urls')),
     path('i18n/', include('django.conf.urls.i18n')),
 
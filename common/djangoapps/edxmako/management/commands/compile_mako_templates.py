@@ -0,0 +1,42 @@
+"""
+Django management command to precompile the Mako templates of every lookup,
+including the templates of all themes, into the Mako module directory.
+
+Run it at build time, with the same settings as the web workers, and enable
+MAKO_PRECOMPILED_TEMPLATES so that workers neither compile templates nor probe
+the filesystem for them while serving requests.
+"""
+
+
+from django.core.management.base import BaseCommand, CommandError
+
+from common.djangoapps.edxmako import LOOKUP
+
+
+class Command(BaseCommand):
+    """
+    Implementation of the management command
+    """
+
+    help = 'Compiles all Mako templates, for each theme, into MAKO_MODULE_DIR.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fail-on-error',
+            action='store_true',
+            help='Exit with an error if any template fails to compile.',
+        )
+
+    def handle(self, *args, **options):
+        failure_count = 0
+        for namespace, lookup in sorted(LOOKUP.items()):
+            failures = lookup.compile_templates()
+            for uri, exc in failures:
+                self.stderr.write(f"{namespace}: failed to compile {uri}: {exc}")
+            failure_count += len(failures)
+            self.stdout.write(
+                f"{namespace}: compiled templates into {lookup.template_args['module_directory']}"
+            )
+
+        if failure_count and options['fail_on_error']:
+            raise CommandError(f"{failure_count} templates failed to compile.")
@@ -5,7 +5,10 @@ Set up lookup paths for mako templates.
 
 import contextlib
 import hashlib
+import json
+import logging
 import os
+import re
 
 import pkg_resources
 import six
@@ -13,11 +16,25 @@ from django.conf import settings
 from mako.exceptions import TopLevelLookupException
 from mako.lookup import TemplateLookup
 
-from openedx.core.djangoapps.theming.helpers import get_template_path_with_theme, strip_site_theme_templates_path
+from openedx.core.djangoapps.theming.helpers import (
+    get_current_theme,
+    get_template_path_with_theme,
+    strip_site_theme_templates_path
+)
 from openedx.core.lib.cache_utils import request_cached
 
 from . import LOOKUP
 
+log = logging.getLogger(__name__)
+
+# The file, in a lookup's module directory, that lists the template files of
+# the lookup's directories. It is written by the compile_mako_templates
+# management command.
+RESOLVED_LOOKUPS_FILENAME = 'resolved_lookups.json'
+
+# Extensions of the files that compile_mako_templates compiles.
+TEMPLATE_EXTENSIONS = ('.html', '.txt', '.xml')
+
 
 class TopLevelTemplateURI(str):
     """
@@ -36,6 +53,7 @@ class DynamicTemplateLookup(TemplateLookup):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.__original_module_directory = self.template_args['module_directory']
+        self._resolved_template_files = None
 
     def __repr__(self):
         return "<{0.__class__.__name__} {0.directories}>".format(self)
@@ -60,6 +78,83 @@ class DynamicTemplateLookup(TemplateLookup):
         # Also clear the internal caches. Ick.
         self._collection.clear()
         self._uri_cache.clear()
+        self._resolved_template_files = None
+
+    def compile_templates(self):
+        """
+        Compile every template in the lookup path into the module directory,
+        and write the resolved lookups of the lookup path next to them.
+
+        Templates of all themes are compiled too, as long as the themes
+        directory is part of the lookup path.
+
+        Returns a list of (uri, exception) for the templates that failed to
+        compile.
+        """
+        template_files = {directory: _find_template_files(directory) for directory in self.directories}
+
+        failures = []
+        for directory, files in template_files.items():
+            for template_file in files:
+                if not template_file.endswith(TEMPLATE_EXTENSIONS):
+                    continue
+                uri = os.path.relpath(template_file, directory).replace(os.path.sep, '/')
+                try:
+                    # Skip the theme handling of get_template, the uri is the template's actual path.
+                    super().get_template(uri)
+                except Exception as exc:  # pylint: disable=broad-except
+                    failures.append((uri, exc))
+
+        module_directory = self.template_args['module_directory']
+        os.makedirs(module_directory, exist_ok=True)
+        with open(os.path.join(module_directory, RESOLVED_LOOKUPS_FILENAME), 'w') as resolved_lookups_file:
+            json.dump({
+                'directories': self.directories,
+                'template_files': sorted(
+                    template_file for files in template_files.values() for template_file in files
+                ),
+            }, resolved_lookups_file)
+
+        return failures
+
+    def _get_resolved_template_files(self):
+        """
+        Return the set of template files written by compile_templates, or None
+        if templates aren't precompiled for the current lookup path.
+        """
+        if self._resolved_template_files is None:
+            self._resolved_template_files = False
+            if getattr(settings, 'MAKO_PRECOMPILED_TEMPLATES', False):
+                path = os.path.join(self.template_args['module_directory'], RESOLVED_LOOKUPS_FILENAME)
+                try:
+                    with open(path) as resolved_lookups_file:
+                        resolved_lookups = json.load(resolved_lookups_file)
+                except (OSError, ValueError):
+                    log.warning("Mako templates are not precompiled for %r; missing %s", self, path)
+                else:
+                    if resolved_lookups['directories'] == self.directories:
+                        self._resolved_template_files = frozenset(resolved_lookups['template_files'])
+        return self._resolved_template_files or None
+
+    def _get_template_path_with_theme(self, uri):
+        """
+        Return the template path in the current site's theme, like
+        get_template_path_with_theme, but without checking the filesystem
+        when the templates are precompiled.
+        """
+        template_files = self._get_resolved_template_files()
+        if template_files is None:
+            return get_template_path_with_theme(uri)
+
+        relative_path = os.path.normpath(uri)
+        theme = get_current_theme()
+        if not theme:
+            return relative_path
+
+        template_name = re.sub(r'^/+', '', relative_path)
+        if os.path.normpath(theme.path / "templates" / template_name) in template_files:
+            return str(theme.template_path / template_name)
+        return relative_path
 
     def adjust_uri(self, uri, relativeto):
         """
@@ -79,7 +174,7 @@ class DynamicTemplateLookup(TemplateLookup):
         # located inside a theme?
         if relativeto != strip_site_theme_templates_path(relativeto):
             # Is the calling template trying to include/inherit itself?
-            if relativeto == get_template_path_with_theme(relative_uri):
+            if relativeto == self._get_template_path_with_theme(relative_uri):
                 return TopLevelTemplateURI(relative_uri)
         return relative_uri
 
@@ -99,7 +194,7 @@ class DynamicTemplateLookup(TemplateLookup):
         else:
             try:
                 # Try to find themed template, i.e. see if current theme overrides the template
-                template = super().get_template(get_template_path_with_theme(uri))
+                template = super().get_template(self._get_template_path_with_theme(uri))
             except TopLevelLookupException:
                 template = self._get_toplevel_template(uri)
 
@@ -113,6 +208,20 @@ class DynamicTemplateLookup(TemplateLookup):
         return super().get_template(strip_site_theme_templates_path(uri))
 
 
+def _find_template_files(directory):
+    """
+    Return the absolute paths of the files in "templates" directories within
+    the given lookup directory, such as the templates of each theme in a
+    themes directory.
+    """
+    template_files = []
+    for dirpath, dirnames, filenames in os.walk(directory):
+        dirnames[:] = sorted(name for name in dirnames if not name.startswith('.') and name != 'node_modules')
+        if 'templates' in dirpath.split(os.path.sep):
+            template_files.extend(os.path.normpath(os.path.join(dirpath, name)) for name in sorted(filenames))
+    return template_files
+
+
 def clear_lookups(namespace):
     """
     Remove mako template lookups for the given namespace.
@@ -137,6 +246,9 @@ def add_lookup(namespace, directory, package=None, prepend=False):
             input_encoding='utf-8',
             default_filters=['decode.utf8'],
             encoding_errors='replace',
+            # Precompiled templates don't change while the process runs, so
+            # skip checking their modification times on every lookup.
+            filesystem_checks=not getattr(settings, 'MAKO_PRECOMPILED_TEMPLATES', False),
         )
     if package:
         directory = pkg_resources.resource_filename(package, directory)
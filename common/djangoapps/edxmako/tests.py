@@ -1,9 +1,14 @@
 # lint-amnesty, pylint: disable=cyclic-import, missing-module-docstring
 
+import os
+import shutil
+import tempfile
+from pathlib import Path
 from unittest.mock import Mock, patch
 
 import ddt
 from django.conf import settings
+from django.core.management import call_command
 from django.http import HttpResponse
 from django.test import TestCase
 from django.test.client import RequestFactory
@@ -134,6 +139,67 @@ class AddLookupTests(TestCase):
         assert dirs[0].endswith('management')
 
 
+class PrecompiledTemplatesTests(TestCase):
+    """
+    Test the compile_mako_templates command, and the lookups of precompiled templates.
+    """
+
+    def setUp(self):
+        super().setUp()
+        lookup_patcher = patch.dict(LOOKUP, clear=True)
+        lookup_patcher.start()
+        self.addCleanup(lookup_patcher.stop)
+
+        root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, root)
+        self.templates_dir = os.path.join(root, 'templates')
+        self.themes_dir = os.path.join(root, 'themes')
+        self.theme_templates_dir = os.path.join(self.themes_dir, 'red-theme', 'lms', 'templates')
+        os.makedirs(self.templates_dir)
+        os.makedirs(self.theme_templates_dir)
+        for directory, template_name in (
+            (self.templates_dir, 'main.html'),
+            (self.templates_dir, 'footer.html'),
+            (self.theme_templates_dir, 'main.html'),
+        ):
+            with open(os.path.join(directory, template_name), 'w') as template_file:
+                template_file.write(f'{directory} ${{name}}')
+
+        self.theme = Mock(
+            path=Path(self.themes_dir) / 'red-theme' / 'lms',
+            template_path=Path('red-theme') / 'lms' / 'templates',
+        )
+        override = override_settings(MAKO_MODULE_DIR=os.path.join(root, 'modules'), MAKO_PRECOMPILED_TEMPLATES=True)
+        override.enable()
+        self.addCleanup(override.disable)
+
+        add_lookup('test', self.themes_dir)
+        add_lookup('test', self.templates_dir)
+        self.lookup = LOOKUP['test']
+
+    def test_compile_templates(self):
+        call_command('compile_mako_templates')
+
+        module_directory = self.lookup.template_args['module_directory']
+        for uri in ('main.html', 'footer.html', 'red-theme/lms/templates/main.html'):
+            assert os.path.exists(os.path.join(module_directory, uri + '.py'))
+        assert not self.lookup.filesystem_checks
+
+    @patch('common.djangoapps.edxmako.paths.get_template_path_with_theme')
+    def test_themed_lookup_without_filesystem_checks(self, mock_get_template_path_with_theme):
+        call_command('compile_mako_templates')
+
+        with patch('common.djangoapps.edxmako.paths.get_current_theme', return_value=self.theme):
+            assert self.lookup.get_template('main.html').render_unicode(name='x') == f'{self.theme_templates_dir} x'
+            assert self.lookup.get_template('footer.html').render_unicode(name='x') == f'{self.templates_dir} x'
+        mock_get_template_path_with_theme.assert_not_called()
+
+    @patch('common.djangoapps.edxmako.paths.get_template_path_with_theme', side_effect=lambda uri: uri)
+    def test_lookup_without_compiled_templates(self, mock_get_template_path_with_theme):
+        assert self.lookup.get_template('main.html').render_unicode(name='x') == f'{self.templates_dir} x'
+        mock_get_template_path_with_theme.assert_called_once_with('main.html')
+
+
 class MakoRequestContextTest(TestCase):
     """
     Test MakoMiddleware.
@@ -322,6 +322,27 @@ class CourseEntitlement(TimeStampedModel):
         except CourseEntitlement.DoesNotExist:
             return None
 
+    @classmethod
+    def get_active_entitlements_by_course_uuid(cls, user):
+        """
+        Retrieves the user's active entitlements for all courses at once.
+
+        Arguments:
+            user: User that owns the Course Entitlements
+
+        Returns:
+            dict: Maps each course UUID (as a string) to the same entitlement that get_entitlement_if_active
+                  would return for it. Courses without an active entitlement are left out.
+        """
+        entitlements = cls.objects.filter(
+            user=user
+        ).exclude(
+            expired_at__isnull=False,
+            enrollment_course_run=None
+        ).order_by('created')
+        # Later entitlements overwrite earlier ones, leaving the most recently created one for each course.
+        return {str(entitlement.course_uuid): entitlement for entitlement in entitlements}
+
     @classmethod
     def get_active_entitlements_for_user(cls, user):
         """
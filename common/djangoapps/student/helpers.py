@@ -10,14 +10,14 @@ import urllib.parse
 from collections import OrderedDict
 from datetime import datetime
 
-from completion.exceptions import UnavailableCompletionData
-from completion.utilities import get_key_to_last_completed_block
+from completion.models import BlockCompletion
 from django.conf import settings
 from django.contrib.auth import load_backend
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.core.exceptions import ObjectDoesNotExist, PermissionDenied
 from django.core.validators import ValidationError
 from django.db import IntegrityError, ProgrammingError, transaction
+from django.db.models import OuterRef, Subquery
 from django.urls import NoReverseMatch, reverse
 from django.utils.translation import gettext as _
 from pytz import UTC, timezone
@@ -454,7 +454,7 @@ class AccountValidationError(Exception):
         self.error_code = error_code
 
 
-def cert_info(user, enrollment):
+def cert_info(user, enrollment, cert_status=None):
     """
     Get the certificate info needed to render the dashboard section for the given
     student and course.
@@ -462,15 +462,16 @@ def cert_info(user, enrollment):
     Arguments:
         user (User): A user.
         enrollment (CourseEnrollment): A course enrollment.
+        cert_status (dict): Optional, already-fetched certificate status for the
+            user in this course (see certificate_statuses_for_student). Fetched
+            when not provided.
 
     Returns:
         See _cert_info
     """
-    return _cert_info(
-        user,
-        enrollment,
-        certificate_status_for_student(user, enrollment.course_overview.id),
-    )
+    if cert_status is None:
+        cert_status = certificate_status_for_student(user, enrollment.course_overview.id)
+    return _cert_info(user, enrollment, cert_status)
 
 
 def _cert_info(user, enrollment, cert_status):
@@ -774,27 +775,47 @@ def get_resume_urls_for_enrollments(user, enrollments):
                 if the value is '', then the user has not completed any blocks in the course run
     '''
     resume_course_urls = OrderedDict()
+    last_completed_blocks = get_keys_to_last_completed_blocks(
+        user, [enrollment.course_id for enrollment in enrollments]
+    )
     for enrollment in enrollments:
-        try:
-            block_key = get_key_to_last_completed_block(user, enrollment.course_id)
+        url_to_block = ''
+        block_key = last_completed_blocks.get(enrollment.course_id)
+        if block_key:
             try:
                 block_data = get_course_blocks(user, block_key)
             except UsageKeyNotInBlockStructure:
-                url_to_block = ''
+                pass
             else:
                 if block_key in block_data:
                     url_to_block = reverse(
                         'jump_to',
                         kwargs={'course_id': enrollment.course_id, 'location': block_key}
                     )
-                else:
-                    url_to_block = ''
-        except UnavailableCompletionData:
-            url_to_block = ''
         resume_course_urls[enrollment.course_id] = url_to_block
     return resume_course_urls
 
 
+def get_keys_to_last_completed_blocks(user, course_keys):
+    """
+    Bulk version of completion's get_key_to_last_completed_block.
+
+    Returns a dict mapping each of the given course keys in which the user has
+    completion data to the key of the block the user completed most recently.
+    Courses without completion data are omitted. All courses are resolved with
+    a single query, using the (user, context_key, modified) completion index.
+    """
+    if not course_keys:
+        return {}
+    latest_completion = BlockCompletion.objects.filter(
+        user=user, context_key=OuterRef('context_key'),
+    ).order_by('-modified').values('id')[:1]
+    completions = BlockCompletion.objects.filter(
+        user=user, context_key__in=course_keys, id=Subquery(latest_completion),
+    )
+    return {completion.context_key: completion.full_block_key for completion in completions}
+
+
 def does_user_profile_exist(user):
     """
     Check if user has an associated profile.
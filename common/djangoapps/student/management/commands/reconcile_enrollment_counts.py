@@ -0,0 +1,53 @@
+""" Command line script to recompute precomputed course enrollment counts. """
+
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from opaque_keys import InvalidKeyError
+from opaque_keys.edx.keys import CourseKey
+
+from common.djangoapps.student.models import CourseEnrollment, CourseEnrollmentCount
+
+logger = logging.getLogger(__name__)  # pylint: disable=invalid-name
+
+
+class Command(BaseCommand):  # lint-amnesty, pylint: disable=missing-class-docstring
+
+    help = """
+    Recomputes the CourseEnrollmentCount rows for the given courses (or every
+    course with enrollments) from the enrollment table. Run it to backfill the
+    counters right after enabling the student.use_enrollment_counters switch, and
+    again whenever enrollments have been changed outside of the model layer.
+
+    Example:
+
+        Reconcile the counts of two courses:
+
+            $ ... reconcile_enrollment_counts -c course-v1:org+course+run -c course-v1:org+other+run
+
+        Reconcile every course:
+
+            $ ... reconcile_enrollment_counts
+    """
+
+    def add_arguments(self, parser):
+        parser.add_argument('-c', '--course',
+                            metavar='COURSE_ID',
+                            dest='course_ids',
+                            action='append',
+                            default=[],
+                            help='Course id to reconcile; may be given more than once. Defaults to all courses.')
+
+    def handle(self, *args, **options):
+        try:
+            course_keys = [CourseKey.from_string(course_id) for course_id in options['course_ids']]
+        except InvalidKeyError as error:
+            raise CommandError(f'Invalid course id: {error}')  # lint-amnesty, pylint: disable=raise-missing-from
+
+        if not course_keys:
+            course_keys = CourseEnrollment.objects.order_by().values_list('course_id', flat=True).distinct()
+
+        for course_key in course_keys:
+            counts = CourseEnrollmentCount.reconcile(course_key)
+            logger.info('Reconciled enrollment counts for %s: %s', course_key, counts)
@@ -0,0 +1,79 @@
+""" Test the reconcile_enrollment_counts command line script."""
+
+
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+from edx_toggles.toggles.testutils import override_waffle_switch
+
+from common.djangoapps.student.models import CourseEnrollment, CourseEnrollmentCount
+from common.djangoapps.student.tests.factories import CourseEnrollmentFactory
+from common.djangoapps.student.toggles import USE_ENROLLMENT_COUNTERS
+from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase  # lint-amnesty, pylint: disable=wrong-import-order
+from xmodule.modulestore.tests.factories import CourseFactory  # lint-amnesty, pylint: disable=wrong-import-order
+
+
+@override_waffle_switch(USE_ENROLLMENT_COUNTERS, active=True)
+class ReconcileEnrollmentCountsTests(SharedModuleStoreTestCase):
+    """ Test the counters maintained on enrollment changes and their reconciliation. """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.course = CourseFactory.create()
+
+    def test_counters_follow_enrollment_changes(self):
+        audit = CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+        CourseEnrollmentFactory.create(course_id=self.course.id, mode='verified')
+        assert CourseEnrollment.objects.enrollment_counts(self.course.id) == {'audit': 1, 'verified': 1, 'total': 2}
+
+        audit.update_enrollment(mode='verified')
+        assert CourseEnrollmentCount.counts_for_course(self.course.id) == {'verified': 2}
+
+        audit.update_enrollment(is_active=False)
+        assert CourseEnrollment.objects.num_enrolled_in_exclude_admins(self.course.id) == 1
+
+        audit.delete()
+        assert CourseEnrollmentCount.counts_for_course(self.course.id) == {'verified': 1}
+
+    def test_counters_rolled_back_with_enrollment(self):
+        CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+        with pytest.raises(RuntimeError):
+            with transaction.atomic():
+                CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+                assert CourseEnrollmentCount.counts_for_course(self.course.id) == {'audit': 2}
+                raise RuntimeError
+        assert CourseEnrollmentCount.counts_for_course(self.course.id) == {'audit': 1}
+
+    @override_waffle_switch(USE_ENROLLMENT_COUNTERS, active=False)
+    def test_counters_not_maintained_when_disabled(self):
+        CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+        assert not CourseEnrollmentCount.objects.filter(course_id=self.course.id).exists()
+
+    def test_reconcile(self):
+        enrollments = [CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit') for _ in range(3)]
+        # Changes made outside of the model layer are not counted...
+        CourseEnrollment.objects.filter(pk=enrollments[0].pk).update(mode='verified')
+        CourseEnrollmentCount.objects.filter(course_id=self.course.id).update(count=0)
+        assert CourseEnrollment.objects.enrollment_counts(self.course.id) == {'total': 0}
+
+        # ... until the counts are reconciled.
+        call_command('reconcile_enrollment_counts', '--course', str(self.course.id))
+        assert CourseEnrollment.objects.enrollment_counts(self.course.id) == {'audit': 2, 'verified': 1, 'total': 3}
+
+    def test_reconcile_interleaved_with_enrollment(self):
+        CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+        select_for_update = CourseEnrollmentCount.objects.select_for_update
+
+        def enroll_then_lock():
+            # Another enrollment commits while reconcile waits for the counter rows.
+            CourseEnrollmentFactory.create(course_id=self.course.id, mode='audit')
+            return select_for_update()
+
+        with patch.object(CourseEnrollmentCount.objects, 'select_for_update', side_effect=enroll_then_lock):
+            counts = CourseEnrollmentCount.reconcile(self.course.id)
+
+        assert counts == {'audit': 2}
+        assert CourseEnrollmentCount.counts_for_course(self.course.id) == {'audit': 2}
@@ -12,8 +12,8 @@ from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imp
 from django.core.cache import cache
 from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
 from django.core.validators import FileExtensionValidator
-from django.db import models
-from django.db.models import Count, Index, Q
+from django.db import models, transaction
+from django.db.models import Count, F, Index, Q
 from django.dispatch import receiver
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -35,6 +35,7 @@ from simple_history.models import HistoricalRecords
 
 from common.djangoapps.course_modes.models import CourseMode, get_cosmetic_verified_display_price
 from common.djangoapps.student.signals import ENROLL_STATUS_CHANGE, ENROLLMENT_TRACK_UPDATED, UNENROLL_DONE
+from common.djangoapps.student.toggles import should_use_enrollment_counters
 from common.djangoapps.track import contexts, segment
 from common.djangoapps.util.query import use_read_replica_if_available
 from lms.djangoapps.certificates.data import CertificateStatuses
@@ -171,6 +172,16 @@ class CourseEnrollmentManager(models.Manager):
         admins = CourseInstructorRole(course_locator).users_with_role()
         coaches = CourseCcxCoachRole(course_locator).users_with_role()
 
+        if should_use_enrollment_counters():
+            # Subtract the (few) enrolled course admins from the precomputed total
+            # instead of counting every learner in the course.
+            enrolled_admins = super().get_queryset().filter(
+                Q(user__in=staff) | Q(user__in=admins) | Q(user__in=coaches),
+                course_id=course_id,
+                is_active=1,
+            ).count()
+            return sum(CourseEnrollmentCount.counts_for_course(course_id).values()) - enrolled_admins
+
         return super().get_queryset().filter(
             course_id=course_id,
             is_active=1,
@@ -213,6 +224,11 @@ class CourseEnrollmentManager(models.Manager):
         Returns a dictionary that stores the total enrollment count for a course, as well as the
         enrollment count for each individual mode.
         """
+        if should_use_enrollment_counters():
+            enroll_dict = defaultdict(int, CourseEnrollmentCount.counts_for_course(course_id))
+            enroll_dict['total'] = sum(enroll_dict.values())
+            return enroll_dict
+
         # Unfortunately, Django's "group by"-style queries look super-awkward
         query = use_read_replica_if_available(
             super().get_queryset().filter(course_id=course_id, is_active=True).values(
@@ -237,6 +253,14 @@ class CourseEnrollmentManager(models.Manager):
 # is used to cache the state in the request cache.
 CourseEnrollmentState = namedtuple('CourseEnrollmentState', 'mode, is_active')
 
+# Marks an enrollment whose saved mode or active flag was not loaded (deferred),
+# so its previous state has to be read back before counters are adjusted.
+_UNKNOWN_COUNTED_STATE = object()
+
+# Named tuple for a single entry of a user's enrollment summary.  Summaries
+# are cached per user so that enrollment lookups can skip the database.
+CourseEnrollmentSummary = namedtuple('CourseEnrollmentSummary', 'course_id, mode, is_active, created')
+
 
 class CourseEnrollment(models.Model):
     """
@@ -289,6 +313,10 @@ class CourseEnrollment(models.Model):
     # cache key format e.g enrollment.<username>.<course_key>.mode = 'honor'
     COURSE_ENROLLMENT_CACHE_KEY = "enrollment.{}.{}.mode"  # TODO Can this be removed?  It doesn't seem to be used.
 
+    # The enrollment summary is deleted whenever one of the user's enrollments changes,
+    # the timeout only bounds how long a summary missed by an invalidation can be served.
+    ENROLLMENT_SUMMARY_CACHE_TIMEOUT = 60 * 60
+
     MODE_CACHE_NAMESPACE = 'CourseEnrollment.mode_and_active'
 
     class Meta:
@@ -303,18 +331,70 @@ class CourseEnrollment(models.Model):
         # When the property .course_overview is accessed for the first time, this variable will be set.
         self._course_overview = None
 
+        # Mode and active flag as last saved, so save() can keep CourseEnrollmentCount up to date.
+        self._counted_state = self._get_loaded_counted_state()
+
     def __str__(self):
         return (
             "[CourseEnrollment] {}: {} ({}); active: ({})"
         ).format(self.user, self.course_id, self.created, self.is_active)
 
+    def _get_loaded_counted_state(self):
+        """
+        Returns the (mode, is_active) state of this enrollment as loaded from the
+        database, None for unsaved enrollments, or _UNKNOWN_COUNTED_STATE if
+        either field was deferred.
+        """
+        if self.pk is None:
+            return None
+        if 'mode' not in self.__dict__ or 'is_active' not in self.__dict__:
+            return _UNKNOWN_COUNTED_STATE
+        return CourseEnrollmentState(self.mode, self.is_active)
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._counted_state = self._get_loaded_counted_state()
+
     def save(self, force_insert=False, force_update=False, using=None, update_fields=None):
-        super().save(
-            force_insert=force_insert, force_update=force_update, using=using, update_fields=update_fields
-        )
+        if should_use_enrollment_counters():
+            # Keep the counters in the same transaction as the enrollment, updating them last so that
+            # their rows are only locked from then until the commit.
+            with transaction.atomic(using=using):
+                previous_state = self._counted_state
+                if previous_state is _UNKNOWN_COUNTED_STATE:
+                    previous_state = CourseEnrollment.objects.filter(pk=self.pk).values_list(
+                        'mode', 'is_active', named=True
+                    ).first()
+                super().save(
+                    force_insert=force_insert, force_update=force_update, using=using, update_fields=update_fields
+                )
+                current_state = CourseEnrollmentState(self.mode, self.is_active)
+                CourseEnrollmentCount.record_change(self.course_id, previous_state, current_state)
+        else:
+            super().save(
+                force_insert=force_insert, force_update=force_update, using=using, update_fields=update_fields
+            )
+        self._counted_state = CourseEnrollmentState(self.mode, self.is_active)
 
-        # Delete the cached status hash, forcing the value to be recalculated the next time it is needed.
-        cache.delete(self.enrollment_status_hash_cache_key(self.user))
+        # Delete the cached status hash and summary, forcing them to be recalculated the next time they are needed.
+        self.invalidate_enrollment_summary(self.user)
+
+    @classmethod
+    def invalidate_enrollment_summary(cls, user, *extra_cache_keys):
+        """
+        Deletes the cached enrollment summary and status hash of the given user,
+        along with any extra cache keys.
+
+        The keys are deleted again once the current transaction commits, so that
+        a summary cached from data read before the commit doesn't outlive it.
+        """
+        cache_keys = [
+            cls.enrollment_status_hash_cache_key(user),
+            cls.enrollment_summary_cache_key(user),
+            *extra_cache_keys,
+        ]
+        cache.delete_many(cache_keys)
+        transaction.on_commit(lambda: cache.delete_many(cache_keys))
 
     @classmethod
     def get_or_create_enrollment(cls, user, course_key):
@@ -931,6 +1011,54 @@ class CourseEnrollment(models.Model):
         """
         return 'enrollment_status_hash_' + user.username
 
+    @classmethod
+    def enrollment_summary_cache_key(cls, user):
+        """ Returns the cache key for the cached enrollment summary.
+
+        Args:
+            user (User): User whose cache key should be returned.
+
+        Returns:
+            str: Cache key.
+        """
+        return f'enrollment_summary_{user.id}'
+
+    @classmethod
+    def enrollment_summary_for_user(cls, user):
+        """ Returns a compact summary of all of the given user's enrollments, active or not.
+
+        The summary is cached and deleted whenever one of the user's enrollments
+        is saved or deleted, so repeated reads need no queries.
+
+        Args:
+            user (User): User whose enrollments should be summarized.
+
+        Returns:
+            list[CourseEnrollmentSummary]: One entry per enrollment, most recent first.
+        """
+        return list(cls._get_enrollment_summaries_by_course(user).values())
+
+    @classmethod
+    def _get_enrollment_summaries_by_course(cls, user):
+        """
+        Returns the given user's cached enrollment summary as a dict of
+        CourseEnrollmentSummary by course id string, most recent first,
+        building and caching it if needed.
+        """
+        cache_key = cls.enrollment_summary_cache_key(user)
+        summaries_by_course = cache.get(cache_key)
+
+        if summaries_by_course is None:
+            summaries_by_course = {
+                str(values[0]): CourseEnrollmentSummary(*values)
+                for values in cls.objects.filter(user=user).order_by('-created').values_list(
+                    'course_id', 'mode', 'is_active', 'created'
+                )
+            }
+            cache.set(cache_key, summaries_by_course, cls.ENROLLMENT_SUMMARY_CACHE_TIMEOUT)
+
+        return summaries_by_course
+
     @classmethod
     def generate_enrollment_status_hash(cls, user):
         """ Generates a hash encoding the given user's *active* enrollments.
@@ -950,8 +1078,11 @@ class CourseEnrollment(models.Model):
         status_hash = cache.get(cache_key)
 
         if not status_hash:
-            enrollments = cls.enrollments_for_user(user).values_list('course_id', 'mode')
-            enrollments = [(str(e[0]).lower(), e[1].lower()) for e in enrollments]
+            enrollments = [
+                (str(summary.course_id).lower(), summary.mode.lower())
+                for summary in cls.enrollment_summary_for_user(user)
+                if summary.is_active
+            ]
             enrollments = sorted(enrollments, key=lambda e: e[0])
             hash_elements = [user.username]
             hash_elements += [f'{e[0]}={e[1]}' for e in enrollments]
@@ -1332,14 +1463,31 @@ class CourseEnrollment(models.Model):
             return CourseEnrollmentState(None, None)
         enrollment_state = cls._get_enrollment_in_request_cache(user, course_key)
         if not enrollment_state:
-            try:
-                record = cls.objects.get(user=user, course_id=course_key)
-                enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
-            except cls.DoesNotExist:
-                enrollment_state = CourseEnrollmentState(None, None)
+            enrollment_state = cls._get_enrollment_state_from_summary(user, course_key)
+            if not enrollment_state:
+                try:
+                    record = cls.objects.get(user=user, course_id=course_key)
+                    enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
+                except cls.DoesNotExist:
+                    enrollment_state = CourseEnrollmentState(None, None)
             cls._update_enrollment_in_request_cache(user, course_key, enrollment_state)
         return enrollment_state
 
+    @classmethod
+    def _get_enrollment_state_from_summary(cls, user, course_key):
+        """
+        Returns the CourseEnrollmentState for the given user and course_key
+        from the user's cached enrollment summary, or None if no summary is
+        cached.  The summary is only read, never built, here.
+        """
+        summaries_by_course = cache.get(cls.enrollment_summary_cache_key(user))
+        if summaries_by_course is None:
+            return None
+        entry = summaries_by_course.get(str(course_key))
+        if entry is None:
+            return CourseEnrollmentState(None, None)
+        return CourseEnrollmentState(entry.mode, entry.is_active)
+
     @classmethod
     def bulk_fetch_enrollment_states(cls, users, course_key):
         """
@@ -1356,6 +1504,12 @@ class CourseEnrollment(models.Model):
             enrollment_state = CourseEnrollmentState(record.mode, record.is_active)
             cls._update_enrollment(cache, record.user.id, course_key, enrollment_state)
 
+        # Remember which users aren't enrolled too, so that checking them
+        # doesn't fall back to a query per user.
+        for user in users:
+            if (user.id, course_key) not in cache:
+                cls._update_enrollment(cache, user.id, course_key, CourseEnrollmentState(None, None))
+
     @classmethod
     def _get_mode_active_request_cache(cls):
         """
@@ -1417,6 +1571,105 @@ class FBEEnrollmentExclusion(models.Model):
         return f"[FBEEnrollmentExclusion] {self.enrollment}"
 
 
+class CourseEnrollmentCount(models.Model):
+    """
+    Precomputed number of active enrollments in a course, per enrollment mode.
+
+    While the student.use_enrollment_counters switch is enabled, rows are
+    adjusted in the same transaction as every CourseEnrollment save and delete,
+    so counts and capacity checks become small reads instead of COUNT queries over the whole
+    course. Changes made without going through the model (e.g. queryset
+    updates) or while the switch is disabled are not tracked; the
+    reconcile_enrollment_counts management command recomputes the rows from the
+    enrollment table.
+
+    .. no_pii:
+    """
+    course_id = CourseKeyField(max_length=255, db_index=True)
+    mode = models.CharField(max_length=100)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = (('course_id', 'mode'), )
+
+    def __str__(self):
+        return f"[CourseEnrollmentCount] {self.course_id} ({self.mode}): {self.count}"
+
+    @classmethod
+    def counts_for_course(cls, course_id):
+        """
+        Returns a dict mapping each mode with active enrollments in the course to its count.
+        """
+        return dict(cls.objects.filter(course_id=course_id, count__gt=0).values_list('mode', 'count'))
+
+    @classmethod
+    def adjust(cls, course_id, mode, delta):
+        """
+        Atomically adds delta to the count for the given course and mode.
+        """
+        if not cls.objects.filter(course_id=course_id, mode=mode).update(count=F('count') + delta):
+            counter, created = cls.objects.get_or_create(course_id=course_id, mode=mode, defaults={'count': delta})
+            if not created:
+                cls.objects.filter(pk=counter.pk).update(count=F('count') + delta)
+
+    @classmethod
+    def record_change(cls, course_id, previous_state, current_state):
+        """
+        Updates the counts for an enrollment moving from previous_state to
+        current_state, each a (mode, is_active) pair or None if the enrollment
+        did not exist.
+
+        The counts are adjusted in the current transaction, so they commit or
+        roll back together with the enrollment change. Call this as the last
+        change of the transaction, since the counter rows stay locked until it
+        ends.
+        """
+        if previous_state == current_state:
+            return
+        deltas = defaultdict(int)
+        if previous_state and previous_state.is_active:
+            deltas[previous_state.mode] -= 1
+        if current_state and current_state.is_active:
+            deltas[current_state.mode] += 1
+        for mode, delta in deltas.items():
+            if delta:
+                cls.adjust(course_id, mode, delta)
+
+    @classmethod
+    def reconcile(cls, course_id):
+        """
+        Recomputes the counts for a course from the enrollment table and returns them.
+
+        The counter rows are locked before counting, so an enrollment change is
+        either counted here or applied to the counters after the new counts
+        are written, never both.
+        """
+        with transaction.atomic():
+            list(cls.objects.select_for_update().filter(course_id=course_id))
+            counts = dict(
+                CourseEnrollment.objects.filter(course_id=course_id, is_active=True).values_list(
+                    'mode'
+                ).order_by().annotate(Count('id'))
+            )
+            cls.objects.filter(course_id=course_id).exclude(mode__in=counts).delete()
+            for mode, count in counts.items():
+                cls.objects.update_or_create(course_id=course_id, mode=mode, defaults={'count': count})
+        return counts
+
+
+@receiver(models.signals.post_delete, sender=CourseEnrollment)
+def decrement_enrollment_count(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Remove a deleted enrollment from CourseEnrollmentCount.
+    """
+    if not should_use_enrollment_counters():
+        return
+    previous_state = instance._counted_state  # pylint: disable=protected-access
+    # An enrollment loaded without its mode can no longer be read back; leave it to reconciliation.
+    if previous_state is not _UNKNOWN_COUNTED_STATE:
+        CourseEnrollmentCount.record_change(instance.course_id, previous_state, None)
+
+
 @receiver(models.signals.post_save, sender=CourseEnrollment)
 @receiver(models.signals.post_delete, sender=CourseEnrollment)
 def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
@@ -1428,7 +1681,7 @@ def invalidate_enrollment_mode_cache(sender, instance, **kwargs):  # pylint: dis
         instance.user.id,
         str(instance.course_id)
     )
-    cache.delete(cache_key)
+    CourseEnrollment.invalidate_enrollment_summary(instance.user, cache_key)
 
 
 @receiver(models.signals.post_save, sender=CourseEnrollment)
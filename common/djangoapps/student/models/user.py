@@ -1435,6 +1435,19 @@ class EntranceExamConfiguration(models.Model):
                 can_skip = False
         return can_skip
 
+    @classmethod
+    def user_ids_who_can_skip_entrance_exam(cls, users, course_key):
+        """
+        Return the set of ids of the given users who can skip the entrance exam for given course.
+        """
+        if not ENTRANCE_EXAMS.is_enabled():
+            return set()
+        return set(
+            cls.objects.filter(
+                user__in=users, course_id=course_key, skip_entrance_exam=True
+            ).values_list('user_id', flat=True)
+        )
+
 
 class LanguageField(models.CharField):
     """Represents a language from the ISO 639-1 language set."""
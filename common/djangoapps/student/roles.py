@@ -8,7 +8,10 @@ import logging
 from abc import ABCMeta, abstractmethod
 from collections import defaultdict
 
+import crum
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from opaque_keys.edx.django.models import CourseKeyField
 
 from openedx.core.lib.cache_utils import get_cache
@@ -16,6 +19,9 @@ from common.djangoapps.student.models import CourseAccessRole
 
 log = logging.getLogger(__name__)
 
+ROLE_QUERY_COUNT_NAMESPACE = "student.roles.query_count"
+ROLE_QUERY_COUNT_KEY = 'query_count'
+
 # A list of registered access roles.
 REGISTERED_ACCESS_ROLES = {}
 
@@ -47,6 +53,7 @@ class BulkRoleCache:  # lint-amnesty, pylint: disable=missing-class-docstring
 
         for role in CourseAccessRole.objects.filter(user__in=users).select_related('user'):
             roles_by_user[role.user.id].add(role)
+        _record_role_query()
 
         users_without_roles = [u for u in users if u.id not in roles_by_user]
         for user in users_without_roles:
@@ -56,11 +63,20 @@ class BulkRoleCache:  # lint-amnesty, pylint: disable=missing-class-docstring
     def get_user_roles(cls, user):
         return get_cache(cls.CACHE_NAMESPACE)[cls.CACHE_KEY][user.id]
 
+    @classmethod
+    def invalidate(cls, user_id):
+        """
+        Drop the prefetched roles of the user with the given id, if any.
+        """
+        get_cache(cls.CACHE_NAMESPACE).get(cls.CACHE_KEY, {}).pop(user_id, None)
+
 
 class RoleCache:
     """
     A cache of the CourseAccessRoles held by a particular user
     """
+    CACHE_NAMESPACE = "student.roles.RoleCache"
+
     def __init__(self, user):
         try:
             self._roles = BulkRoleCache.get_user_roles(user)
@@ -68,17 +84,78 @@ class RoleCache:
             self._roles = set(
                 CourseAccessRole.objects.filter(user=user).all()
             )
+            _record_role_query()
+        self._role_index = {
+            (access_role.role, access_role.course_id, access_role.org)
+            for access_role in self._roles
+        }
+
+    @classmethod
+    def for_user(cls, user):
+        """
+        Return the RoleCache of the given user, shared by every check made
+        for that user during the current request, whichever user object the
+        check is made with.
+
+        Outside of a request, e.g. in management commands and celery tasks,
+        nothing clears the request cache, so a new RoleCache is returned.
+        """
+        if user.id is None or crum.get_current_request() is None:
+            return cls(user)
+        cache = get_cache(cls.CACHE_NAMESPACE)
+        if user.id not in cache:
+            cache[user.id] = cls(user)
+        return cache[user.id]
+
+    @classmethod
+    def invalidate(cls, user):
+        """
+        Drop the cached roles of the given user, so that they are reloaded on
+        the next role check.  Must be called whenever a role is granted to or
+        revoked from the user.
+        """
+        if hasattr(user, '_roles'):
+            del user._roles  # pylint: disable=protected-access
+        cls.invalidate_user_id(user.id)
+
+    @classmethod
+    def invalidate_user_id(cls, user_id):
+        """
+        Drop the request-cached roles of the user with the given id.
+        """
+        get_cache(cls.CACHE_NAMESPACE).pop(user_id, None)
+        BulkRoleCache.invalidate(user_id)
+
+    @classmethod
+    def query_count(cls):
+        """
+        Return the number of queries issued to load user roles during the
+        current request, including the queries of BulkRoleCache.prefetch.
+        """
+        return get_cache(ROLE_QUERY_COUNT_NAMESPACE).get(ROLE_QUERY_COUNT_KEY, 0)
 
     def has_role(self, role, course_id, org):
         """
         Return whether this RoleCache contains a role with the specified role, course_id, and org
         """
-        return any(
-            access_role.role == role and
-            access_role.course_id == course_id and
-            access_role.org == org
-            for access_role in self._roles
-        )
+        return (role, course_id, org) in self._role_index
+
+
+def _record_role_query():
+    """
+    Count a query issued to load user roles during the current request.
+    """
+    cache = get_cache(ROLE_QUERY_COUNT_NAMESPACE)
+    cache[ROLE_QUERY_COUNT_KEY] = cache.get(ROLE_QUERY_COUNT_KEY, 0) + 1
+
+
+@receiver(post_save, sender=CourseAccessRole)
+@receiver(post_delete, sender=CourseAccessRole)
+def invalidate_role_cache(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the request-cached roles of a user whose roles changed.
+    """
+    RoleCache.invalidate_user_id(instance.user_id)
 
 
 class AccessRole(metaclass=ABCMeta):
@@ -174,7 +251,7 @@ class RoleBase(AccessRole):
         if not hasattr(user, '_roles'):
             # Cache a list of tuples identifying the particular roles that a user has
             # Stored as tuples, rather than django models, to make it cheaper to construct objects for comparison
-            user._roles = RoleCache(user)
+            user._roles = RoleCache.for_user(user)
 
         return user._roles.has_role(self._role_name, self.course_key, self.org)
 
@@ -189,8 +266,7 @@ class RoleBase(AccessRole):
             if user.is_authenticated and user.is_active and not self.has_user(user):
                 entry = CourseAccessRole(user=user, role=self._role_name, course_id=self.course_key, org=self.org)
                 entry.save()
-                if hasattr(user, '_roles'):
-                    del user._roles
+                RoleCache.invalidate(user)
 
     def remove_users(self, *users):
         """
@@ -201,8 +277,7 @@ class RoleBase(AccessRole):
         )
         entries.delete()
         for user in users:
-            if hasattr(user, '_roles'):
-                del user._roles
+            RoleCache.invalidate(user)
 
     def users_with_role(self):
         """
@@ -410,7 +485,7 @@ class UserBasedRole:
 
         # pylint: disable=protected-access
         if not hasattr(self.user, '_roles'):
-            self.user._roles = RoleCache(self.user)
+            self.user._roles = RoleCache.for_user(self.user)
 
         return self.user._roles.has_role(self.role, course_key, course_key.org)
 
@@ -422,8 +497,7 @@ class UserBasedRole:
             for course_key in course_keys:
                 entry = CourseAccessRole(user=self.user, role=self.role, course_id=course_key, org=course_key.org)
                 entry.save()
-            if hasattr(self.user, '_roles'):
-                del self.user._roles
+            RoleCache.invalidate(self.user)
         else:
             raise ValueError("user is not active. Cannot grant access to courses")
 
@@ -433,8 +507,7 @@ class UserBasedRole:
         """
         entries = CourseAccessRole.objects.filter(user=self.user, role=self.role, course_id__in=course_keys)
         entries.delete()
-        if hasattr(self.user, '_roles'):
-            del self.user._roles
+        RoleCache.invalidate(self.user)
 
     def courses_with_role(self):
         """
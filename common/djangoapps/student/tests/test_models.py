@@ -11,6 +11,7 @@ from django.core.cache import cache
 from django.conf import settings
 from django.db.models.functions import Lower
 from django.test import TestCase, override_settings
+from edx_django_utils.cache import RequestCache
 from edx_toggles.toggles.testutils import override_waffle_flag
 from freezegun import freeze_time
 from opaque_keys.edx.keys import CourseKey
@@ -108,6 +109,55 @@ class CourseEnrollmentTests(SharedModuleStoreTestCase):  # lint-amnesty, pylint:
         assert CourseEnrollment.generate_enrollment_status_hash(self.user) == expected
         self.assert_enrollment_status_hash_cached(self.user, expected)
 
+    def test_enrollment_summary_for_user(self):
+        """ Verify the summary is cached, serves enrollment state, and is rebuilt after changes. """
+        enrollment = CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        other_course_id = CourseKey.from_string('course-v1:edX+Other+Run')
+
+        summary = CourseEnrollment.enrollment_summary_for_user(self.user)
+        assert [(entry.course_id, entry.mode, entry.is_active) for entry in summary] == [
+            (self.course.id, 'verified', True),
+        ]
+
+        # Once cached, the summary and per-course enrollment state need no queries.
+        with self.assertNumQueries(0):
+            assert CourseEnrollment.enrollment_summary_for_user(self.user) == summary
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id) == ('verified', True)
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, other_course_id) == (None, None)
+
+        # Modifying the enrollment deletes the cached summary.
+        enrollment.update_enrollment(is_active=False)
+        assert cache.get(CourseEnrollment.enrollment_summary_cache_key(self.user)) is None
+        summary = CourseEnrollment.enrollment_summary_for_user(self.user)
+        assert [(entry.course_id, entry.is_active) for entry in summary] == [(self.course.id, False)]
+
+    def test_enrollment_state_from_summary_request_cached(self):
+        """ Verify enrollment state read from the cached summary is kept in the request cache. """
+        CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        CourseEnrollment.enrollment_summary_for_user(self.user)
+        RequestCache.clear_all_namespaces()
+
+        with mock.patch.object(
+            CourseEnrollment, '_get_enrollment_state_from_summary',
+            wraps=CourseEnrollment._get_enrollment_state_from_summary,  # pylint: disable=protected-access
+        ) as mock_get_from_summary:
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id) == ('verified', True)
+            assert CourseEnrollment.is_enrolled(self.user, self.course.id)
+            assert CourseEnrollment.enrollment_mode_for_user(self.user, self.course.id) == ('verified', True)
+        assert mock_get_from_summary.call_count == 1
+
+    def test_enrollment_summary_invalidated_on_commit(self):
+        """ Verify a summary cached before an enrollment change commits is deleted once it commits. """
+        enrollment = CourseEnrollmentFactory.create(user=self.user, course_id=self.course.id, mode='verified')
+        cache_key = CourseEnrollment.enrollment_summary_cache_key(self.user)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            enrollment.update_enrollment(is_active=False)
+            # A concurrent reader caches the summary it still sees.
+            cache.set(cache_key, {}, 60)
+
+        assert cache.get(cache_key) is None
+
     def test_save_deletes_cached_enrollment_status_hash(self):
         """ Verify the method deletes the cached enrollment status hash for the user. """
         # There should be no cached value for a new user with no enrollments.
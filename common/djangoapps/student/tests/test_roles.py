@@ -5,10 +5,14 @@ Tests of student.roles
 
 import ddt
 import six
+from crum import set_current_request
+from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from opaque_keys.edx.keys import CourseKey
 
 from common.djangoapps.student.roles import (
+    BulkRoleCache,
     CourseBetaTesterRole,
     CourseInstructorRole,
     CourseRole,
@@ -20,6 +24,7 @@ from common.djangoapps.student.roles import (
     RoleCache
 )
 from common.djangoapps.student.tests.factories import AnonymousUserFactory, InstructorFactory, StaffFactory, UserFactory
+from openedx.core.djangolib.testing.utils import get_mock_request
 
 
 class RolesTestCase(TestCase):
@@ -190,3 +195,48 @@ class RoleCacheTestCase(TestCase):  # lint-amnesty, pylint: disable=missing-clas
     def test_empty_cache(self, role, target):  # lint-amnesty, pylint: disable=unused-argument
         cache = RoleCache(self.user)
         assert not cache.has_role(*target)
+
+    def start_request(self):
+        """
+        Make the rest of the test run as if it were handling a request.
+        """
+        RequestCache.clear_all_namespaces()
+        set_current_request(get_mock_request(self.user))
+        self.addCleanup(set_current_request, None)
+        self.addCleanup(RequestCache.clear_all_namespaces)
+
+    def test_role_cache_shared_across_user_objects(self):
+        self.start_request()
+        role = CourseStaffRole(self.IN_KEY)
+        role.add_users(self.user)
+        assert role.has_user(self.user)
+
+        other_user_object = User.objects.get(id=self.user.id)
+        with self.assertNumQueries(0):
+            assert role.has_user(other_user_object)
+
+    def test_role_cache_not_shared_outside_request(self):
+        role = CourseStaffRole(self.IN_KEY)
+        assert not role.has_user(self.user)
+
+        role.add_users(User.objects.get(id=self.user.id))
+        assert role.has_user(User.objects.get(id=self.user.id))
+
+    def test_role_query_count(self):
+        self.start_request()
+        other_user = UserFactory()
+        BulkRoleCache.prefetch([self.user])
+        RoleCache.for_user(self.user)
+        RoleCache.for_user(other_user)
+        assert RoleCache.query_count() == 2
+
+    def test_role_cache_invalidated_on_grant_and_revoke(self):
+        self.start_request()
+        role = CourseStaffRole(self.IN_KEY)
+        assert not RoleCache.for_user(self.user).has_role('staff', self.IN_KEY, 'edX')
+
+        role.add_users(self.user)
+        assert RoleCache.for_user(self.user).has_role('staff', self.IN_KEY, 'edX')
+
+        role.remove_users(self.user)
+        assert not RoleCache.for_user(self.user).has_role('staff', self.IN_KEY, 'edX')
@@ -1,7 +1,7 @@
 """
 Toggles for Dashboard page.
 """
-from edx_toggles.toggles import WaffleFlag
+from edx_toggles.toggles import WaffleFlag, WaffleSwitch
 
 # Namespace for student waffle flags.
 WAFFLE_FLAG_NAMESPACE = 'student'
@@ -75,3 +75,22 @@ ENROLLMENT_CONFIRMATION_EMAIL = WaffleFlag(
 
 def should_send_enrollment_email():
     return ENROLLMENT_CONFIRMATION_EMAIL.is_enabled()
+
+
+# Waffle switch to read enrollment counts from precomputed counters.
+# .. toggle_name: student.use_enrollment_counters
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: When enabled, course enrollment counts and course capacity checks are read from the
+#   CourseEnrollmentCount table instead of counting rows in student_courseenrollment. The counters are only
+#   maintained while this is enabled; run the reconcile_enrollment_counts management command to backfill them right
+#   after enabling this.
+# .. toggle_use_cases: opt_in
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: None
+# .. toggle_warning: Counts are wrong for courses that have not been reconciled since the switch was last enabled.
+USE_ENROLLMENT_COUNTERS = WaffleSwitch(f'{WAFFLE_FLAG_NAMESPACE}.use_enrollment_counters', __name__)
+
+
+def should_use_enrollment_counters():
+    return USE_ENROLLMENT_COUNTERS.is_enabled()
@@ -64,6 +64,7 @@ from common.djangoapps.student.models import (
     PendingSecondaryEmailChange,
     UserProfile
 )
+from common.djangoapps.student.roles import RoleCache
 from common.djangoapps.util.milestones_helpers import get_pre_requisite_courses_not_completed
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
 
@@ -471,7 +472,9 @@ def show_load_all_courses_link(user, course_limit, course_enrollments):
     if course_limit is None:
         return False
 
-    total_enrollments = CourseEnrollment.enrollments_for_user(user).count()
+    total_enrollments = sum(
+        1 for summary in CourseEnrollment.enrollment_summary_for_user(user) if summary.is_active
+    )
     return len(course_enrollments) < total_enrollments
 
 
@@ -903,6 +906,9 @@ def student_dashboard(request):  # lint-amnesty, pylint: disable=too-many-statem
     else:
         response = render_to_response(dashboard_template, context)
 
+    # Record how many queries were needed to load the user's course roles.
+    monitoring_utils.set_custom_attribute('course_access_role_queries', RoleCache.query_count())
+
     if show_account_activation_popup:
         response.delete_cookie(
             settings.SHOW_ACTIVATE_CTA_POPUP_COOKIE_NAME,
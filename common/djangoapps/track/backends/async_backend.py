@@ -0,0 +1,191 @@
+"""
+Event tracker backend that sends events to another backend asynchronously.
+
+Events are put on a bounded in-process queue, and a background thread sends
+them to the wrapped backend in batches, so that slow event sinks don't add
+latency to the requests that emit events. For example::
+
+  TRACKING_BACKENDS = {
+      'logger': {
+          'ENGINE': 'common.djangoapps.track.backends.async_backend.AsyncBackend',
+          'OPTIONS': {
+              'backend': {
+                  'ENGINE': 'common.djangoapps.track.backends.logger.LoggerBackend',
+                  'OPTIONS': {'name': 'tracking'},
+              },
+              'max_queue_size': 10000,
+              'batch_size': 100,
+              'overflow_policy': 'drop',
+          }
+      }
+  }
+
+The wrapped backend is configured like any other track backend. Backends that
+have a ``send_batch(events)`` method are sent whole batches at once.
+
+Events are copied when they are queued, so callers can keep modifying theirs.
+"""
+
+
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
+import time
+
+from edx_django_utils.monitoring import set_custom_attribute
+
+from common.djangoapps.track.backends import BaseBackend
+from common.djangoapps.track.tracker import _instantiate_backend_from_name
+
+log = logging.getLogger(__name__)
+
+# Drop new events while the queue is full.
+OVERFLOW_DROP = 'drop'
+# Block the sending thread for up to block_timeout seconds while the queue
+# is full, and only then drop the event.
+OVERFLOW_BLOCK = 'block'
+
+# Seconds to wait at interpreter exit for queued events to be sent.
+EXIT_FLUSH_TIMEOUT = 5
+
+
+class AsyncBackend(BaseBackend):
+    """
+    Event tracker backend that sends events to a wrapped backend from a
+    background thread.
+    """
+
+    def __init__(
+        self,
+        backend,
+        max_queue_size=10000,
+        batch_size=100,
+        overflow_policy=OVERFLOW_DROP,
+        block_timeout=0.5,
+        **kwargs
+    ):
+        """
+        :Parameters:
+          - `backend`: configuration of the wrapped backend, as a dict with
+            an `ENGINE` and optional `OPTIONS`.
+          - `max_queue_size`: the maximum number of events waiting to be sent.
+          - `batch_size`: the maximum number of events sent at once.
+          - `overflow_policy`: what to do with events while the queue is
+            full, either 'drop' or 'block'.
+          - `block_timeout`: with the 'block' policy, the maximum number of
+            seconds to wait for room in the queue before dropping the event.
+        """
+        super().__init__(**kwargs)
+
+        if overflow_policy not in (OVERFLOW_DROP, OVERFLOW_BLOCK):
+            raise ValueError(f'Invalid overflow policy {overflow_policy}')
+
+        self.backend = _instantiate_backend_from_name(backend['ENGINE'], backend.get('OPTIONS', {}))
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.overflow_policy = overflow_policy
+        self.block_timeout = block_timeout
+
+        self.lag = 0.0
+        self.dropped_count = 0
+
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+        atexit.register(self.flush, EXIT_FLUSH_TIMEOUT)
+
+    def send(self, event):
+        """
+        Queue the event to be sent by the background thread.
+        """
+        self._ensure_flush_thread()
+
+        item = (time.monotonic(), copy.deepcopy(event))
+        try:
+            if self.overflow_policy == OVERFLOW_BLOCK:
+                self._queue.put(item, timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(item)
+        except queue.Full:
+            with self._lock:
+                self.dropped_count += 1
+            set_custom_attribute('track_async_event_dropped', True)
+
+        set_custom_attribute('track_async_queue_depth', self._queue.qsize())
+        set_custom_attribute('track_async_lag_seconds', self.lag)
+
+    def flush(self, timeout=None):
+        """
+        Wait until all queued events have been sent, or for at most timeout
+        seconds. Returns whether all queued events were sent.
+        """
+        event_queue = self._queue
+        if event_queue is None:
+            return True
+        with event_queue.all_tasks_done:
+            return event_queue.all_tasks_done.wait_for(lambda: not event_queue.unfinished_tasks, timeout)
+
+    def _ensure_flush_thread(self):
+        """
+        Start the background thread, unless it is running in this process.
+
+        Threads don't survive a fork, so a forked worker process starts its
+        own thread and queue on its first event.
+        """
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=self.max_queue_size)
+            self._thread = threading.Thread(
+                target=self._run, args=(self._queue,), name='track-async-backend', daemon=True
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+
+    def _run(self, event_queue):
+        """
+        Send batches of queued events to the wrapped backend, forever.
+        """
+        while True:
+            batch = [event_queue.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(event_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            self.lag = time.monotonic() - batch[0][0]
+            self._send_batch([event for _, event in batch])
+            for _ in batch:
+                event_queue.task_done()
+
+            with self._lock:
+                dropped_count, self.dropped_count = self.dropped_count, 0
+            if dropped_count:
+                log.warning('Dropped %d tracking events because the queue was full', dropped_count)
+
+    def _send_batch(self, events):
+        """
+        Send the events to the wrapped backend, at once if it supports it.
+        """
+        send_batch = getattr(self.backend, 'send_batch', None)
+        if send_batch is not None:
+            try:
+                send_batch(events)
+            except Exception:  # pylint: disable=broad-except
+                log.exception('Error sending a batch of %d tracking events', len(events))
+            return
+
+        for event in events:
+            try:
+                self.backend.send(event)
+            except Exception:  # pylint: disable=broad-except
+                log.exception('Error sending a tracking event')
+
@@ -0,0 +1,110 @@
+"""Tests for the asynchronous event tracker backend."""
+
+
+import threading
+from unittest.mock import ANY, patch
+
+import ddt
+import pytest
+from django.test import TestCase
+
+from common.djangoapps.track.backends import BaseBackend
+from common.djangoapps.track.backends.async_backend import OVERFLOW_BLOCK, OVERFLOW_DROP, AsyncBackend
+
+
+class MemoryBackend(BaseBackend):
+    """Backend that keeps the events it was sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.events = []
+        self.unblocked = threading.Event()
+        self.unblocked.set()
+
+    def send(self, event):
+        self.unblocked.wait()
+        self.events.append(event)
+
+
+class BatchMemoryBackend(MemoryBackend):
+    """Backend that keeps the batches of events it was sent."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.batches = []
+
+    def send_batch(self, events):
+        self.unblocked.wait()
+        self.batches.append(events)
+
+
+@ddt.ddt
+class TestAsyncBackend(TestCase):  # lint-amnesty, pylint: disable=missing-class-docstring
+    def setUp(self):
+        super().setUp()
+        patcher = patch('common.djangoapps.track.backends.async_backend.set_custom_attribute')
+        self.mock_set_custom_attribute = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _async_backend(self, engine='MemoryBackend', **options):
+        return AsyncBackend(
+            backend={'ENGINE': f'common.djangoapps.track.backends.tests.test_async_backend.{engine}'},
+            **options
+        )
+
+    def test_events_sent_in_order(self):
+        backend = self._async_backend()
+        events = [{'test': index} for index in range(5)]
+        for event in events:
+            backend.send(event)
+
+        assert backend.flush(timeout=5)
+        assert backend.backend.events == events
+        self.mock_set_custom_attribute.assert_any_call('track_async_queue_depth', ANY)
+        self.mock_set_custom_attribute.assert_any_call('track_async_lag_seconds', ANY)
+
+    def test_events_sent_in_batches(self):
+        backend = self._async_backend('BatchMemoryBackend', batch_size=3)
+        # hold the first batch, so that the others queue up
+        backend.backend.unblocked.clear()
+        events = [{'test': index} for index in range(7)]
+        for event in events:
+            backend.send(event)
+        backend.backend.unblocked.set()
+
+        assert backend.flush(timeout=5)
+        assert [event for batch in backend.backend.batches for event in batch] == events
+        assert all(len(batch) <= 3 for batch in backend.backend.batches)
+        assert len(backend.backend.batches) < len(events)
+
+    def test_events_copied_when_queued(self):
+        backend = self._async_backend()
+        backend.backend.unblocked.clear()
+        event = {'test': 1, 'context': {'path': '/before'}}
+        backend.send(event)
+        event['context']['path'] = '/after'
+        backend.backend.unblocked.set()
+
+        assert backend.flush(timeout=5)
+        assert backend.backend.events == [{'test': 1, 'context': {'path': '/before'}}]
+
+    @ddt.data(OVERFLOW_DROP, OVERFLOW_BLOCK)
+    def test_full_queue_drops_events(self, overflow_policy):
+        backend = self._async_backend(max_queue_size=2, overflow_policy=overflow_policy, block_timeout=0.01)
+        backend.backend.unblocked.clear()
+        for index in range(10):
+            backend.send({'test': index})
+
+        dropped_count = backend.dropped_count
+        assert dropped_count > 0
+        self.mock_set_custom_attribute.assert_any_call('track_async_event_dropped', True)
+
+        backend.backend.unblocked.set()
+        assert backend.flush(timeout=5)
+        assert len(backend.backend.events) == 10 - dropped_count
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            self._async_backend(overflow_policy='unknown')
+        with pytest.raises(ValueError):
+            self._async_backend('Unknown')
@@ -36,3 +36,13 @@ class TestMongoBackend(TestCase):  # lint-amnesty, pylint: disable=missing-class
 
         assert events[0] == first_argument(calls[0])
         assert events[1] == first_argument(calls[1])
+
+    def test_mongo_backend_batch(self):
+        events = [{'test': 1}, {'test': 2}]
+
+        self.backend.send_batch(events)
+
+        self.backend.collection.insert_many.assert_called_once_with(events, ordered=False)
+        # the events themselves are not handed to pymongo, which would add an _id
+        inserted_events = self.backend.collection.insert_many.call_args[0][0]
+        assert all(inserted is not event for inserted, event in zip(inserted_events, events))
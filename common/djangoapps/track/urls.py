@@ -8,5 +8,6 @@ from .views import segmentio
 
 urlpatterns = [
     path('event', views.user_track),
+    path('event/batch', views.user_track_batch),
     path('segmentio/event', segmentio.segmentio_event),
 ]
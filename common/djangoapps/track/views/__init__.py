@@ -1,16 +1,30 @@
 # lint-amnesty, pylint: disable=missing-module-docstring
 
 import json
-import six
+from datetime import datetime, timedelta
 
+import six
+from dateutil import parser
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
-from django.http import HttpResponse
+from django.http import HttpResponse, HttpResponseBadRequest
+from django.views.decorators.http import require_POST
 from eventtracking import tracker as eventtracker
 from ipware.ip import get_client_ip
+from pytz import UTC
 
 from common.djangoapps.track import contexts, shim, tracker
 from lms.djangoapps.utils import OptimizelyClient
 
+# The maximum number of events accepted by one call to user_track_batch.
+MAX_BATCH_EVENTS = 100
+
+# The keys of an event sent to user_track_batch whose values, when given, must be strings.
+BATCH_EVENT_STRING_KEYS = ('event_type', 'page', 'courserun_key', 'time')
+
+# How long before user_track_batch receives an event the browser may say it happened. Browsers send batches
+# every few seconds, or when the page is hidden; this leaves room for slow networks and skewed clocks.
+MAX_BATCH_EVENT_AGE = timedelta(minutes=5)
+
 
 def _get_request_header(request, header_name, default=''):
     """Helper method to get header values from a request's META dict, if present."""
@@ -50,54 +64,77 @@ def _get_course_context(page):
     return course_context
 
 
-def _add_user_id_for_username(data):
+def _add_user_id_for_username(data, user_ids=None):
     """
     If data contains a username, adds the corresponding user_id to the data.
 
     In certain use cases, the caller may have the username and not the
     user_id. This enables us to standardize on user_id in event data,
     even when the caller only has access to the username.
-    """
-    if data and ('username' in data) and ('user_id' not in data):
-        try:
-            user = User.objects.get(username=data.get('username'))
-            data['user_id'] = user.id
-        except User.DoesNotExist:
-            pass
-
-
-def user_track(request):
-    """
-    Log when POST call to "event" URL is made by a user.
 
-    GET or POST call should provide "event_type", "event", and "page" arguments. It may optionally provide
-    a "courserun_key" argument (otherwise may be extracted from the page).
+    user_ids is an optional dict of already looked up user ids by username,
+    which is updated with the lookup.
     """
+    if data and ('username' in data) and ('user_id' not in data):
+        username = data.get('username')
+        if user_ids is not None and username in user_ids:
+            user_id = user_ids[username]
+        else:
+            user_id = User.objects.filter(username=username).values_list('id', flat=True).first()
+            if user_ids is not None:
+                user_ids[username] = user_id
+        if user_id is not None:
+            data['user_id'] = user_id
+
+
+def _get_username(request):
+    """Return the username of the request's user, or "anonymous"."""
     try:
-        username = request.user.username
+        return request.user.username
     except:  # lint-amnesty, pylint: disable=bare-except
-        username = "anonymous"
+        return "anonymous"
 
-    name = _get_request_value(request, 'event_type')
-    data = _get_request_value(request, 'event', {})
-    course_id_string = _get_request_value(request, 'courserun_key', None)
-    page = _get_request_value(request, 'page')
 
+def _get_browser_event_data(data, user_ids=None):
+    """Return the event data sent by the browser, parsed from JSON if possible."""
     if isinstance(data, str) and len(data) > 0:
         try:
             data = json.loads(data)
-            _add_user_id_for_username(data)
+            _add_user_id_for_username(data, user_ids)
         except ValueError:
             pass
+    return data
 
+
+def _get_browser_context(page, course_id_string, username):
+    """Return the context override of an event sent by the browser."""
     context_override = contexts.course_context_from_url(page, course_id_string)
     context_override['username'] = username
     context_override['event_source'] = 'browser'
     context_override['page'] = page
+    return context_override
+
+
+def _parse_client_time(client_time, received_at):
+    """
+    Return the time at which the browser says an event happened, as an aware
+    datetime no later than received_at, and no earlier than
+    MAX_BATCH_EVENT_AGE before it.
+
+    Raises ValueError if client_time is not an ISO 8601 timestamp.
+    """
+    try:
+        timestamp = parser.isoparse(client_time)
+    except OverflowError as exc:
+        raise ValueError(client_time) from exc
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=UTC)
+    # Don't let a wrong browser clock, or a tampered request, date events in the future or far in the past.
+    return min(max(timestamp, received_at - MAX_BATCH_EVENT_AGE), received_at)
 
-    with eventtracker.get_tracker().context('edx.course.browser', context_override):
-        eventtracker.emit(name=name, data=data)
 
+def _track_course_started(request, name, data):
+    """Report the start of a course to Optimizely."""
     # TODO: VAN-1052: This event is added to track the KPIs for A/B experiment.
     #  Remove it after the experiment has been paused.
     if (
@@ -109,6 +146,90 @@ def user_track(request):
         if optimizely_client:
             optimizely_client.track('course_started', str(request.user.id))
 
+
+def user_track(request):
+    """
+    Log when POST call to "event" URL is made by a user.
+
+    GET or POST call should provide "event_type", "event", and "page" arguments. It may optionally provide
+    a "courserun_key" argument (otherwise may be extracted from the page).
+    """
+    username = _get_username(request)
+
+    name = _get_request_value(request, 'event_type')
+    data = _get_browser_event_data(_get_request_value(request, 'event', {}))
+    course_id_string = _get_request_value(request, 'courserun_key', None)
+    page = _get_request_value(request, 'page')
+
+    context_override = _get_browser_context(page, course_id_string, username)
+
+    with eventtracker.get_tracker().context('edx.course.browser', context_override):
+        eventtracker.emit(name=name, data=data)
+
+    _track_course_started(request, name, data)
+
+    return HttpResponse('success')
+
+
+@require_POST
+def user_track_batch(request):
+    """
+    Log a batch of events, when POST call to "event/batch" URL is made by a user.
+
+    POST call should provide an "events" argument, with a JSON list of up to MAX_BATCH_EVENTS objects. Like the
+    arguments of user_track, each object should have "event_type", "event", and "page" keys, and may optionally
+    have a "courserun_key" key. It may also have a "time" key, with the ISO 8601 time at which the browser emitted
+    the event, which is then used as the time of the event.
+
+    Browsers send the last batch of a page as a beacon, which can't set headers, so the CSRF token is then
+    posted in the "csrfmiddlewaretoken" argument.
+    """
+    received_at = datetime.now(UTC)
+    try:
+        events = json.loads(request.POST.get('events', ''))
+    except ValueError:
+        return HttpResponseBadRequest('"events" must be a JSON list')
+    if not isinstance(events, list) or not all(isinstance(event, dict) for event in events):
+        return HttpResponseBadRequest('"events" must be a JSON list of objects')
+    if len(events) > MAX_BATCH_EVENTS:
+        return HttpResponseBadRequest(f'At most {MAX_BATCH_EVENTS} events can be sent at once')
+    for event in events:
+        for key in BATCH_EVENT_STRING_KEYS:
+            if event.get(key) is not None and not isinstance(event[key], str):
+                return HttpResponseBadRequest(f'"{key}" must be a string')
+    try:
+        client_times = [
+            _parse_client_time(event['time'], received_at) if event.get('time') else None
+            for event in events
+        ]
+    except ValueError:
+        return HttpResponseBadRequest('"time" must be an ISO 8601 timestamp')
+
+    # Look up the request's user, and the context of each page, once for the whole batch.
+    username = _get_username(request)
+    context_overrides = {}
+    user_ids = {}
+
+    event_tracker = eventtracker.get_tracker()
+    for event, client_time in zip(events, client_times):
+        name = event.get('event_type', '')
+        data = _get_browser_event_data(event.get('event', {}), user_ids)
+        course_id_string = event.get('courserun_key')
+        page = event.get('page', '')
+
+        context_key = (page, course_id_string)
+        if context_key not in context_overrides:
+            context_overrides[context_key] = _get_browser_context(page, course_id_string, username)
+        context_override = context_overrides[context_key]
+        if client_time is not None:
+            # Like segment.io events, the timestamp in the context becomes the time of the event.
+            context_override = dict(context_override, timestamp=client_time)
+
+        with event_tracker.context('edx.course.browser', context_override):
+            eventtracker.emit(name=name, data=data)
+
+        _track_course_started(request, name, data)
+
     return HttpResponse('success')
 
 
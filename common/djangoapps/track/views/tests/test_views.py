@@ -2,6 +2,9 @@
 
 from unittest.mock import patch, sentinel
 
+import json
+from datetime import timedelta
+
 import ddt
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.test.client import RequestFactory
@@ -167,6 +170,111 @@ class TestTrackViews(EventTrackingTestCase):  # lint-amnesty, pylint: disable=mi
         }
         assert_event_matches(expected_event, actual_event)
 
+    def test_user_track_batch(self):
+        request = self.request_factory.post('/event/batch', {
+            'events': json.dumps([
+                {
+                    'page': self.url_with_course,
+                    'event_type': 'first_event',
+                    'event': f'{{"username": "{TEST_USERNAME}"}}',
+                    'courserun_key': 'explicit/course/id',
+                },
+                {
+                    'page': self.url_with_course,
+                    'event_type': 'second_event',
+                    'event': '',
+                },
+                {},
+            ])
+        })
+
+        response = views.user_track_batch(request)
+
+        assert response.status_code == 200
+        assert len(self.backend.events) == 3
+        assert_event_matches({
+            'context': {
+                'course_id': 'explicit/course/id',
+                'org_id': 'explicit',
+                'event_source': 'browser',
+                'page': self.url_with_course,
+                'username': 'anonymous'
+            },
+            'data': {"username": TEST_USERNAME, "user_id": TEST_USER_ID},
+            'timestamp': FROZEN_TIME,
+            'name': 'first_event'
+        }, self.get_event(0))
+        assert_event_matches({
+            'context': {
+                'course_id': 'foo/bar/baz',
+                'org_id': 'foo',
+                'event_source': 'browser',
+                'page': self.url_with_course,
+                'username': 'anonymous'
+            },
+            'data': {},
+            'timestamp': FROZEN_TIME,
+            'name': 'second_event'
+        }, self.get_event(1))
+        assert_event_matches({
+            'context': {
+                'course_id': '',
+                'org_id': '',
+                'event_source': 'browser',
+                'page': '',
+                'username': 'anonymous'
+            },
+            'data': {},
+            'timestamp': FROZEN_TIME,
+            'name': 'unknown'
+        }, self.get_event(2))
+
+    def test_user_track_batch_client_time(self):
+        earlier = FROZEN_TIME - timedelta(seconds=5)
+        request = self.request_factory.post('/event/batch', {
+            'events': json.dumps([
+                {'event_type': 'earlier_event', 'time': earlier.isoformat()},
+                {'event_type': 'future_event', 'time': (FROZEN_TIME + timedelta(days=1)).isoformat()},
+                {'event_type': 'untimed_event'},
+                {'event_type': 'backdated_event', 'time': (FROZEN_TIME - timedelta(days=365)).isoformat()},
+            ])
+        })
+
+        response = views.user_track_batch(request)
+
+        assert response.status_code == 200
+        assert self.get_event(0)['context']['timestamp'] == earlier
+        assert self.get_event(1)['context']['timestamp'] == FROZEN_TIME
+        assert 'timestamp' not in self.get_event(2)['context']
+        assert self.get_event(3)['context']['timestamp'] == FROZEN_TIME - views.MAX_BATCH_EVENT_AGE
+
+    @ddt.data(
+        '',
+        'not json',
+        '{"event_type": "not_a_list"}',
+        '["not_an_object"]',
+        json.dumps([{}] * (views.MAX_BATCH_EVENTS + 1)),
+        json.dumps([{'event_type': 1}]),
+        json.dumps([{'page': ['not', 'a', 'string']}]),
+        json.dumps([{'courserun_key': {'org': 'edX'}}]),
+        json.dumps([{'time': 'not a time'}]),
+    )
+    def test_user_track_batch_invalid(self, events):
+        request = self.request_factory.post('/event/batch', {'events': events})
+
+        response = views.user_track_batch(request)
+
+        assert response.status_code == 400
+        self.assert_no_events_emitted()
+
+    def test_user_track_batch_requires_post(self):
+        request = self.request_factory.get('/event/batch')
+
+        response = views.user_track_batch(request)
+
+        assert response.status_code == 405
+        self.assert_no_events_emitted()
+
     @override_settings(
         EVENT_TRACKING_PROCESSORS=[{'ENGINE': 'common.djangoapps.track.shim.LegacyFieldMappingProcessor'}],
     )
@@ -42,6 +42,98 @@
             });
         });
 
+        describe('logBatched', function() {
+            beforeEach(function() {
+                jasmine.clock().install();
+                jasmine.clock().mockDate(new Date(Date.UTC(2020, 0, 1)));
+                spyOn(jQuery, 'ajaxWithPrefix');
+            });
+
+            afterEach(function() {
+                Logger.flushBatched();
+                jasmine.clock().uninstall();
+            });
+
+            it('sends the events in one request after a delay', function() {
+                Logger.logBatched('first', 'data');
+                Logger.logBatched('second', {value: 1});
+                expect(jQuery.ajaxWithPrefix).not.toHaveBeenCalled();
+
+                jasmine.clock().tick(5000);
+                expect(jQuery.ajaxWithPrefix.calls.count()).toEqual(1);
+                expect(jQuery.ajaxWithPrefix).toHaveBeenCalledWith({
+                    url: '/event/batch',
+                    type: 'POST',
+                    data: {
+                        events: JSON.stringify([
+                            {
+                                event_type: 'first',
+                                event: '"data"',
+                                courserun_key: 'edX/999/test',
+                                page: window.location.href,
+                                time: '2020-01-01T00:00:00.000Z'
+                            },
+                            {
+                                event_type: 'second',
+                                event: '{"value":1}',
+                                courserun_key: 'edX/999/test',
+                                page: window.location.href,
+                                time: '2020-01-01T00:00:00.000Z'
+                            }
+                        ])
+                    },
+                    async: true
+                });
+            });
+
+            it('sends a full batch without waiting', function() {
+                _.each(_.range(20), function(index) {
+                    Logger.logBatched('example', index);
+                });
+                expect(jQuery.ajaxWithPrefix.calls.count()).toEqual(1);
+
+                jasmine.clock().tick(5000);
+                expect(jQuery.ajaxWithPrefix.calls.count()).toEqual(1);
+            });
+
+            it('sends the waiting events as a beacon when the page is hidden', function() {
+                var body;
+                spyOn(navigator, 'sendBeacon').and.returnValue(true);
+                Logger.logBatched('example', 'data');
+                $(window).trigger('pagehide');
+
+                expect(jQuery.ajaxWithPrefix).not.toHaveBeenCalled();
+                expect(navigator.sendBeacon).toHaveBeenCalledWith('/event/batch', jasmine.any(URLSearchParams));
+                body = navigator.sendBeacon.calls.argsFor(0)[1];
+                expect(JSON.parse(body.get('events'))).toEqual([{
+                    event_type: 'example',
+                    event: '"data"',
+                    courserun_key: 'edX/999/test',
+                    page: window.location.href,
+                    time: '2020-01-01T00:00:00.000Z'
+                }]);
+                expect(body.has('csrfmiddlewaretoken')).toBe(true);
+            });
+
+            it('sends the waiting events as a request if the beacon is refused', function() {
+                spyOn(navigator, 'sendBeacon').and.returnValue(false);
+                Logger.logBatched('example', 'data');
+                $(window).trigger('pagehide');
+
+                expect(jQuery.ajaxWithPrefix).toHaveBeenCalledWith(jasmine.objectContaining({
+                    url: '/event/batch',
+                    async: true
+                }));
+            });
+
+            it('calls the listeners', function() {
+                var callback = jasmine.createSpy();
+                Logger.listen('batched_example', null, callback);
+                Logger.logBatched('batched_example', 'data');
+                expect(callback).toHaveBeenCalledWith('batched_example', 'data', null);
+            });
+        });
+
         describe('ajax request settings with path_prefix', function() {
             var $meta_tag;
 
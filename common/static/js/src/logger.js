@@ -4,7 +4,15 @@
     var Logger = (function() {
         // listeners[event_type][element] -> list of callbacks
         var listeners = {},
-            sendRequest, has;
+            // events waiting to be sent by flushBatched
+            batchedEvents = [],
+            batchTimeout = null,
+            batchFlushBound = false,
+            // milliseconds to wait for more events before sending a batch
+            BATCH_DELAY = 5000,
+            // the maximum number of events in a batch; the server accepts up to 100
+            MAX_BATCH_SIZE = 20,
+            sendRequest, sendBeacon, has, notifyListeners, getEventData, takeBatchedEvents, bindBatchFlush;
 
         sendRequest = function(data, options) {
             var request = $.ajaxWithPrefix ? $.ajaxWithPrefix : $.ajax;
@@ -18,10 +26,92 @@
             return request(options);
         };
 
+        /**
+         * Sends the data with navigator.sendBeacon, which browsers deliver even once the
+         * page is gone. Returns whether the beacon was queued.
+         */
+        sendBeacon = function(url, data) {
+            var body;
+
+            if (!navigator.sendBeacon || typeof URLSearchParams === 'undefined') {
+                return false;
+            }
+            body = new URLSearchParams(data);
+            // Beacons can't set the X-CSRFToken header, so the token goes in the body.
+            body.append('csrfmiddlewaretoken', ($.cookie && $.cookie('csrftoken')) || '');
+            return navigator.sendBeacon(($("meta[name='path_prefix']").attr('content') || '') + url, body);
+        };
+
         has = function(object, propertyName) {
             return {}.hasOwnProperty.call(object, propertyName);
         };
 
+        notifyListeners = function(eventType, data, element) {
+            var callbacks;
+
+            // Check to see if we're listening for the event type.
+            if (has(listeners, eventType)) {
+                if (has(listeners[eventType], element)) {
+                    // Make the callbacks.
+                    callbacks = listeners[eventType][element];
+                    $.each(callbacks, function(index, callback) {
+                        try {
+                            callback(eventType, data, element);
+                        } catch (err) {
+                            console.error({
+                                eventType: eventType,
+                                data: data,
+                                element: element,
+                                error: err
+                            });
+                        }
+                    });
+                }
+            }
+        };
+
+        getEventData = function(eventType, data) {
+            return {
+                event_type: eventType,
+                event: JSON.stringify(data),
+                courserun_key: typeof $$course_id !== 'undefined' ? $$course_id : null,
+                page: window.location.href
+            };
+        };
+
+        takeBatchedEvents = function() {
+            var events = batchedEvents;
+
+            clearTimeout(batchTimeout);
+            batchTimeout = null;
+            batchedEvents = [];
+            return events;
+        };
+
+        bindBatchFlush = function() {
+            var flushWithBeacon = function() {
+                var events = takeBatchedEvents(),
+                    data = {events: JSON.stringify(events)};
+
+                if (events.length > 0 && !sendBeacon('/event/batch', data)) {
+                    sendRequest(data, {url: '/event/batch'});
+                }
+            };
+
+            if (batchFlushBound) {
+                return;
+            }
+            batchFlushBound = true;
+            // Send the waiting events before the page goes away. Browsers block synchronous
+            // requests while the page is hidden or unloaded, so send them as a beacon.
+            $(document).on('visibilitychange', function() {
+                if (document.visibilityState === 'hidden') {
+                    flushWithBeacon();
+                }
+            });
+            $(window).on('pagehide', flushWithBeacon);
+        };
+
         return {
             /**
              * Emits an event.
@@ -30,39 +120,51 @@
              * proper deprecation and notification for external authors.
              */
             log: function(eventType, data, element, requestOptions) {
-                var callbacks;
-
                 if (!element) {
                     // null element in the listener dictionary means any element will do.
                     // null element in the Logger.log call means we don't know the element name.
                     element = null;
                 }
-                // Check to see if we're listening for the event type.
-                if (has(listeners, eventType)) {
-                    if (has(listeners[eventType], element)) {
-                        // Make the callbacks.
-                        callbacks = listeners[eventType][element];
-                        $.each(callbacks, function(index, callback) {
-                            try {
-                                callback(eventType, data, element);
-                            } catch (err) {
-                                console.error({
-                                    eventType: eventType,
-                                    data: data,
-                                    element: element,
-                                    error: err
-                                });
-                            }
-                        });
-                    }
-                }
+                notifyListeners(eventType, data, element);
                 // Regardless of whether any callbacks were made, log this event.
-                return sendRequest({
-                    event_type: eventType,
-                    event: JSON.stringify(data),
-                    courserun_key: typeof $$course_id !== 'undefined' ? $$course_id : null,
-                    page: window.location.href
-                }, requestOptions);
+                return sendRequest(getEventData(eventType, data), requestOptions);
+            },
+
+            /**
+             * Emits an event as part of a batch.
+             *
+             * Like log, but rather than sending a request per event, the event is sent
+             * along with the other events emitted within a few seconds. Use this for
+             * frequent events whose callers don't need to wait for the request.
+             */
+            logBatched: function(eventType, data, element) {
+                notifyListeners(eventType, data, element || null);
+                bindBatchFlush();
+
+                // The events are only sent later, so record when they happened.
+                batchedEvents.push($.extend(getEventData(eventType, data), {time: new Date().toISOString()}));
+                if (batchedEvents.length >= MAX_BATCH_SIZE) {
+                    Logger.flushBatched();
+                } else if (batchTimeout === null) {
+                    batchTimeout = setTimeout(function() {
+                        Logger.flushBatched();
+                    }, BATCH_DELAY);
+                }
+            },
+
+            /**
+             * Sends the events waiting to be sent by logBatched.
+             */
+            flushBatched: function(requestOptions) {
+                var events = takeBatchedEvents();
+
+                if (events.length === 0) {
+                    return null;
+                }
+                return sendRequest(
+                    {events: JSON.stringify(events)},
+                    $.extend({url: '/event/batch'}, requestOptions)
+                );
             },
 
             /**
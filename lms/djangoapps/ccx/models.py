@@ -10,6 +10,8 @@ from datetime import datetime
 from ccx_keys.locator import CCXLocator
 from django.contrib.auth.models import User  # lint-amnesty, pylint: disable=imported-auth-user
 from django.db import models
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
 from lazy import lazy
 from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
 from pytz import utc
@@ -120,3 +122,25 @@ class CcxFieldOverride(models.Model):
         unique_together = (('ccx', 'location', 'field'),)
 
     value = models.TextField(default='null')
+
+
+@receiver(post_save, sender=CustomCourseForEdX)
+@receiver(post_delete, sender=CustomCourseForEdX)
+def invalidate_ccx_overrides(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the materialized overrides of a CCX when the CCX itself changes.
+    """
+    # avoid circular import problems
+    from .overrides import invalidate_ccx_overrides_cache
+    invalidate_ccx_overrides_cache(instance.id)
+
+
+@receiver(post_save, sender=CcxFieldOverride)
+@receiver(post_delete, sender=CcxFieldOverride)
+def invalidate_ccx_field_overrides(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drop the materialized overrides of a CCX when one of its overrides changes.
+    """
+    # avoid circular import problems
+    from .overrides import invalidate_ccx_overrides_cache
+    invalidate_ccx_overrides_cache(instance.ccx_id)
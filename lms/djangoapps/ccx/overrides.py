@@ -8,15 +8,19 @@ import json
 import logging
 
 from ccx_keys.locator import CCXBlockUsageLocator, CCXLocator
+from django.core.cache import cache
 from django.db import transaction
 from opaque_keys.edx.keys import CourseKey, UsageKey
 
 from lms.djangoapps.ccx.models import CcxFieldOverride, CustomCourseForEdX
-from lms.djangoapps.courseware.field_overrides import FieldOverrideProvider
+from lms.djangoapps.courseware.field_overrides import FieldOverrideProvider, clear_prefetched_overrides
 from openedx.core.lib.cache_utils import get_cache
 
 log = logging.getLogger(__name__)
 
+CCX_OVERRIDES_CACHE_KEY = 'ccx.overrides.{ccx_id}'
+CCX_OVERRIDES_CACHE_TIMEOUT = 60 * 60 * 24
+
 
 class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
     """
@@ -48,6 +52,20 @@ class CustomCoursesForEdxOverrideProvider(FieldOverrideProvider):
             return get_override_for_ccx(ccx, block, name, default)
         return default
 
+    def get_many(self, blocks):
+        """
+        Resolve the CCX overrides of every block up front, so that field reads
+        do not need to re-clean the block key and decode the JSON value.
+        """
+        overrides = {}
+        for block in blocks:
+            ccx = get_current_ccx(block.location.course_key)
+            if ccx:
+                overrides[block.location] = get_overrides_for_ccx_block(ccx, block)
+            else:
+                overrides[block.location] = {}
+        return overrides
+
     @classmethod
     def enabled_for(cls, block):  # lint-amnesty, pylint: disable=arguments-differ
         """
@@ -102,6 +120,23 @@ def get_override_for_ccx(ccx, block, name, default=None):
         return default
 
 
+def get_overrides_for_ccx_block(ccx, block):
+    """
+    Returns a dictionary mapping field name to the overridden, deserialized
+    value of every field overridden on `block` for the `ccx`.
+    """
+    block_overrides = dict(_get_overrides_for_ccx(ccx).get(_clean_ccx_key(block.location), {}))
+    block_overrides['course_edit_method'] = None
+
+    values = {}
+    for name, value in block_overrides.items():
+        try:
+            values[name] = block.fields[name].from_json(value)
+        except KeyError:
+            values[name] = value
+    return values
+
+
 def _clean_ccx_key(block_location):
     """
     Converts the given BlockUsageKey from a CCX key to the
@@ -121,26 +156,58 @@ def _get_overrides_for_ccx(ccx):
     """
     Returns a dictionary mapping field name to overriden value for any
     overrides set on this block for this CCX.
+
+    The overrides of a CCX are materialized once into the django cache and
+    shared across requests until the CCX, one of its overrides or its master
+    course changes (see `invalidate_ccx_overrides_cache`).  Override model
+    instances are only available for overrides loaded from or written to the
+    database during the current request.
     """
     overrides_cache = get_cache('ccx-overrides')
 
     if ccx not in overrides_cache:
-        overrides = {}
-        query = CcxFieldOverride.objects.filter(
-            ccx=ccx,
-        )
+        cache_key = CCX_OVERRIDES_CACHE_KEY.format(ccx_id=ccx.id)
+        materialized = cache.get(cache_key)
+        if materialized is not None:
+            overrides = {location: dict(block_overrides) for location, block_overrides in materialized.items()}
+        else:
+            overrides = {}
+            materialized = {}
+            query = CcxFieldOverride.objects.filter(
+                ccx=ccx,
+            )
+
+            for override in query:
+                block_overrides = overrides.setdefault(override.location, {})
+                block_overrides[override.field] = json.loads(override.value)
+                block_overrides[override.field + "_id"] = override.id
+                block_overrides[override.field + "_instance"] = override
 
-        for override in query:
-            block_overrides = overrides.setdefault(override.location, {})
-            block_overrides[override.field] = json.loads(override.value)
-            block_overrides[override.field + "_id"] = override.id
-            block_overrides[override.field + "_instance"] = override
+                materialized_overrides = materialized.setdefault(override.location, {})
+                materialized_overrides[override.field] = block_overrides[override.field]
+                materialized_overrides[override.field + "_id"] = override.id
+
+            cache.set(cache_key, materialized, CCX_OVERRIDES_CACHE_TIMEOUT)
 
         overrides_cache[ccx] = overrides
 
     return overrides_cache[ccx]
 
 
+def invalidate_ccx_overrides_cache(ccx_id):
+    """
+    Drops the materialized overrides of the CCX with the given id, so that
+    they are rebuilt from the database on the next read.
+
+    The overrides are dropped again once the current transaction (if any)
+    commits, so that overrides re-materialized by another process before
+    the commit do not linger.
+    """
+    cache_key = CCX_OVERRIDES_CACHE_KEY.format(ccx_id=ccx_id)
+    cache.delete(cache_key)
+    transaction.on_commit(lambda: cache.delete(cache_key))
+
+
 @transaction.atomic
 def override_field_for_ccx(ccx, block, name, value):
     """
@@ -176,6 +243,7 @@ def override_field_for_ccx(ccx, block, name, value):
 
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name] = value_json
     _get_overrides_for_ccx(ccx).setdefault(clean_ccx_key, {})[name + "_instance"] = override
+    clear_prefetched_overrides()
 
 
 def clear_override_for_ccx(ccx, block, name):
@@ -209,6 +277,7 @@ def clear_ccx_field_info_from_ccx_map(ccx, block, name):
         ccx_override_map.pop(name + "_instance")
     except KeyError:
         pass
+    clear_prefetched_overrides()
 
 
 def bulk_delete_ccx_override_fields(ccx, ids):
@@ -219,3 +288,4 @@ def bulk_delete_ccx_override_fields(ccx, ids):
     ids = list(set(ids))
     if ids:
         CcxFieldOverride.objects.filter(ccx=ccx, id__in=ids).delete()
+        clear_prefetched_overrides()
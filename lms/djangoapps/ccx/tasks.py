@@ -13,6 +13,7 @@ from opaque_keys.edx.locator import CourseLocator
 
 from lms import CELERY_APP
 from lms.djangoapps.ccx.models import CustomCourseForEdX
+from lms.djangoapps.ccx.overrides import invalidate_ccx_overrides_cache
 from xmodule.modulestore.django import SignalHandler  # lint-amnesty, pylint: disable=wrong-import-order
 
 log = logging.getLogger("edx.ccx")
@@ -35,6 +36,7 @@ def send_ccx_course_published(course_key):
     """
     course_key = CourseLocator.from_string(course_key)
     for ccx in CustomCourseForEdX.objects.filter(course_id=course_key):
+        invalidate_ccx_overrides_cache(ccx.id)
         try:
             ccx_key = CCXLocator.from_course_locator(course_key, str(ccx.id))
         except InvalidKeyError:
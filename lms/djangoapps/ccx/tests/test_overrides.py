@@ -8,6 +8,7 @@ from unittest import mock
 
 import pytz
 from ccx_keys.locator import CCXLocator
+from django.core.cache import cache
 from django.test.utils import override_settings
 from edx_django_utils.cache import RequestCache
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase
@@ -15,7 +16,7 @@ from xmodule.modulestore.tests.factories import CourseFactory, BlockFactory
 
 from common.djangoapps.student.tests.factories import AdminFactory
 from lms.djangoapps.ccx.models import CustomCourseForEdX
-from lms.djangoapps.ccx.overrides import override_field_for_ccx
+from lms.djangoapps.ccx.overrides import CCX_OVERRIDES_CACHE_KEY, get_override_for_ccx, override_field_for_ccx
 from lms.djangoapps.ccx.tests.utils import flatten, iter_blocks
 from lms.djangoapps.courseware.field_overrides import OverrideFieldData
 from lms.djangoapps.courseware.tests.test_field_overrides import inject_field_overrides
@@ -31,6 +32,8 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
     """
     Make sure field overrides behave in the expected manner.
     """
+    ENABLED_CACHES = ['default']
+
     @classmethod
     def setUpClass(cls):
         """
@@ -167,3 +170,50 @@ class TestFieldOverrides(FieldOverrideTestMixin, SharedModuleStoreTestCase):
         override_field_for_ccx(self.ccx, chapter, 'due', ccx_due)
         vertical = chapter.get_children()[0].get_children()[0]
         assert vertical.due == ccx_due
+
+    def test_materialized_overrides_shared_across_requests(self):
+        """
+        Test that overrides are read from the materialized cache without
+        queries once the request cache is cleared.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        RequestCache.clear_all_namespaces()
+        get_override_for_ccx(self.ccx, chapter, 'start')
+        RequestCache.clear_all_namespaces()
+        with self.assertNumQueries(0):
+            assert get_override_for_ccx(self.ccx, chapter, 'start') == ccx_start
+
+    def test_materialized_overrides_invalidated_on_change(self):
+        """
+        Test that changing an override invalidates the materialized cache.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        new_ccx_start = datetime.datetime(2015, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+
+        RequestCache.clear_all_namespaces()
+        assert get_override_for_ccx(self.ccx, chapter, 'start') == ccx_start
+        override_field_for_ccx(self.ccx, chapter, 'start', new_ccx_start)
+
+        RequestCache.clear_all_namespaces()
+        assert get_override_for_ccx(self.ccx, chapter, 'start') == new_ccx_start
+
+    def test_materialized_overrides_invalidated_on_commit(self):
+        """
+        Test that overrides materialized by another process before the change
+        commits are dropped once it commits.
+        """
+        ccx_start = datetime.datetime(2014, 12, 25, 00, 00, tzinfo=pytz.UTC)
+        chapter = self.ccx_course.get_children()[0]
+        cache_key = CCX_OVERRIDES_CACHE_KEY.format(ccx_id=self.ccx.id)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            override_field_for_ccx(self.ccx, chapter, 'start', ccx_start)
+            # A concurrent reader re-materializes the overrides it still sees.
+            cache.set(cache_key, {}, 60)
+
+        assert cache.get(cache_key) is None
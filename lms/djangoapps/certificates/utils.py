@@ -232,6 +232,22 @@ def certificate_status_for_student(student, course_id):
     return certificate_status(generated_certificate)
 
 
+def certificate_statuses_for_student(student, course_ids):
+    """
+    Bulk version of certificate_status_for_student: returns a dictionary
+    mapping each of the given course ids to its certificate status, fetching
+    the student's certificates with a single query.
+    """
+    generated_certificates = {
+        cert.course_id: cert
+        for cert in GeneratedCertificate.objects.filter(user=student, course_id__in=course_ids)
+    }
+    return {
+        course_id: certificate_status(generated_certificates.get(course_id))
+        for course_id in course_ids
+    }
+
+
 def get_preferred_certificate_name(user):
     """
     If the verified name feature is enabled and the user has their preference set to use their
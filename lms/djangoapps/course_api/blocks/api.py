@@ -114,7 +114,8 @@ def get_blocks(
             block_counts,
             student_view_data,
             depth,
-            nav_depth
+            nav_depth,
+            requested_fields=requested_fields,
         ),
     ]
 
@@ -1,6 +1,7 @@
 """
 Serializers for Course Blocks related return objects.
 """
+from functools import cached_property
 
 from django.conf import settings
 from rest_framework import serializers
@@ -115,6 +116,20 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
     Serializer for single course block
     """
 
+    @cached_property
+    def requested_supported_fields(self):
+        """
+        The entries of SUPPORTED_FIELDS that were requested.
+
+        Computed once per serializer, rather than checking every supported
+        field against the requested fields for each serialized block.
+        """
+        requested_fields = self.context['requested_fields']
+        return [
+            supported_field for supported_field in SUPPORTED_FIELDS
+            if supported_field.requested_field_name in requested_fields
+        ]
+
     def _get_field(self, block_key, transformer, field_name, default):
         """
         Get the field value requested.  The field may be an XBlock field, a
@@ -172,17 +187,16 @@ class BlockSerializer(serializers.Serializer):  # pylint: disable=abstract-metho
             )
 
         # add additional requested fields that are supported by the various transformers
-        for supported_field in SUPPORTED_FIELDS:
-            if supported_field.requested_field_name in self.context['requested_fields']:
-                field_value = self._get_field(
-                    block_key,
-                    supported_field.transformer,
-                    supported_field.block_field_name,
-                    supported_field.default_value,
-                )
-                if field_value is not None:
-                    # only return fields that have data
-                    data[supported_field.serializer_field_name] = field_value
+        for supported_field in self.requested_supported_fields:
+            field_value = self._get_field(
+                block_key,
+                supported_field.transformer,
+                supported_field.block_field_name,
+                supported_field.default_value,
+            )
+            if field_value is not None:
+                # only return fields that have data
+                data[supported_field.serializer_field_name] = field_value
 
         if 'children' in self.context['requested_fields']:
             children = block_structure.get_children(block_key)
@@ -212,8 +226,12 @@ class BlockDictSerializer(serializers.Serializer):  # pylint: disable=abstract-m
     def get_blocks(self, structure):
         """
         Serialize to a dictionary of blocks keyed by the block's usage_key.
+
+        A single BlockSerializer is shared by all the blocks, so that the
+        requested fields are only planned once per structure.
         """
+        block_serializer = BlockSerializer(context=self.context)
         return {
-            str(block_key): BlockSerializer(block_key, context=self.context).data
+            str(block_key): block_serializer.to_representation(block_key)
             for block_key in structure
         }
@@ -0,0 +1,142 @@
+"""
+Paged snapshots of the student_view_data of a course's blocks.
+
+StudentViewTransformer collects the student_view_data of every block, and the
+video transformers then rewrite the URLs and stream priorities of that data on
+every request. A snapshot holds the already rewritten student_view_data of all
+blocks of one version of a course, split into compressed pages of
+SNAPSHOT_PAGE_SIZE blocks in the django cache. A request then only loads the
+pages that contain the blocks it returns.
+
+Snapshots are keyed by the content version recorded by
+StudentViewTransformer.collect, so publishing a course starts a new snapshot
+and older ones expire from the cache.
+"""
+import hashlib
+from logging import getLogger
+
+from django.core.cache import cache
+
+from openedx.core.djangoapps.content.block_structure.api import get_course_in_cache
+from openedx.core.djangoapps.video_pipeline.config.waffle import DEPRECATE_YOUTUBE
+from openedx.core.lib.cache_utils import zpickle, zunpickle
+
+from .transformers.student_view import StudentViewTransformer
+from .transformers.video_stream_priority import VideoBlockStreamPriorityTransformer
+from .transformers.video_urls import VideoBlockURLTransformer
+
+log = getLogger(__name__)
+
+SNAPSHOT_VERSION = 1
+SNAPSHOT_PAGE_SIZE = 100
+SNAPSHOT_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_student_view_data(block_structure, block_keys):
+    """
+    Returns the snapshotted student_view_data of the given blocks, keyed by
+    block key. Blocks without student_view_data are left out.
+
+    Returns None if the collected block_structure has no content version to
+    key a snapshot by, in which case the caller should fall back to the
+    collected data.
+    """
+    content_version = block_structure.get_transformer_data(
+        StudentViewTransformer, StudentViewTransformer.CONTENT_VERSION
+    )
+    if content_version is None:
+        return None
+
+    course_key = block_structure.root_block_usage_key.course_key
+    deprecate_youtube = DEPRECATE_YOUTUBE.is_enabled(course_key)
+    cache_key_prefix = _snapshot_cache_key_prefix(course_key, content_version, deprecate_youtube)
+
+    page_numbers = cache.get(_index_cache_key(cache_key_prefix))
+    pages = None
+    if page_numbers is not None:
+        wanted_pages = {page_numbers[str(block_key)] for block_key in block_keys if str(block_key) in page_numbers}
+        page_cache_keys = {_page_cache_key(cache_key_prefix, page): page for page in wanted_pages}
+        cached_pages = cache.get_many(list(page_cache_keys))
+        if len(cached_pages) == len(page_cache_keys):
+            pages = {
+                page_cache_keys[page_cache_key]: zunpickle(page_data)
+                for page_cache_key, page_data in cached_pages.items()
+            }
+
+    if pages is None:
+        # Either nothing is cached yet, or some pages were evicted.
+        page_numbers, pages = _create_snapshot(course_key, content_version, deprecate_youtube)
+
+    student_view_data = {}
+    for block_key in block_keys:
+        page = page_numbers.get(str(block_key))
+        if page is not None:
+            student_view_data[block_key] = pages[page][str(block_key)]
+    return student_view_data
+
+
+def _create_snapshot(course_key, content_version, deprecate_youtube):
+    """
+    Builds the snapshot of the course's collected student_view_data, and adds
+    its pages to the cache.
+
+    Returns the page number of each block, and the pages by number.
+    """
+    collected_block_structure = get_course_in_cache(course_key)
+    collected_content_version = collected_block_structure.get_transformer_data(
+        StudentViewTransformer, StudentViewTransformer.CONTENT_VERSION
+    )
+
+    page_numbers = {}
+    pages = {}
+    for block_key in collected_block_structure.topological_traversal():
+        student_view_data = collected_block_structure.get_transformer_block_field(
+            block_key, StudentViewTransformer, StudentViewTransformer.STUDENT_VIEW_DATA
+        )
+        if student_view_data is None:
+            continue
+        if block_key.block_type == 'video' and student_view_data:
+            VideoBlockURLTransformer.rewrite_video_urls(student_view_data)
+            VideoBlockStreamPriorityTransformer.set_stream_priorities(student_view_data, deprecate_youtube)
+        page = len(page_numbers) // SNAPSHOT_PAGE_SIZE
+        page_numbers[str(block_key)] = page
+        pages.setdefault(page, {})[str(block_key)] = student_view_data
+
+    # The course may have been re-collected since the caller's structure was
+    # loaded. Only cache the snapshot under the version it was built from.
+    if collected_content_version == content_version:
+        cache_key_prefix = _snapshot_cache_key_prefix(course_key, content_version, deprecate_youtube)
+        data_to_cache = {
+            _page_cache_key(cache_key_prefix, page): zpickle(page_data)
+            for page, page_data in pages.items()
+        }
+        data_to_cache[_index_cache_key(cache_key_prefix)] = page_numbers
+        cache.set_many(data_to_cache, timeout=SNAPSHOT_CACHE_TIMEOUT)
+        log.info(
+            "Created student_view_data snapshot for %s; blocks: %d, pages: %d",
+            course_key, len(page_numbers), len(pages),
+        )
+
+    return page_numbers, pages
+
+
+def _snapshot_cache_key_prefix(course_key, content_version, deprecate_youtube):
+    """
+    Returns the prefix of the cache keys for the snapshot of the given
+    version of the course.
+
+    The CDN the video URLs are rewritten to is part of the key, so that a
+    changed setting doesn't serve stale URLs.
+    """
+    version_hash = hashlib.md5(
+        f'{content_version}.{VideoBlockURLTransformer.CDN_URL}.{deprecate_youtube}'.encode('utf-8')
+    ).hexdigest()
+    return f'course_blocks_api.student_view_data.v{SNAPSHOT_VERSION}.{course_key}.{version_hash}'
+
+
+def _index_cache_key(cache_key_prefix):
+    return f'{cache_key_prefix}.index'
+
+
+def _page_cache_key(cache_key_prefix, page):
+    return f'{cache_key_prefix}.page.{page}'
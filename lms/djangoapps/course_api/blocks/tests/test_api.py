@@ -7,18 +7,23 @@ from itertools import product
 from unittest.mock import patch
 
 import ddt
+from django.core.cache import cache
 from django.test.client import RequestFactory
 from edx_toggles.toggles.testutils import override_waffle_switch
 
 from common.djangoapps.student.tests.factories import UserFactory
-from openedx.core.djangoapps.content.block_structure.api import clear_course_from_cache
+from openedx.core.djangoapps.content.block_structure.api import clear_course_from_cache, get_course_in_cache
 from openedx.core.djangoapps.content.block_structure.config import STORAGE_BACKING_FOR_CACHE
 from xmodule.modulestore import ModuleStoreEnum  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore.tests.django_utils import SharedModuleStoreTestCase  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore.tests.factories import SampleCourseFactory, check_mongo_calls  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.modulestore.tests.sample_courses import BlockInfo  # lint-amnesty, pylint: disable=wrong-import-order
 
+from .. import snapshots
 from ..api import get_blocks
+from ..toggles import STUDENT_VIEW_DATA_SNAPSHOTS
+from ..transformers.block_counts import BlockCountsTransformer
+from ..transformers.student_view import StudentViewTransformer
 
 
 class TestGetBlocks(SharedModuleStoreTestCase):
@@ -109,6 +114,26 @@ class TestGetBlocks(SharedModuleStoreTestCase):
         for block in blocks['blocks'].values():
             assert block['type'] == 'problem'
 
+    def test_unrequested_transformers_skipped(self):
+        """
+        Transformers that only add fields are skipped unless those fields are requested.
+        """
+        with patch.object(StudentViewTransformer, 'transform') as mock_student_view, \
+                patch.object(BlockCountsTransformer, 'transform') as mock_block_counts:
+            blocks = get_blocks(
+                self.request, self.course.location, self.user,
+                block_counts=['problem'], student_view_data=['video'], requested_fields=['type'],
+            )
+        assert blocks['root'] == str(self.course.location)
+        mock_student_view.assert_not_called()
+        mock_block_counts.assert_not_called()
+
+        blocks = get_blocks(
+            self.request, self.course.location, self.user,
+            block_counts=['problem'], requested_fields=['block_counts'],
+        )
+        assert blocks['blocks'][str(self.course.location)]['block_counts']['problem'] > 0
+
 
 class TestGetBlocksVideoUrls(SharedModuleStoreTestCase):
     """
@@ -170,6 +195,53 @@ class TestGetBlocksVideoUrls(SharedModuleStoreTestCase):
         for video_data in video_block_data['student_view_data']['encoded_videos'].values():
             assert 'cloudfront' not in video_data['url']
 
+    @patch('xmodule.video_block.VideoBlock.student_view_data')
+    def test_student_view_data_snapshot(self, video_data_patch):
+        """
+        Verify the student_view_data read from the course's snapshot matches
+        the data processed on each request.
+        """
+        video_data_patch.return_value = {
+            'encoded_videos': {
+                'hls': {
+                    'url': 'https://xyz123.cloudfront.net/XYZ123ABC.mp4',
+                    'file_size': 0
+                },
+                'youtube': {
+                    'url': 'https://www.youtube.com/watch?v=XYZ123ABC',
+                    'file_size': 0
+                }
+            }
+        }
+        get_blocks_kwargs = dict(requested_fields=['student_view_data'], student_view_data=['video'])
+        expected_blocks = get_blocks(self.request, self.course.location, **get_blocks_kwargs)
+
+        with override_waffle_switch(STUDENT_VIEW_DATA_SNAPSHOTS, active=True):
+            # the first request creates the snapshot...
+            assert get_blocks(self.request, self.course.location, **get_blocks_kwargs) == expected_blocks
+
+            content_version = get_course_in_cache(self.course.id).get_transformer_data(
+                StudentViewTransformer, StudentViewTransformer.CONTENT_VERSION
+            )
+            assert content_version is not None
+            cache_key_prefix = snapshots._snapshot_cache_key_prefix(  # pylint: disable=protected-access
+                self.course.id, content_version, False
+            )
+            assert cache.get(f'{cache_key_prefix}.index')
+            assert cache.get(f'{cache_key_prefix}.page.0') is not None
+
+            # ... and the second reads it from the cache
+            with patch.object(snapshots, 'get_course_in_cache') as mock_get_course_in_cache:
+                with patch.object(snapshots, '_create_snapshot') as mock_create_snapshot:
+                    assert get_blocks(self.request, self.course.location, **get_blocks_kwargs) == expected_blocks
+            assert not mock_get_course_in_cache.called
+            assert not mock_create_snapshot.called
+
+        video_block_key = str(self.course.id.make_usage_key('video', 'sample_video'))
+        html_block_key = str(self.course.id.make_usage_key('html', 'html'))
+        assert 'student_view_data' in expected_blocks['blocks'][video_block_key]
+        assert 'student_view_data' not in expected_blocks['blocks'][html_block_key]
+
 
 @ddt.ddt
 class TestGetBlocksQueryCountsBase(SharedModuleStoreTestCase):
@@ -3,7 +3,7 @@ Toggles for Course API.
 """
 
 
-from edx_toggles.toggles import WaffleFlag
+from edx_toggles.toggles import WaffleFlag, WaffleSwitch
 
 COURSE_BLOCKS_API_NAMESPACE = 'course_blocks_api'
 
@@ -18,3 +18,16 @@ COURSE_BLOCKS_API_NAMESPACE = 'course_blocks_api'
 HIDE_ACCESS_DENIALS_FLAG = WaffleFlag(
     f'{COURSE_BLOCKS_API_NAMESPACE}.hide_access_denials', __name__
 )
+
+# .. toggle_name: course_blocks_api.student_view_data_snapshots
+# .. toggle_implementation: WaffleSwitch
+# .. toggle_default: False
+# .. toggle_description: When enabled, the course blocks API reads student_view_data from paged snapshots of each
+#   course version, with video URLs and stream priorities already rewritten, instead of processing the collected
+#   student_view_data of every block on each request.
+# .. toggle_use_cases: temporary
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: 2027-01-31
+STUDENT_VIEW_DATA_SNAPSHOTS = WaffleSwitch(
+    f'{COURSE_BLOCKS_API_NAMESPACE}.student_view_data_snapshots', __name__
+)
@@ -5,6 +5,8 @@ Blocks API Transformer
 
 from openedx.core.djangoapps.content.block_structure.transformer import BlockStructureTransformer
 
+from ..snapshots import get_student_view_data
+from ..toggles import STUDENT_VIEW_DATA_SNAPSHOTS
 from .block_counts import BlockCountsTransformer
 from .block_depth import BlockDepthTransformer
 from .extra_fields import ExtraFieldsTransformer
@@ -20,28 +22,45 @@ class BlocksAPITransformer(BlockStructureTransformer):
     Course Blocks API.
 
     Contained Transformers (processed in this order):
-        StudentViewTransformer
         BlockCountsTransformer
         BlockDepthTransformer
         BlockNavigationTransformer
+        StudentViewTransformer
+        VideoBlockURLTransformer
         VideoBlockStreamPriorityTransformer
         ExtraFieldsTransformer
 
     Note:
         * BlockDepthTransformer must be executed before BlockNavigationTransformer.
         * StudentViewTransformer must be executed before VideoBlockURLTransformer.
+
+    When the STUDENT_VIEW_DATA_SNAPSHOTS switch is enabled, student_view_data
+    is read from the course's snapshot instead of running
+    StudentViewTransformer and the video transformers.
+
+    When requested_fields is given, contained transformers that only add
+    fields nobody asked for are skipped. BlockDepthTransformer always runs,
+    since it removes blocks from the structure.
     """
 
-    WRITE_VERSION = 1
+    WRITE_VERSION = 2
     READ_VERSION = 1
     STUDENT_VIEW_DATA = 'student_view_data'
     STUDENT_VIEW_MULTI_DEVICE = 'student_view_multi_device'
 
-    def __init__(self, block_types_to_count, requested_student_view_data, depth=None, nav_depth=None):
+    def __init__(
+        self,
+        block_types_to_count,
+        requested_student_view_data,
+        depth=None,
+        nav_depth=None,
+        requested_fields=None,
+    ):
         self.block_types_to_count = block_types_to_count
         self.requested_student_view_data = requested_student_view_data
         self.depth = depth
         self.nav_depth = nav_depth
+        self.requested_fields = requested_fields
 
     @classmethod
     def name(cls):
@@ -69,10 +88,61 @@ class BlocksAPITransformer(BlockStructureTransformer):
         """
         Mutates block_structure based on the given usage_info.
         """
-        StudentViewTransformer(self.requested_student_view_data).transform(usage_info, block_structure)
-        BlockCountsTransformer(self.block_types_to_count).transform(usage_info, block_structure)
+        if self._is_requested(BlockCountsTransformer.BLOCK_COUNTS):
+            BlockCountsTransformer(self.block_types_to_count).transform(usage_info, block_structure)
         BlockDepthTransformer(self.depth).transform(usage_info, block_structure)
-        BlockNavigationTransformer(self.nav_depth).transform(usage_info, block_structure)
+        if self._is_requested('nav_depth'):
+            BlockNavigationTransformer(self.nav_depth).transform(usage_info, block_structure)
+        if self._is_requested(self.STUDENT_VIEW_DATA):
+            self._transform_student_view_data(usage_info, block_structure)
+        if self._is_requested(*ExtraFieldsTransformer.get_requested_extra_fields()):
+            ExtraFieldsTransformer().transform(usage_info, block_structure)
+
+    def _transform_student_view_data(self, usage_info, block_structure):
+        """
+        Leaves only the requested student_view_data in block_structure, with
+        the video URLs and stream priorities rewritten.
+        """
+        if STUDENT_VIEW_DATA_SNAPSHOTS.is_enabled() and self._add_student_view_data_from_snapshot(block_structure):
+            return
+        StudentViewTransformer(self.requested_student_view_data).transform(usage_info, block_structure)
         VideoBlockURLTransformer().transform(usage_info, block_structure)
         VideoBlockStreamPriorityTransformer().transform(usage_info, block_structure)
-        ExtraFieldsTransformer().transform(usage_info, block_structure)
+
+    def _add_student_view_data_from_snapshot(self, block_structure):
+        """
+        Replaces the collected student_view_data of the requested block types
+        with that of the course's snapshot, and removes it from other blocks.
+
+        Returns False, leaving block_structure untouched, if the course has no
+        snapshot.
+        """
+        requested_block_types = self.requested_student_view_data or []
+        requested_block_keys = [
+            block_key for block_key in block_structure
+            if block_structure.get_xblock_field(block_key, 'category') in requested_block_types
+        ]
+        student_view_data = get_student_view_data(block_structure, requested_block_keys)
+        if student_view_data is None:
+            return False
+
+        for block_key in block_structure:
+            block_student_view_data = student_view_data.get(block_key)
+            if block_student_view_data is None:
+                block_structure.remove_transformer_block_field(
+                    block_key, StudentViewTransformer, self.STUDENT_VIEW_DATA
+                )
+            else:
+                block_structure.set_transformer_block_field(
+                    block_key, StudentViewTransformer, self.STUDENT_VIEW_DATA, block_student_view_data
+                )
+        return True
+
+    def _is_requested(self, *field_names):
+        """
+        Returns whether any of the given fields were requested. Everything is
+        considered requested when no requested_fields were given.
+        """
+        if self.requested_fields is None:
+            return True
+        return any(field_name in self.requested_fields for field_name in field_names)
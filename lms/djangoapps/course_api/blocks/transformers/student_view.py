@@ -14,6 +14,7 @@ class StudentViewTransformer(BlockStructureTransformer):
     READ_VERSION = 1
     STUDENT_VIEW_DATA = 'student_view_data'
     STUDENT_VIEW_MULTI_DEVICE = 'student_view_multi_device'
+    CONTENT_VERSION = 'content_version'
 
     def __init__(self, requested_student_view_data=None):
         self.requested_student_view_data = requested_student_view_data or []
@@ -30,6 +31,14 @@ class StudentViewTransformer(BlockStructureTransformer):
         # collect basic xblock fields
         block_structure.request_xblock_fields('category')
 
+        # Record the version of the collected content, which identifies the
+        # student_view_data snapshots of this course.
+        root_block = block_structure.get_xblock(block_structure.root_block_usage_key)
+        course_version = getattr(root_block, 'course_version', None)
+        subtree_edited_on = getattr(root_block, 'subtree_edited_on', None)
+        if course_version or subtree_edited_on:
+            block_structure.set_transformer_data(cls, cls.CONTENT_VERSION, f'{course_version}.{subtree_edited_on}')
+
         for block_key in block_structure.topological_traversal():
             block = block_structure.get_xblock(block_key)
 
@@ -53,6 +53,7 @@ class VideoBlockStreamPriorityTransformer(BlockStructureTransformer):
         value to prioritise streaming for different video formats.
         """
 
+        deprecate_youtube = None
         for block_key in block_structure.topological_traversal(
             filter_func=lambda block_key: block_key.block_type == 'video',
             yield_descendants_of_unyielded=True,
@@ -62,14 +63,24 @@ class VideoBlockStreamPriorityTransformer(BlockStructureTransformer):
             )
             if not student_view_data:
                 return
+            if deprecate_youtube is None:
+                deprecate_youtube = DEPRECATE_YOUTUBE.is_enabled(usage_info.course_key)
+            self.set_stream_priorities(student_view_data, deprecate_youtube)
 
-            # web-only videos don't contain any video information for native clients
-            only_on_web = student_view_data.get('only_on_web')
-            if only_on_web:
-                continue
-            encoded_videos = student_view_data.get('encoded_videos')
-            for video_format, video_data in encoded_videos.items():
-                if DEPRECATE_YOUTUBE.is_enabled(usage_info.course_key):
-                    video_data['stream_priority'] = self.DEPRECATE_YOUTUBE_VIDEO_STREAM_PRIORITY.get(video_format, -1)
-                else:
-                    video_data['stream_priority'] = self.DEFAULT_VIDEO_STREAM_PRIORITY.get(video_format, -1)
+    @classmethod
+    def set_stream_priorities(cls, student_view_data, deprecate_youtube):
+        """
+        Add the stream priority to each of the encoded videos of the given
+        video block's student_view_data, in place.
+        """
+        # web-only videos don't contain any video information for native clients
+        only_on_web = student_view_data.get('only_on_web')
+        if only_on_web:
+            return
+        if deprecate_youtube:
+            stream_priority = cls.DEPRECATE_YOUTUBE_VIDEO_STREAM_PRIORITY
+        else:
+            stream_priority = cls.DEFAULT_VIDEO_STREAM_PRIORITY
+        encoded_videos = student_view_data.get('encoded_videos')
+        for video_format, video_data in encoded_videos.items():
+            video_data['stream_priority'] = stream_priority.get(video_format, -1)
@@ -45,13 +45,20 @@ class VideoBlockURLTransformer(BlockStructureTransformer):
             )
             if not student_view_data:
                 return
+            self.rewrite_video_urls(student_view_data)
 
-            # web-only videos don't contain any video information for native clients
-            only_on_web = student_view_data.get('only_on_web')
-            if only_on_web:
+    @classmethod
+    def rewrite_video_urls(cls, student_view_data):
+        """
+        Re-write the encoded videos URLs of the given video block's
+        student_view_data in place.
+        """
+        # web-only videos don't contain any video information for native clients
+        only_on_web = student_view_data.get('only_on_web')
+        if only_on_web:
+            return
+        encoded_videos = student_view_data.get('encoded_videos')
+        for video_format, video_data in encoded_videos.items():
+            if video_format in cls.VIDEO_FORMAT_EXCEPTIONS:
                 continue
-            encoded_videos = student_view_data.get('encoded_videos')
-            for video_format, video_data in encoded_videos.items():
-                if video_format in self.VIDEO_FORMAT_EXCEPTIONS:
-                    continue
-                video_data['url'] = rewrite_video_url(self.CDN_URL, video_data['url'])
+            video_data['url'] = rewrite_video_url(cls.CDN_URL, video_data['url'])
@@ -13,9 +13,11 @@ Note: The access control logic in this file does NOT check for enrollment in
 
 
 import logging
+from contextlib import contextmanager
 
 from django.conf import settings  # pylint: disable=unused-import
 from django.contrib.auth.models import AnonymousUser
+from edx_django_utils.cache import RequestCache
 from edx_django_utils.monitoring import function_trace
 from opaque_keys.edx.keys import CourseKey, UsageKey
 from xblock.core import XBlock
@@ -67,6 +69,8 @@ from xmodule.partitions.partitions import NoSuchUserPartitionError, NoSuchUserPa
 
 log = logging.getLogger(__name__)
 
+BULK_ACCESS_CACHE_NAMESPACE = 'courseware.access.bulk'
+
 
 def has_ccx_coach_role(user, course_key):
     """
@@ -134,7 +138,11 @@ def has_access(user, action, obj, course_key=None):
 
     # Preview mode is only accessible by staff.
     if in_preview_mode() and course_key:
-        if not has_staff_access_to_preview_mode(user, course_key):
+        facts = _get_bulk_access_facts(user, course_key)
+        has_preview_access = (
+            facts.preview_access if facts else has_staff_access_to_preview_mode(user, course_key)
+        )
+        if not has_preview_access:
             return ACCESS_DENIED
 
     # delegate the work to type-specific functions.
@@ -167,6 +175,90 @@ def has_access(user, action, obj, course_key=None):
                     .format(type(obj)))
 
 
+def has_access_bulk(user, action, blocks, course_key=None):
+    """
+    Check whether a user has the access to do action on each of the given
+    blocks.
+
+    The user-level facts shared by every block of a course (masquerade role,
+    staff and instructor access, preview mode access and the user's group in
+    each user partition) are computed once and every block is evaluated
+    against them, instead of being recomputed for each block as separate
+    `has_access` calls would.
+
+    Arguments:
+        user: a Django user object. May be anonymous.
+        action: A string specifying the action that the client is trying to perform.
+        blocks: An iterable of blocks in the same course.
+        course_key: A course_key specifying which course run this access is for.
+            Defaults to the course of the first block.
+
+    Returns a dict mapping each block's location to an AccessResponse object.
+    """
+    blocks = list(blocks)
+    if not blocks:
+        return {}
+    if course_key is None:
+        course_key = blocks[0].location.course_key
+
+    with bulk_access_checks(user, course_key):
+        return {block.location: has_access(user, action, block, course_key) for block in blocks}
+
+
+class _BulkAccessFacts:
+    """
+    User-level facts used to check access to the blocks of one course,
+    computed once for a sequence of access checks.
+    """
+    def __init__(self, user, course_key):
+        self.preview_access = has_staff_access_to_preview_mode(user, course_key)
+        self.user_role = get_user_role(user, course_key)
+        self.staff_access = _has_access_to_course(user, 'staff', course_key)
+        self.instructor_access = _has_access_to_course(user, 'instructor', course_key)
+        self._user_groups = {}
+
+    def get_group_for_user(self, course_key, user, partition):
+        """
+        Returns the group of the user in the given partition, looking it up
+        from the partition scheme only once per partition.
+        """
+        if partition.id not in self._user_groups:
+            self._user_groups[partition.id] = partition.scheme.get_group_for_user(course_key, user, partition)
+        return self._user_groups[partition.id]
+
+
+@contextmanager
+def bulk_access_checks(user, course_key):
+    """
+    A context manager within which access checks of `user` on blocks of the
+    course identified by `course_key` reuse user-level facts computed once on
+    entry.  Used when many blocks are checked in a row, e.g. when the blocks
+    of a course outline are bound for the user.
+    """
+    if not user:
+        user = AnonymousUser()
+
+    request_cache = RequestCache(BULK_ACCESS_CACHE_NAMESPACE)
+    cache_key = (user.id, course_key)
+    previous = request_cache.data.get(cache_key)
+    request_cache.data[cache_key] = previous or _BulkAccessFacts(user, course_key)
+    try:
+        yield
+    finally:
+        if previous is None:
+            request_cache.data.pop(cache_key, None)
+
+
+def _get_bulk_access_facts(user, course_key):
+    """
+    Returns the user-level access facts precomputed by `bulk_access_checks`
+    for the given user and course, or None outside of a bulk access check.
+    """
+    if course_key is None:
+        return None
+    return RequestCache(BULK_ACCESS_CACHE_NAMESPACE).data.get((user.id, course_key))
+
+
 def has_staff_access_to_preview_mode(user, course_key):
     """
     Checks if given user can access course in preview mode.
@@ -449,8 +541,11 @@ def _has_group_access(block, user, course_key):
     This function returns a boolean indicating whether or not `user` has
     sufficient group memberships to "load" a block
     """
+    facts = _get_bulk_access_facts(user, course_key)
+
     # Allow staff and instructors roles group access, as they are not masquerading as a student.
-    if get_user_role(user, course_key) in ['staff', 'instructor']:
+    user_role = facts.user_role if facts else get_user_role(user, course_key)
+    if user_role in ['staff', 'instructor']:
         return ACCESS_GRANTED
 
     # use merged_group_access which takes group access on the block's
@@ -511,11 +606,14 @@ def _has_group_access(block, user, course_key):
     missing_groups = []
     block_key = block.scope_ids.usage_id
     for partition, groups in partition_groups:
-        user_group = partition.scheme.get_group_for_user(
-            course_key,
-            user,
-            partition,
-        )
+        if facts:
+            user_group = facts.get_group_for_user(course_key, user, partition)
+        else:
+            user_group = partition.scheme.get_group_for_user(
+                course_key,
+                user,
+                partition,
+            )
         if user_group not in groups:
             missing_groups.append((
                 partition,
@@ -554,6 +652,26 @@ def _has_access_to_block(user, action, block, course_key=None):
     (e.g. courses).  If you call this method directly instead of going through
     has_access(), it will not do the right thing.
     """
+    facts = _get_bulk_access_facts(user, course_key)
+
+    def staff_access():
+        """
+        Staff access to the block, answered from the precomputed facts of a
+        bulk access check when available.
+        """
+        if facts:
+            return facts.staff_access
+        return _has_staff_access_to_block(user, block, course_key)
+
+    def instructor_access():
+        """
+        Instructor access to the block, answered from the precomputed facts of
+        a bulk access check when available.
+        """
+        if facts:
+            return facts.instructor_access
+        return _has_instructor_access_to_block(user, block, course_key)
+
     def can_load():
         """
         NOTE: This does not check that the student is enrolled in the course
@@ -570,7 +688,7 @@ def _has_access_to_block(user, action, block, course_key=None):
             return group_access_response
 
         # If the user has staff access, they can load the block and checks below are not needed.
-        staff_access_response = _has_staff_access_to_block(user, block, course_key)
+        staff_access_response = staff_access()
         if staff_access_response:
             return staff_access_response
 
@@ -590,8 +708,8 @@ def _has_access_to_block(user, action, block, course_key=None):
 
     checkers = {
         'load': can_load,
-        'staff': lambda: _has_staff_access_to_block(user, block, course_key),
-        'instructor': lambda: _has_instructor_access_to_block(user, block, course_key)
+        'staff': staff_access,
+        'instructor': instructor_access,
     }
 
     return _dispatch(checkers, action, user, block)
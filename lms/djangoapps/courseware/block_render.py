@@ -53,7 +53,7 @@ from xmodule.util.sandboxing import SandboxService
 from xmodule.services import EventPublishingService, RebindUserService, SettingsService, TeamsConfigurationService
 from common.djangoapps.static_replace.services import ReplaceURLService
 from common.djangoapps.static_replace.wrapper import replace_urls_wrapper
-from lms.djangoapps.courseware.access import get_user_role, has_access
+from lms.djangoapps.courseware.access import bulk_access_checks, get_user_role, has_access
 from lms.djangoapps.courseware.entrance_exams import user_can_skip_entrance_exam, user_has_passed_entrance_exam
 from lms.djangoapps.courseware.masquerade import (
     MasqueradingKeyValueStore,
@@ -153,7 +153,9 @@ def toc_for_course(user, request, course, active_chapter, active_section, field_
 
     field_data_cache must include data from the course blocks and 2 levels of its descendants
     '''
-    with modulestore().bulk_operations(course.id):
+    # Every chapter and section is access checked as it is bound for the user,
+    # so compute the user-level access facts once for all of them.
+    with modulestore().bulk_operations(course.id), bulk_access_checks(user, course.id):
         course_block = get_block_for_descriptor(
             user, request, course, field_data_cache, course.id, course=course
         )
@@ -17,10 +17,12 @@ by `authored_data`, e.g. course content and settings stored in Mongo.
 
 
 import threading
+import time
 from abc import ABCMeta, abstractmethod
 from contextlib import contextmanager
 
 from django.conf import settings
+from edx_django_utils import monitoring as monitoring_utils
 from edx_django_utils.cache import DEFAULT_REQUEST_CACHE
 from xblock.field_data import FieldData
 
@@ -30,6 +32,7 @@ NOTSET = object()
 ENABLED_OVERRIDE_PROVIDERS_KEY = 'lms.djangoapps.courseware.field_overrides.enabled_providers.{course_id}'
 ENABLED_MODULESTORE_OVERRIDE_PROVIDERS_KEY = 'lms.djangoapps.courseware.modulestore_field_overrides.\
     enabled_providers.{course_id}'
+PREFETCHED_OVERRIDES_KEY = 'lms.djangoapps.courseware.field_overrides.prefetched_overrides'
 
 
 def resolve_dotted(name):
@@ -51,6 +54,23 @@ def resolve_dotted(name):
     return target
 
 
+def clear_prefetched_overrides():
+    """
+    Discards any overrides bulk loaded by `OverrideFieldData.prefetch` during
+    this request.  Should be called whenever an override is written, so that
+    subsequent reads in the same request fall back to the providers.
+    """
+    DEFAULT_REQUEST_CACHE.data.pop(PREFETCHED_OVERRIDES_KEY, None)
+
+
+def _prefetched_overrides():
+    """
+    Returns the request-scoped dictionary holding bulk loaded overrides,
+    keyed by (provider class, user id, course key).
+    """
+    return DEFAULT_REQUEST_CACHE.data.setdefault(PREFETCHED_OVERRIDES_KEY, {})
+
+
 def _lineage(block):
     """
     Returns an iterator over all ancestors of the given block, starting with
@@ -118,6 +138,23 @@ class FieldOverrideProvider(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    def get_many(self, blocks):
+        """
+        Bulk load the overrides for all of the given `blocks` at once.
+
+        Providers which can fetch their overrides for a set of blocks more
+        cheaply than one block at a time should implement this method and
+        return a dictionary mapping each block's location to a dictionary of
+        overridden field values keyed by field name.  Every block passed in
+        should appear in the result, with an empty dictionary if it has no
+        overrides, so that subsequent reads are answered without calling
+        `get`.
+
+        Returns `None` if the provider does not support bulk loading, in which
+        case `get` is used for every read.
+        """
+        return None
+
     @abstractmethod
     def enabled_for(self, course):  # pragma no cover
         """
@@ -197,8 +234,44 @@ class OverrideFieldData(FieldData):
 
         return enabled_providers
 
+    @classmethod
+    def prefetch(cls, user, course, blocks):
+        """
+        Bulk load the overrides of every enabled provider for `user` and all
+        of the given `blocks`, so that later field reads on those blocks are
+        answered with dictionary lookups instead of per-block provider calls.
+
+        The loaded overrides are stored in the request cache.  The time spent
+        by each provider is reported as a custom monitoring attribute.
+
+        Arguments:
+            user: The user for whom overrides are loaded
+            course: The course XBlock the blocks belong to
+            blocks: A list of XBlocks in `course`
+        """
+        if cls.provider_classes is None:
+            cls.provider_classes = tuple(resolve_dotted(name) for name in settings.FIELD_OVERRIDE_PROVIDERS)
+
+        blocks = [block for block in blocks if block.location.course_key == course.id]
+        if not blocks:
+            return
+
+        prefetched = _prefetched_overrides()
+        for provider_class in cls._providers_for_course(course):
+            start = time.perf_counter()
+            overrides = provider_class(user, None).get_many(blocks)
+            if overrides is None:
+                continue
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            monitoring_utils.accumulate(f'field_overrides.{provider_class.__name__}.prefetch_ms', elapsed_ms)
+            monitoring_utils.accumulate(f'field_overrides.{provider_class.__name__}.prefetch_blocks', len(blocks))
+
+            cache_key = (provider_class, getattr(user, 'id', None), course.id)
+            prefetched.setdefault(cache_key, {}).update(overrides)
+
     def __init__(self, user, fallback, providers):  # pylint: disable=super-init-not-called
         self.fallback = fallback
+        self.user_id = getattr(user, 'id', None)
         self.providers = tuple(provider(user, fallback) for provider in providers)
 
     def get_override(self, block, name):
@@ -207,8 +280,18 @@ class OverrideFieldData(FieldData):
         Returns the overridden value or `NOTSET` if no override is found.
         """
         if not overrides_disabled():
+            location = getattr(block, 'location', None)
+            prefetched = DEFAULT_REQUEST_CACHE.data.get(PREFETCHED_OVERRIDES_KEY) if location else None
             for provider in self.providers:
-                value = provider.get(block, name, NOTSET)
+                block_overrides = None
+                if prefetched:
+                    provider_overrides = prefetched.get((type(provider), self.user_id, location.course_key))
+                    if provider_overrides is not None:
+                        block_overrides = provider_overrides.get(location)
+                if block_overrides is not None:
+                    value = block_overrides.get(name, NOTSET)
+                else:
+                    value = provider.get(block, name, NOTSET)
                 if value is not NOTSET:
                     return value
         return NOTSET
@@ -36,6 +36,7 @@ from xblock.exceptions import InvalidScopeError, KeyValueMultiSaveError
 from xblock.fields import Scope, UserScope
 from xblock.runtime import KeyValueStore
 
+from lms.djangoapps.courseware.field_overrides import OverrideFieldData
 from lms.djangoapps.courseware.user_state_client import DjangoXBlockUserStateClient
 from xmodule.modulestore.django import modulestore  # lint-amnesty, pylint: disable=wrong-import-order
 
@@ -711,6 +712,12 @@ class FieldDataCache:
         """
         Add all `blocks` to this FieldDataCache.
         """
+        course = next((block for block in blocks if block.category == 'course'), None)
+        if course is not None:
+            # Bulk load field overrides for the whole set of blocks, so that
+            # they aren't looked up one block at a time once the blocks are bound.
+            OverrideFieldData.prefetch(self.user, course, blocks)
+
         if self.user.is_authenticated:
             self.scorable_locations.update(block.location for block in blocks if block.has_score)
             for scope, fields in self._fields_to_cache(blocks).items():
@@ -22,6 +22,18 @@ class SelfPacedDateOverrideProvider(FieldOverrideProvider):
 
         return default
 
+    def get_many(self, blocks):
+        """
+        Remove the due dates of all of the given blocks, and the release
+        dates of all but the course, without touching the database.
+        """
+        overrides = {}
+        for block in blocks:
+            overrides[block.location] = {'due': None}
+            if block.category != 'course':
+                overrides[block.location]['start'] = None
+        return overrides
+
     @classmethod
     def enabled_for(cls, block):  # lint-amnesty, pylint: disable=arguments-differ
         """This provider is enabled for self-paced courses only."""
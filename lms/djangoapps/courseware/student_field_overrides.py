@@ -9,7 +9,7 @@ import json
 from lms.djangoapps.courseware.models import StudentFieldOverride
 from openedx.core.lib.xblock_utils import is_xblock_aside
 
-from .field_overrides import FieldOverrideProvider
+from .field_overrides import FieldOverrideProvider, clear_prefetched_overrides
 
 
 class IndividualStudentOverrideProvider(FieldOverrideProvider):
@@ -21,6 +21,12 @@ class IndividualStudentOverrideProvider(FieldOverrideProvider):
     def get(self, block, name, default):
         return get_override_for_user(self.user, block, name, default)
 
+    def get_many(self, blocks):
+        """
+        Load the user's overrides for all of the given blocks with one query.
+        """
+        return get_overrides_for_user_many(self.user, blocks)
+
     @classmethod
     def enabled_for(cls, course):  # pylint: disable=arguments-differ
         """This simple override provider is always enabled"""
@@ -69,6 +75,35 @@ def _get_overrides_for_user(user, block):
     return overrides
 
 
+def get_overrides_for_user_many(user, blocks):
+    """
+    Gets all of the individual student overrides for the given user and every
+    block in `blocks` with a single query.  Returns a dictionary mapping each
+    block's location to a dictionary of field override values keyed by field
+    name.
+    """
+    blocks_by_location = {block.location: block for block in blocks}
+    overrides = {location: {} for location in blocks_by_location}
+    if not blocks_by_location or user.id is None:
+        return overrides
+
+    # Only filter by course and student: listing every block's location would make the query as large as the
+    # course, and overrides for other blocks are skipped below.
+    course_keys = {location.course_key for location in blocks_by_location}
+    query = StudentFieldOverride.objects.filter(
+        course_id__in=course_keys,
+        student_id=user.id,
+    )
+    blocks_by_key = {str(location): block for location, block in blocks_by_location.items()}
+    for override in query:
+        block = blocks_by_key.get(str(override.location))
+        if block is None:
+            continue
+        field = block.fields[override.field]
+        overrides[block.location][override.field] = field.from_json(json.loads(override.value))
+    return overrides
+
+
 def override_field_for_user(user, block, name, value):
     """
     Overrides a field for the `user`.  `block` and `name` specify the block
@@ -83,6 +118,7 @@ def override_field_for_user(user, block, name, value):
     field = block.fields[name]
     override.value = json.dumps(field.to_json(value))
     override.save()
+    clear_prefetched_overrides()
 
 
 def clear_override_for_user(user, block, name):
@@ -100,3 +136,5 @@ def clear_override_for_user(user, block, name):
             field=name).delete()
     except StudentFieldOverride.DoesNotExist:
         pass
+    else:
+        clear_prefetched_overrides()
@@ -256,6 +256,39 @@ class AccessTestCase(LoginEnrollmentTestCase, ModuleStoreTestCase, MilestonesTes
             for obj in modules:
                 assert not bool(access.has_access(self.student, 'load', obj, course_key=self.course.id))
 
+    def test_has_access_bulk(self):
+        """
+        Tests that bulk access checks agree with individual access checks.
+        """
+        chapter = BlockFactory.create(category="chapter", parent_location=self.course.location)
+        hidden_chapter = BlockFactory.create(
+            category="chapter", parent_location=self.course.location, visible_to_staff_only=True
+        )
+        blocks = [chapter, hidden_chapter]
+        CourseEnrollmentFactory(user=self.student, course_id=self.course.id)
+
+        for user in [self.student, self.course_staff, self.anonymous_user]:
+            for action in ['load', 'staff']:
+                results = access.has_access_bulk(user, action, blocks, self.course.id)
+                assert set(results) == {chapter.location, hidden_chapter.location}
+                for block in blocks:
+                    assert bool(results[block.location]) == bool(
+                        access.has_access(user, action, block, self.course.id)
+                    )
+
+        assert access.has_access_bulk(self.student, 'load', []) == {}
+
+    def test_has_access_bulk_computes_user_facts_once(self):
+        """
+        Tests that the user role is computed once for all blocks of a bulk check.
+        """
+        chapters = [
+            BlockFactory.create(category="chapter", parent_location=self.course.location) for _ in range(3)
+        ]
+        with patch('lms.djangoapps.courseware.access.get_user_role', return_value='student') as mock_role:
+            access.has_access_bulk(self.student, 'load', chapters, self.course.id)
+        assert mock_role.call_count == 1
+
     @patch('lms.djangoapps.courseware.access.in_preview_mode', Mock(return_value=True))
     def test_has_access_with_preview_mode(self):
         """
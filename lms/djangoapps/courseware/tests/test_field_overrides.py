@@ -13,6 +13,7 @@ from ..field_overrides import (
     FieldOverrideProvider,
     OverrideFieldData,
     OverrideModulestoreFieldData,
+    clear_prefetched_overrides,
     disable_overrides,
     resolve_dotted
 )
@@ -43,6 +44,29 @@ class TestOverrideProvider(FieldOverrideProvider):
         return True
 
 
+class TestBulkOverrideProvider(FieldOverrideProvider):
+    """
+    A concrete implementation of `FieldOverrideProvider` supporting bulk
+    loading, which counts how often each lookup path is used.
+    """
+    get_calls = 0
+    get_many_calls = 0
+
+    def get(self, block, name, default):
+        TestBulkOverrideProvider.get_calls += 1
+        if name == 'display_name':
+            return 'single'
+        return default
+
+    def get_many(self, blocks):
+        TestBulkOverrideProvider.get_many_calls += 1
+        return {block.location: {'display_name': 'bulk'} for block in blocks}
+
+    @classmethod
+    def enabled_for(cls, course):  # pylint: disable=arguments-differ
+        return True
+
+
 class OverrideFieldBase(SharedModuleStoreTestCase):
     """
     Base class for field data override tests.  Using override_settings and
@@ -145,6 +169,54 @@ class OverrideModulestoreFieldDataTests(FieldOverrideTestMixin, OverrideFieldDat
         assert isinstance(data, DictFieldData)
 
 
+@override_settings(FIELD_OVERRIDE_PROVIDERS=(
+    'lms.djangoapps.courseware.tests.test_field_overrides.TestBulkOverrideProvider',))
+class OverrideFieldDataPrefetchTests(OverrideFieldBase):
+    """
+    Tests for `OverrideFieldData.prefetch`.
+    """
+
+    def setUp(self):
+        super().setUp()
+        OverrideFieldData.provider_classes = None
+        TestBulkOverrideProvider.get_calls = 0
+        TestBulkOverrideProvider.get_many_calls = 0
+        clear_prefetched_overrides()
+
+    def tearDown(self):
+        super().tearDown()
+        OverrideFieldData.provider_classes = None
+        clear_prefetched_overrides()
+
+    def make_one(self):
+        """
+        Factory method.
+        """
+        return OverrideFieldData.wrap(TESTUSER, self.course, DictFieldData({'display_name': 'original'}))
+
+    def test_get_without_prefetch(self):
+        data = self.make_one()
+        assert data.get(self.course, 'display_name') == 'single'
+        assert TestBulkOverrideProvider.get_calls == 1
+
+    def test_get_with_prefetch(self):
+        OverrideFieldData.prefetch(TESTUSER, self.course, [self.course])
+        data = self.make_one()
+        assert data.get(self.course, 'display_name') == 'bulk'
+        assert data.get(self.course, 'display_name') == 'bulk'
+        assert TestBulkOverrideProvider.get_many_calls == 1
+        assert TestBulkOverrideProvider.get_calls == 0
+        with disable_overrides():
+            assert data.get(self.course, 'display_name') == 'original'
+
+    def test_clear_prefetched_overrides(self):
+        OverrideFieldData.prefetch(TESTUSER, self.course, [self.course])
+        clear_prefetched_overrides()
+        data = self.make_one()
+        assert data.get(self.course, 'display_name') == 'single'
+        assert TestBulkOverrideProvider.get_calls == 1
+
+
 class ResolveDottedTests(unittest.TestCase):
     """
     Tests for `resolve_dotted`.
@@ -35,6 +35,21 @@ def clear_prefetched_course_and_subsection_grades(course_key):
     _PersistentCourseGrade.clear_prefetched_data(course_key)
 
 
+def get_passing_statuses_for_user(user_id, course_keys):
+    """
+    Returns a dict mapping each of the given course keys to whether the user
+    has a passing persisted grade in that course, using a single query.
+    Courses without a persisted grade are reported as not passing.
+    """
+    statuses = dict.fromkeys(course_keys, False)
+    grades = _PersistentCourseGrade.objects.filter(
+        user_id=user_id, course_id__in=course_keys
+    ).values_list('course_id', 'letter_grade')
+    for course_id, letter_grade in grades:
+        statuses[course_id] = letter_grade != ''
+    return statuses
+
+
 def get_recently_modified_grades(course_keys, start_date, end_date, users=None):
     """
     Returns a QuerySet of PersistentCourseGrade objects filtered by the input
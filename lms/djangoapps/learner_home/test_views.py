@@ -9,6 +9,7 @@ from urllib.parse import urlencode
 from uuid import uuid4
 
 import ddt
+from completion.test_utils import submit_completions_for_testing
 from django.conf import settings
 from django.urls import reverse
 from django.utils import timezone
@@ -24,6 +25,7 @@ from common.djangoapps.student.tests.factories import (
 )
 from common.djangoapps.util.course import get_encoded_course_sharing_utm_params
 from lms.djangoapps.bulk_email.models import Optout
+from lms.djangoapps.grades.models import PersistentCourseGrade
 from lms.djangoapps.learner_home.test_utils import (
     create_test_enrollment,
     random_string,
@@ -36,8 +38,10 @@ from lms.djangoapps.learner_home.views import (
     get_enrollments,
     get_enterprise_customer,
     get_platform_settings,
+    get_resume_urls_for_course_enrollments,
     get_suggested_courses,
     get_user_account_confirmation_info,
+    get_user_grade_passing_statuses,
     get_entitlements,
     get_social_share_settings,
     get_course_share_urls,
@@ -183,6 +187,70 @@ class TestGetEnrollments(SharedModuleStoreTestCase):
         self.assertEqual(course_mode_info, {})
 
 
+class TestGetUserGradePassingStatuses(SharedModuleStoreTestCase):
+    """Tests for get_user_grade_passing_statuses"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+
+    def _create_grade(self, enrollment, letter_grade):
+        PersistentCourseGrade.objects.create(
+            user_id=self.user.id,
+            course_id=enrollment.course_id,
+            grading_policy_hash="",
+            percent_grade=0.9 if letter_grade else 0.1,
+            letter_grade=letter_grade,
+        )
+
+    def test_bulk_passing_statuses(self):
+        # Given a passing, a failing and an ungraded enrollment
+        passing, failing, ungraded = [create_test_enrollment(self.user) for _ in range(3)]
+        self._create_grade(passing, "Pass")
+        self._create_grade(failing, "")
+
+        # When I request passing statuses, grades are read in a single query
+        with self.assertNumQueries(1):
+            statuses = get_user_grade_passing_statuses(self.user, [passing, failing, ungraded])
+
+        # Then only the course with a letter grade is passing
+        assert statuses == {
+            passing.course_id: True,
+            failing.course_id: False,
+            ungraded.course_id: False,
+        }
+
+
+class TestGetResumeUrlsForCourseEnrollments(SharedModuleStoreTestCase):
+    """Tests for get_resume_urls_for_course_enrollments"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+
+    def test_resume_urls(self):
+        # Given one started and one unstarted enrollment
+        started, unstarted = [create_test_enrollment(self.user) for _ in range(2)]
+        block_keys = [
+            started.course_id.make_usage_key("video", f"video_{number}")
+            for number in range(3)
+        ]
+        submit_completions_for_testing(self.user, block_keys)
+
+        # When I request resume urls, completions are resolved in a single query
+        with self.assertNumQueries(1):
+            resume_urls = get_resume_urls_for_course_enrollments(self.user, [started, unstarted])
+
+        # Then the started course resumes at the most recently completed block
+        assert resume_urls == {
+            started.course_id: reverse(
+                "jump_to",
+                kwargs={"course_id": started.course_id, "location": block_keys[-1]},
+            ),
+            unstarted.course_id: None,
+        }
+
+
 class TestGetEntitlements(SharedModuleStoreTestCase):
     """Tests for get_entitlements"""
 
@@ -5,8 +5,6 @@ Views for Learner Home
 import logging
 from collections import OrderedDict
 
-from completion.exceptions import UnavailableCompletionData
-from completion.utilities import get_key_to_last_completed_block
 from django.conf import settings
 from django.urls import reverse
 from edx_django_utils import monitoring as monitoring_utils
@@ -23,10 +21,7 @@ from rest_framework.views import APIView
 
 from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.edxmako.shortcuts import marketing_link
-from common.djangoapps.student.helpers import (
-    cert_info,
-    user_has_passing_grade_in_course,
-)
+from common.djangoapps.student.helpers import cert_info, get_keys_to_last_completed_blocks
 from common.djangoapps.student.views.dashboard import (
     complete_course_mode_info,
     credit_statuses,
@@ -43,9 +38,11 @@ from common.djangoapps.util.milestones_helpers import (
 )
 from lms.djangoapps.bulk_email.models import Optout
 from lms.djangoapps.bulk_email.models_api import is_bulk_email_feature_enabled
+from lms.djangoapps.certificates.api import certificate_statuses_for_student
 from lms.djangoapps.commerce.utils import EcommerceService
 from lms.djangoapps.courseware.access import administrative_accesses_to_course_for_user
 from lms.djangoapps.courseware.access_utils import check_course_open_for_learner
+from lms.djangoapps.grades.api import get_passing_statuses_for_user
 from lms.djangoapps.learner_home.serializers import (
     LearnerDashboardSerializer,
 )
@@ -234,11 +231,19 @@ def get_cert_statuses(user, course_enrollments):
 
     cert_statuses = {}
 
+    # Fetch the user's certificates for all enrolled courses in one query
+    # rather than one query per enrollment.
+    certificate_statuses = certificate_statuses_for_student(
+        user, [enrollment.course_id for enrollment in course_enrollments]
+    )
+
     for enrollment in course_enrollments:
         # APER-2171 - trying to get a cert for a deleted course can throw an exception
         # Wrap in exception handling to avoid this issue.
         try:
-            certificate_for_course = cert_info(user, enrollment)
+            certificate_for_course = cert_info(
+                user, enrollment, certificate_statuses[enrollment.course_id]
+            )
 
             if certificate_for_course:
                 cert_statuses[enrollment.course_id] = certificate_for_course
@@ -264,18 +269,18 @@ def get_resume_urls_for_course_enrollments(user, course_enrollments):
     in course structure for better performance.
     """
     resume_course_urls = OrderedDict()
+    last_completed_blocks = get_keys_to_last_completed_blocks(
+        user, [enrollment.course_id for enrollment in course_enrollments]
+    )
     for enrollment in course_enrollments:
+        # Courses the user hasn't started have no completion data, so jump URL will be None
         url_to_block = None
-        try:
-            block_key = get_key_to_last_completed_block(user, enrollment.course_id)
-            if block_key:
-                url_to_block = reverse(
-                    "jump_to",
-                    kwargs={"course_id": enrollment.course_id, "location": block_key},
-                )
-        except UnavailableCompletionData:
-            # This is acceptable, the user hasn't started the course so jump URL will be None
-            pass
+        block_key = last_completed_blocks.get(enrollment.course_id)
+        if block_key:
+            url_to_block = reverse(
+                "jump_to",
+                kwargs={"course_id": enrollment.course_id, "location": block_key},
+            )
         resume_course_urls[enrollment.course_id] = url_to_block
     return resume_course_urls
 
@@ -420,17 +425,18 @@ def get_audit_access_deadlines(user, course_enrollments):
 
 
 @function_trace("get_user_grade_passing_statuses")
-def get_user_grade_passing_statuses(course_enrollments):
+def get_user_grade_passing_statuses(user, course_enrollments):
     """
-    Get "passing" status for user in each course
+    Get "passing" status for user in each course, reading all of the user's
+    persisted course grades in a single query.
 
     Returns:
     - Dict {course_id: <boolean (True = Passing grade, False = Failing grade)>}
     """
-    return {
-        course_enrollment.course_id: user_has_passing_grade_in_course(course_enrollment)
-        for course_enrollment in course_enrollments
-    }
+    return get_passing_statuses_for_user(
+        user.id,
+        [course_enrollment.course_id for course_enrollment in course_enrollments],
+    )
 
 
 @function_trace("get_credit_statuses")
@@ -514,7 +520,7 @@ class InitializeView(APIView):  # pylint: disable=unused-argument
         )
 
         # Get grade passing status by course
-        grade_statuses = get_user_grade_passing_statuses(course_enrollments)
+        grade_statuses = get_user_grade_passing_statuses(user, course_enrollments)
 
         # Get cert status by course
         cert_statuses = get_cert_statuses(user, course_enrollments)
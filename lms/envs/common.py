@@ -1232,6 +1232,15 @@ TPA_AUTOMATIC_LOGOUT_ENABLED = False
 # Mako templating
 import tempfile  # pylint: disable=wrong-import-position,wrong-import-order
 MAKO_MODULE_DIR = os.path.join(tempfile.gettempdir(), 'mako_lms')
+# .. setting_name: MAKO_PRECOMPILED_TEMPLATES
+# .. setting_default: False
+# .. setting_description: Set to True when the Mako templates were precompiled into MAKO_MODULE_DIR with the
+#   compile_mako_templates management command, for example at build time. Template lookups then use the list of
+#   template files written by the command instead of checking the filesystem, and compiled templates are not
+#   checked for changes to their source files.
+# .. setting_warning: Changes to templates are not picked up until the command is run again and the processes are
+#   restarted.
+MAKO_PRECOMPILED_TEMPLATES = False
 MAKO_TEMPLATE_DIRS_BASE = [
     PROJECT_ROOT / 'templates',
     COMMON_ROOT / 'templates',
@@ -2,6 +2,9 @@
 # Template used to create cache keys for individual programs.
 PROGRAM_CACHE_KEY_TPL = 'program-{uuid}'
 
+# Template used to create cache keys for the ETag of each cached program's details.
+PROGRAM_ETAG_CACHE_KEY_TPL = 'program-etag-{uuid}'
+
 # Cache key used to locate an item containing a list of all program UUIDs for a site.
 SITE_PROGRAM_UUIDS_CACHE_KEY_TPL = 'program-uuids-{domain}'
 
@@ -4,18 +4,22 @@
 import logging
 import sys
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urljoin
 
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
 from django.core.cache import cache
 from django.core.management import BaseCommand
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from openedx.core.djangoapps.catalog.cache import (
     CATALOG_COURSE_PROGRAMS_CACHE_KEY_TPL,
     COURSE_PROGRAMS_CACHE_KEY_TPL,
     PATHWAY_CACHE_KEY_TPL,
     PROGRAM_CACHE_KEY_TPL,
+    PROGRAM_ETAG_CACHE_KEY_TPL,
     PROGRAMS_BY_ORGANIZATION_CACHE_KEY_TPL,
     PROGRAMS_BY_TYPE_CACHE_KEY_TPL,
     PROGRAMS_BY_TYPE_SLUG_CACHE_KEY_TPL,
@@ -34,6 +38,11 @@ from openedx.core.djangoapps.catalog.utils import (
 logger = logging.getLogger(__name__)
 User = get_user_model()  # pylint: disable=invalid-name
 
+DEFAULT_WORKERS = 8
+DEFAULT_RETRIES = 3
+RETRY_BACKOFF_FACTOR = 0.3
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 class Command(BaseCommand):
     """Management command used to cache program data.
@@ -42,6 +51,10 @@ class Command(BaseCommand):
     service, writing each to its own cache entry with an indefinite expiration.
     It is meant to be run on a scheduled basis and should be the only code
     updating these cache entries.
+
+    Program details are requested concurrently over a pool of keep-alive
+    connections, with retries for transient errors. Programs whose ETag is
+    unchanged since the last run are reused from the cache.
     """
     help = "Rebuild the LMS' cache of program data."
 
@@ -52,10 +65,26 @@ class Command(BaseCommand):
             type=str,
             help='Help in caching the programs for one site'
         )
+        parser.add_argument(
+            '--workers',
+            dest='workers',
+            type=int,
+            default=DEFAULT_WORKERS,
+            help='Number of program details to request from the catalog at once'
+        )
+        parser.add_argument(
+            '--retries',
+            dest='retries',
+            type=int,
+            default=DEFAULT_RETRIES,
+            help='Number of times to retry a catalog request that fails with a transient error'
+        )
 
     # lint-amnesty, pylint: disable=bad-option-value, unicode-format-string
     def handle(self, *args, **options):  # lint-amnesty, pylint: disable=too-many-statements
         domain = options.get('domain', '')
+        workers = max(options.get('workers') or DEFAULT_WORKERS, 1)
+        retries = options.get('retries', DEFAULT_RETRIES)
         failure = False
         logger.info('populate-multitenant-programs switch is ON')
 
@@ -71,6 +100,7 @@ class Command(BaseCommand):
             raise
 
         programs = {}
+        program_etags = {}
         pathways = {}
         courses = {}
         catalog_courses = {}
@@ -88,9 +118,12 @@ class Command(BaseCommand):
                 continue
 
             client = get_catalog_api_client(user)
+            self.configure_client(client, workers, retries)
             api_base_url = get_catalog_api_base_url(site=site)
             uuids, program_uuids_failed = self.get_site_program_uuids(client, site, api_base_url)
-            new_programs, program_details_failed = self.fetch_program_details(client, uuids, api_base_url)
+            new_programs, new_program_etags, program_details_failed = self.fetch_program_details(
+                client, uuids, api_base_url, workers=workers
+            )
             new_pathways, pathways_failed = self.get_pathways(client, site, api_base_url)
             new_pathways, new_programs, pathway_processing_failed = self.process_pathways(
                 site, new_pathways, new_programs
@@ -104,6 +137,7 @@ class Command(BaseCommand):
             ])
 
             programs.update(new_programs)
+            program_etags.update(new_program_etags)
             pathways.update(new_pathways)
             courses.update(self.get_courses(new_programs))
             catalog_courses.update(self.get_catalog_courses(new_programs))
@@ -126,6 +160,8 @@ class Command(BaseCommand):
 
         logger.info(f'Caching details for {len(programs)} programs.')
         cache.set_many(programs, None)
+        # Only remember ETags once the programs they describe are cached.
+        cache.set_many(program_etags, None)
 
         logger.info(f'Caching details for {len(pathways)} pathways.')
         cache.set_many(pathways, None)
@@ -172,25 +208,78 @@ class Command(BaseCommand):
         ))
         return uuids, failure
 
-    def fetch_program_details(self, client, uuids, api_base_url):  # lint-amnesty, pylint: disable=missing-function-docstring
+    def configure_client(self, client, workers, retries):
+        """
+        Give the client a connection pool big enough for all workers, which
+        retries transient errors with exponential backoff.
+        """
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=workers,
+            pool_block=True,
+            max_retries=Retry(
+                total=retries,
+                backoff_factor=RETRY_BACKOFF_FACTOR,
+                status_forcelist=RETRY_STATUSES,
+                allowed_methods=frozenset(['GET']),
+                # Hand back the last response, so raise_for_status reports it.
+                raise_on_status=False,
+            ),
+        )
+        client.mount('http://', adapter)
+        client.mount('https://', adapter)
+
+    def fetch_program_details(self, client, uuids, api_base_url, workers=DEFAULT_WORKERS):
+        """
+        Request the details of every program, `workers` at a time.
+
+        Returns the programs keyed by cache key, the ETags of the responses
+        keyed by ETag cache key, and whether any request failed. When a
+        program is already cached along with its ETag, the request is made
+        conditional, and the cached program is reused if it hasn't changed.
+        """
         programs = {}
+        etags = {}
         failure = False
-        for uuid in uuids:
-            try:
-                cache_key = PROGRAM_CACHE_KEY_TPL.format(uuid=uuid)
-                logger.info(f'Requesting details for program {uuid}.')
-                api_url = urljoin(f"{api_base_url}/", f"programs/{uuid}/")
-                response = client.get(api_url, params={"exclude_utm": 1})
-                response.raise_for_status()
-                program = response.json()
+
+        cached_programs = cache.get_many([PROGRAM_CACHE_KEY_TPL.format(uuid=uuid) for uuid in uuids])
+        cached_etags = cache.get_many([PROGRAM_ETAG_CACHE_KEY_TPL.format(uuid=uuid) for uuid in uuids])
+
+        def fetch(uuid):
+            """
+            Return the program's details and ETag, from the catalog or the cache.
+            """
+            cached_program = cached_programs.get(PROGRAM_CACHE_KEY_TPL.format(uuid=uuid))
+            cached_etag = cached_etags.get(PROGRAM_ETAG_CACHE_KEY_TPL.format(uuid=uuid))
+            headers = {}
+            if cached_program is not None and cached_etag:
+                headers['If-None-Match'] = cached_etag
+
+            logger.info(f'Requesting details for program {uuid}.')
+            api_url = urljoin(f"{api_base_url}/", f"programs/{uuid}/")
+            response = client.get(api_url, params={"exclude_utm": 1}, headers=headers)
+            if response.status_code == 304:
+                return cached_program, cached_etag
+            response.raise_for_status()
+            return response.json(), response.headers.get('ETag')
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [(uuid, executor.submit(fetch, uuid)) for uuid in uuids]
+            # Collect the results in order, so that the cached lists built
+            # from them don't depend on which requests finish first.
+            for uuid, future in futures:
+                try:
+                    program, etag = future.result()
+                except:  # pylint: disable=bare-except
+                    logger.exception(f'Failed to retrieve details for program {uuid}.')
+                    failure = True
+                    continue
                 # pathways get added in process_pathways
                 program['pathway_ids'] = []
-                programs[cache_key] = program
-            except:  # pylint: disable=bare-except
-                logger.exception(f'Failed to retrieve details for program {uuid}.')
-                failure = True
-                continue
-        return programs, failure
+                programs[PROGRAM_CACHE_KEY_TPL.format(uuid=uuid)] = program
+                if etag:
+                    etags[PROGRAM_ETAG_CACHE_KEY_TPL.format(uuid=uuid)] = etag
+        return programs, etags, failure
 
     def get_pathways(self, client, site, api_base_url):
         """
@@ -13,6 +13,7 @@ from openedx.core.djangoapps.catalog.cache import (
     PROGRAMS_BY_ORGANIZATION_CACHE_KEY_TPL,
     PATHWAY_CACHE_KEY_TPL,
     PROGRAM_CACHE_KEY_TPL,
+    PROGRAM_ETAG_CACHE_KEY_TPL,
     PROGRAMS_BY_TYPE_CACHE_KEY_TPL,
     PROGRAMS_BY_TYPE_SLUG_CACHE_KEY_TPL,
     SITE_PATHWAY_IDS_CACHE_KEY_TPL,
@@ -115,7 +116,7 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
             content_type='application/json'
         )
 
-    def mock_detail(self, uuid, program):
+    def mock_detail(self, uuid, program, etag=None):
         """ Mock the data returned by the program detail API endpoint. """
         # pylint: disable=unused-argument
         def detail_callback(request, uri, headers):
@@ -125,6 +126,10 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
             }
             assert request.querystring == expected
 
+            if etag:
+                if request.headers.get('If-None-Match') == etag:
+                    return (304, headers, '')
+                headers['ETag'] = etag
             return (200, headers, json.dumps(program))
 
         httpretty.register_uri(
@@ -253,6 +258,44 @@ class TestCachePrograms(CatalogIntegrationMixin, CacheIsolationTestCase, SiteMix
                 )
                 assert program['uuid'] in cache.get(organization_cache_key)
 
+    def test_handle_unchanged_programs(self):
+        """
+        Verify that programs whose ETag hasn't changed are requested
+        conditionally, and stay cached without being downloaded again.
+        """
+        UserFactory(username=self.catalog_integration.service_username)
+
+        programs = {
+            PROGRAM_CACHE_KEY_TPL.format(uuid=program['uuid']): program for program in self.programs
+        }
+
+        self.mock_list()
+        self.mock_pathways(self.pathways)
+
+        for uuid in self.uuids[self.site_domain]:
+            program = programs[PROGRAM_CACHE_KEY_TPL.format(uuid=uuid)]
+            self.mock_detail(uuid, program, etag=f'"{uuid}"')
+
+        call_command('cache_programs', f'--domain={self.site_domain}')
+        assert cache.get(PROGRAM_ETAG_CACHE_KEY_TPL.format(uuid=self.programs[0]['uuid'])) == \
+            f'"{self.programs[0]["uuid"]}"'
+
+        num_requests = len(httpretty.latest_requests())
+        call_command('cache_programs', f'--domain={self.site_domain}')
+
+        detail_requests = [
+            request for request in httpretty.latest_requests()[num_requests:]
+            if request.path.startswith('/api/v1/programs/') and 'uuids_only' not in request.querystring
+        ]
+        assert detail_requests
+        assert all(request.headers.get('If-None-Match') for request in detail_requests)
+
+        cached_programs = cache.get_many(list(programs.keys()))
+        assert set(cached_programs) == set(programs)
+        for key, program in cached_programs.items():
+            del program['pathway_ids']
+            assert program == programs[key]
+
     def test_handle_pathways(self):
         """
         Verify that the command requests and caches credit pathways
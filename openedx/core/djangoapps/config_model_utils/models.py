@@ -7,8 +7,10 @@ StackedConfigurationModel: A ConfigurationModel that can be overridden at site,
 # -*- coding: utf-8 -*-
 
 
-from collections import defaultdict
+from collections import OrderedDict, defaultdict
 from enum import Enum
+from threading import Lock
+from uuid import uuid4
 
 import crum
 from config_models.models import ConfigurationModel, cache
@@ -16,14 +18,35 @@ from django.conf import settings
 from django.contrib.sites.models import Site
 from django.contrib.sites.requests import RequestSite
 from django.core.exceptions import ValidationError
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
 from django.utils.translation import gettext_lazy as _
+from edx_django_utils.cache import RequestCache
+from edx_toggles.toggles import SettingToggle
 
 from openedx.core.djangoapps.content.course_overviews.models import CourseOverview
 from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
 from openedx.core.lib.cache_utils import request_cached
 
+# .. toggle_name: STACKED_CONFIG_RESOLUTION_TABLES
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, StackedConfigurationModel.current is resolved from a table of all current
+#   overrides of the model that each process keeps in memory, instead of from the cache and the database. The tables
+#   are reloaded after any override of the model is saved or deleted, in any process, rather than when the cached
+#   value of the changed level expires.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+STACKED_CONFIG_RESOLUTION_TABLES = SettingToggle(
+    'STACKED_CONFIG_RESOLUTION_TABLES', default=False, module_name=__name__
+)
+
+RESOLUTION_TABLE_VERSION_NAMESPACE = 'config_model_utils.resolution_table'
+# The number of resolved lookups each resolution table remembers.
+RESOLUTION_TABLE_MEMO_SIZE = 4096
+
+_resolution_tables = {}
+
 
 class Provenance(Enum):
     """
@@ -156,11 +179,13 @@ class StackedConfigurationModel(ConfigurationModel):
             specified down to the level of the supplied argument (or global values if
             no arguments are supplied).
         """
-        cache_key_name = cls.cache_key_name(site, org, org_course, course_key)
-        cached = cache.get(cache_key_name)
+        use_resolution_table = STACKED_CONFIG_RESOLUTION_TABLES.is_enabled()
+        if not use_resolution_table:
+            cache_key_name = cls.cache_key_name(site, org, org_course, course_key)
+            cached = cache.get(cache_key_name)
 
-        if cached is not None:
-            return cached
+            if cached is not None:
+                return cached
 
         # Raise an error if more than one of site/org/course are specified simultaneously.
         if len([arg for arg in [site, org, org_course, course_key] if arg is not None]) > 1:
@@ -172,6 +197,13 @@ class StackedConfigurationModel(ConfigurationModel):
         if org is None and org_course is not None:
             org = cls._org_from_org_course(org_course)
 
+        if use_resolution_table:
+            resolution_table = cls._resolution_table()
+            # Finding the site of an org is only worth it if any site has an override.
+            if site is None and org is not None and resolution_table.has_site_overrides:
+                site = cls._site_from_org(org)
+            return resolution_table.resolve(getattr(site, 'id', None), org, org_course, course_key)
+
         if site is None and org is not None:
             site = cls._site_from_org(org)
 
@@ -264,6 +296,23 @@ class StackedConfigurationModel(ConfigurationModel):
             for org in (orgs if isinstance(orgs, list) else [orgs])
         })
 
+        if STACKED_CONFIG_RESOLUTION_TABLES.is_enabled():
+            resolution_table = cls._resolution_table()
+            all_course_configs = {}
+            for course in all_courses:
+                org_course = cls._org_course_from_course_key(course.id)
+                current = resolution_table.resolve(
+                    getattr(sites_by_org[course.id.org], 'id', None),
+                    cls._org_from_org_course(org_course),
+                    org_course,
+                    course.id,
+                )
+                all_course_configs[course.id] = {
+                    field_name: (getattr(current, field_name), provenance)
+                    for field_name, provenance in current.provenances.items()
+                }
+            return all_course_configs
+
         all_overrides = cls.objects.current_set()
         overrides = {
             (override.site_id, override.org, override.org_course, override.course_id): override
@@ -316,6 +365,27 @@ class StackedConfigurationModel(ConfigurationModel):
 
         return super().cache_key_name(site_id, org, org_course, course_key)
 
+    @classmethod
+    def _resolution_table(cls):
+        """
+        Returns the StackedConfigurationResolutionTable of this model, loading
+        it if this process doesn't have the current version yet.
+        """
+        version = _get_resolution_table_version(cls._meta.label)
+        resolution_table = _resolution_tables.get(cls)
+        if resolution_table is None or resolution_table.version != version:
+            resolution_table = _resolution_tables[cls] = StackedConfigurationResolutionTable(cls, version)
+        return resolution_table
+
+    def save(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super().save(*args, **kwargs)
+        _invalidate_resolution_table(self._meta.label)
+
+    def delete(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        result = super().delete(*args, **kwargs)
+        _invalidate_resolution_table(self._meta.label)
+        return result
+
     @classmethod
     def _org_from_org_course(cls, org_course):
         return org_course.partition('+')[0]
@@ -343,3 +413,119 @@ class StackedConfigurationModel(ConfigurationModel):
             raise ValidationError(
                 _('Configuration may not be specified at more than one level at once.')
             )
+
+
+class StackedConfigurationResolutionTable:
+    """
+    All current overrides of a StackedConfigurationModel at one version,
+    indexed by level, with the most recently resolved values.
+
+    The resolved values are shared by all callers in the process, so every
+    lookup returns a new model instance built from them.
+    """
+
+    def __init__(self, model, version):
+        self.model = model
+        self.version = version
+        self.overrides = {
+            (override.site_id, override.org, override.org_course, override.course_id): override
+            for override in model.objects.current_set()
+        }
+        self.has_site_overrides = any(site_id is not None for site_id, _, _, _ in self.overrides)
+        self.stackable_fields = [model._meta.get_field(field_name) for field_name in model.STACKABLE_FIELDS]
+        self.field_defaults = {
+            field.name: field.get_default()
+            for field in self.stackable_fields
+        }
+        self._resolved = OrderedDict()
+        self._resolved_lock = Lock()
+
+    def resolve(self, site_id, org, org_course, course_key):
+        """
+        Returns an instance of the model with the values and provenances
+        stacked from the given levels, like StackedConfigurationModel.current.
+        """
+        resolved_key = (site_id, org, org_course, course_key)
+        with self._resolved_lock:
+            resolved = self._resolved.get(resolved_key)
+            if resolved is not None:
+                self._resolved.move_to_end(resolved_key)
+        if resolved is None:
+            resolved = self._resolve(site_id, org, org_course, course_key)
+            with self._resolved_lock:
+                self._resolved[resolved_key] = resolved
+                if len(self._resolved) > RESOLUTION_TABLE_MEMO_SIZE:
+                    self._resolved.popitem(last=False)
+
+        values, provenances = resolved
+        current = self.model(**values)
+        current.provenances = dict(provenances)  # pylint: disable=attribute-defined-outside-init
+        return current
+
+    def _resolve(self, site_id, org, org_course, course_key):
+        """
+        Returns the values and provenances stacked from the given levels.
+        """
+        # Levels in increasing specificity.
+        levels = [((None, None, None, None), Provenance.global_)]
+        if site_id is not None:
+            levels.append(((site_id, None, None, None), Provenance.site))
+        if org is not None:
+            levels.append(((None, org, None, None), Provenance.org))
+        if org_course is not None:
+            levels.append(((None, None, org_course, None), Provenance.org_course))
+        if course_key is not None:
+            levels.append(((None, None, None, course_key), Provenance.run))
+
+        values = self.field_defaults.copy()
+        provenances = {field.name: Provenance.default for field in self.stackable_fields}
+        for override_key, provenance in levels:
+            override = self.overrides.get(override_key)
+            if override is None:
+                continue
+            for field in self.stackable_fields:
+                value = field.value_from_object(override)
+                if value != self.field_defaults[field.name]:
+                    values[field.name] = value
+                    provenances[field.name] = provenance
+
+        return values, provenances
+
+
+def _resolution_table_version_cache_key(model_label):
+    return f'config_model_utils.resolution_table.{model_label}.version'
+
+
+@request_cached(RESOLUTION_TABLE_VERSION_NAMESPACE)
+def _get_resolution_table_version(model_label):
+    """
+    Returns the current version of the model's resolution tables, which is
+    checked at most once per request.
+    """
+    cache_key = _resolution_table_version_cache_key(model_label)
+    version = cache.get(cache_key)
+    if version is None:
+        cache.add(cache_key, uuid4().hex, None)
+        version = cache.get(cache_key)
+    return version
+
+
+def _invalidate_resolution_table(model_label):
+    """
+    Changes the version of the model's resolution tables, so that all processes
+    reload them.
+
+    The version is changed again once the current transaction commits, so that
+    a process which reloaded the tables before the change was committed doesn't
+    keep the old overrides.
+    """
+    _bump_resolution_table_version(model_label)
+    transaction.on_commit(lambda: _bump_resolution_table_version(model_label))
+
+
+def _bump_resolution_table_version(model_label):
+    """
+    Replaces the version of the model's resolution tables with a new one.
+    """
+    cache.set(_resolution_table_version_cache_key(model_label), uuid4().hex, None)
+    RequestCache(RESOLUTION_TABLE_VERSION_NAMESPACE).clear()
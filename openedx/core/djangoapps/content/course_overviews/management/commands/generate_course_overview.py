@@ -6,6 +6,8 @@ Command to load course overviews.
 import logging
 
 from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from opaque_keys import InvalidKeyError
 
 from openedx.core.djangoapps.content.course_overviews.tasks import (
@@ -23,6 +25,14 @@ class Command(BaseCommand):
     Example usage:
         $ ./manage.py lms generate_course_overview --all-courses --settings=devstack --chunk-size=100
         $ ./manage.py lms generate_course_overview 'edX/DemoX/Demo_Course' --settings=devstack
+
+    Regenerate every course after a CourseOverview.VERSION bump, with at most 8
+    chunks loading from the modulestore at once:
+        $ ./manage.py lms generate_course_overview --all-courses --skip-up-to-date --max-concurrency=8
+
+    Resume an interrupted forced run, skipping courses it already regenerated:
+        $ ./manage.py lms generate_course_overview --all-courses --force-update \
+            --updated-since=2026-10-19T08:00:00Z
     """
     args = '<course_id course_id ...>'
     help = 'Generates and stores course overview for one or more courses.'
@@ -56,15 +66,44 @@ class Command(BaseCommand):
             dest='routing_key',
             help='The celery routing key to use.'
         )
+        parser.add_argument(
+            '--skip-up-to-date',
+            dest='skip_up_to_date',
+            action='store_true',
+            help='Skip courses whose stored course overview is already at the current version.'
+        )
+        parser.add_argument(
+            '--updated-since',
+            dest='updated_since',
+            help=(
+                'Skip courses whose course overview was updated at or after this ISO 8601 datetime. '
+                'Pass the start time logged by an interrupted run to resume it.'
+            )
+        )
+        parser.add_argument(
+            '--max-concurrency',
+            dest='max_concurrency',
+            type=int,
+            help='Run the chunks as this many sequential celery chains, bounding concurrent modulestore loads.'
+        )
 
     def handle(self, *args, **options):
         if not options.get('all_courses') and len(args) < 1:
             raise CommandError('At least one course or --all-courses must be specified.')
 
         kwargs = {}
-        for key in ('all_courses', 'force_update', 'chunk_size', 'routing_key'):
+        for key in ('all_courses', 'force_update', 'chunk_size', 'routing_key', 'skip_up_to_date', 'max_concurrency'):
             if options.get(key):
                 kwargs[key] = options[key]
+        if options.get('updated_since'):
+            kwargs['updated_since'] = parse_datetime(options['updated_since'])
+            if kwargs['updated_since'] is None:
+                raise CommandError('Invalid --updated-since datetime: ' + options['updated_since'])
+
+        log.info(
+            'Enqueuing course overview generation at %s; pass this as --updated-since to resume.',
+            timezone.now().isoformat(),
+        )
 
         try:
             enqueue_async_course_overview_update_tasks(
@@ -110,3 +110,31 @@ class TestGenerateCourseOverview(ModuleStoreTestCase):
                sorted(called_kwargs.pop('args'))
         assert {'kwargs': {'force_update': True}, 'routing_key': 'my-routing-key'} == called_kwargs
         assert 1 == mock_async_task.apply_async.call_count
+
+    def test_skip_up_to_date(self):
+        self.command.handle(str(self.course_key_1), all_courses=False)
+
+        with patch.object(CourseOverview, 'update_select_courses') as mock_update:
+            self.command.handle(all_courses=True, force_update=True, skip_up_to_date=True)
+
+        mock_update.assert_called_once_with([self.course_key_2], force_update=True)
+
+    def test_updated_since(self):
+        self.command.handle(all_courses=True)
+        resume_point = CourseOverview.objects.get(id=self.course_key_2).modified.isoformat()
+
+        with patch.object(CourseOverview, 'update_select_courses') as mock_update:
+            self.command.handle(all_courses=True, force_update=True, updated_since=resume_point)
+
+        updated_keys = mock_update.call_args[0][0]
+        assert self.course_key_2 not in updated_keys
+
+    @patch('openedx.core.djangoapps.content.course_overviews.tasks.chain')
+    @patch('openedx.core.djangoapps.content.course_overviews.tasks.async_course_overview_update')
+    def test_max_concurrency(self, mock_async_task, mock_chain):
+        self.command.handle(all_courses=True, chunk_size=1, max_concurrency=1)
+
+        assert not mock_async_task.apply_async.called
+        assert 2 == mock_async_task.si.call_count
+        assert 1 == mock_chain.call_count
+        assert 2 == len(mock_chain.call_args[0])
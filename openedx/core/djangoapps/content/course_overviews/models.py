@@ -12,6 +12,7 @@ import pytz
 from ccx_keys.locator import CCXLocator
 from config_models.models import ConfigurationModel
 from django.conf import settings
+from django.core.cache import cache
 from django.db import models, transaction
 from django.db.models import Q
 from django.db.models.signals import post_save, post_delete
@@ -19,6 +20,7 @@ from django.db.utils import IntegrityError
 from django.template import defaultfilters
 
 from django.utils.functional import cached_property
+from edx_toggles.toggles import SettingToggle
 from model_utils.models import TimeStampedModel
 from opaque_keys.edx.django.models import CourseKeyField, UsageKeyField
 from simple_history.models import HistoricalRecords
@@ -37,6 +39,36 @@ from xmodule.tabs import CourseTab  # lint-amnesty, pylint: disable=wrong-import
 
 log = logging.getLogger(__name__)
 
+# .. toggle_name: ENABLE_COURSE_OVERVIEW_CACHE
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, CourseOverviews (with their image set and tabs) are kept in the
+#   django cache, keyed by course id and CourseOverview.VERSION, so that get_from_id and get_from_ids
+#   avoid database queries. Entries are deleted whenever an overview or its image set is saved or deleted.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_warning: Overviews changed with queryset updates are not invalidated and are served from the
+#   cache until COURSE_OVERVIEW_CACHE_TIMEOUT expires.
+COURSE_OVERVIEW_CACHE = SettingToggle('ENABLE_COURSE_OVERVIEW_CACHE', default=False, module_name=__name__)
+
+# .. toggle_name: ENABLE_ASYNC_COURSE_OVERVIEW_REGENERATION
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, CourseOverview.get_from_ids returns overviews stored with an older
+#   VERSION as they are and regenerates them in a celery task, instead of reloading each course from the
+#   modulestore inside the request. Overviews that do not exist at all are still created synchronously.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+ASYNC_COURSE_OVERVIEW_REGENERATION = SettingToggle(
+    'ENABLE_ASYNC_COURSE_OVERVIEW_REGENERATION', default=False, module_name=__name__
+)
+
+COURSE_OVERVIEW_CACHE_TIMEOUT = 60 * 60
+
+# How long an enqueued regeneration of an outdated overview keeps other requests
+# from enqueuing it again.
+COURSE_OVERVIEW_REGENERATION_TIMEOUT = 5 * 60
+
 
 class CourseOverviewCaseMismatchException(Exception):
     pass
@@ -400,6 +432,11 @@ class CourseOverview(TimeStampedModel):
             - IOError if some other error occurs while trying to load the
                 course from the module store.
         """
+        if COURSE_OVERVIEW_CACHE.is_enabled():
+            course_overview = cache.get(cls._cache_key(course_id))
+            if course_overview is not None:
+                return course_overview
+
         try:
             course_overview = cls.objects.select_related('image_set').get(id=course_id)
             if course_overview.version < cls.VERSION:
@@ -414,7 +451,10 @@ class CourseOverview(TimeStampedModel):
         if course_overview and not hasattr(course_overview, 'image_set'):
             CourseOverviewImageSet.create(course_overview)
 
-        return course_overview or cls.load_from_module_store(course_id)
+        course_overview = course_overview or cls.load_from_module_store(course_id)
+        if COURSE_OVERVIEW_CACHE.is_enabled():
+            cls._cache_overviews([course_overview])
+        return course_overview
 
     @classmethod
     def get_from_ids(cls, course_ids):
@@ -431,13 +471,41 @@ class CourseOverview(TimeStampedModel):
 
         Returns: dict[CourseKey, CourseOverview|None]
         """
-        overviews = {
-            overview.id: overview
-            for overview in cls.objects.select_related('image_set').filter(
-                id__in=course_ids,
-                version__gte=cls.VERSION
-            )
-        }
+        course_ids = list(course_ids)
+        use_cache = COURSE_OVERVIEW_CACHE.is_enabled()
+        overviews = {}
+        if use_cache:
+            cached = cache.get_many([cls._cache_key(course_id) for course_id in course_ids])
+            overviews = {
+                course_id: cached[cls._cache_key(course_id)]
+                for course_id in course_ids
+                if cls._cache_key(course_id) in cached
+            }
+
+        uncached_ids = [course_id for course_id in course_ids if course_id not in overviews]
+        if uncached_ids:
+            fetched = cls.objects.select_related('image_set').prefetch_related('tab_set').filter(id__in=uncached_ids)
+            if not ASYNC_COURSE_OVERVIEW_REGENERATION.is_enabled():
+                fetched = fetched.filter(version__gte=cls.VERSION)
+            fetched = list(fetched)
+            # Serve the outdated overviews for now; they are regenerated in the background.
+            # Only the request that sets a course's regeneration marker enqueues its task, so
+            # that concurrent requests don't each enqueue one.
+            outdated_ids = [
+                str(overview.id) for overview in fetched
+                if overview.version < cls.VERSION and cache.add(
+                    cls._regeneration_marker_key(overview.id), True, COURSE_OVERVIEW_REGENERATION_TIMEOUT
+                )
+            ]
+            if outdated_ids:
+                from openedx.core.djangoapps.content.course_overviews.tasks import (
+                    enqueue_async_course_overview_update_tasks,
+                )
+                enqueue_async_course_overview_update_tasks(outdated_ids, force_update=True)
+            if use_cache:
+                cls._cache_overviews(overview for overview in fetched if overview.version >= cls.VERSION)
+            overviews.update((overview.id, overview) for overview in fetched)
+
         for course_id in course_ids:
             if course_id not in overviews:
                 try:
@@ -446,6 +514,42 @@ class CourseOverview(TimeStampedModel):
                     overviews[course_id] = None
         return overviews
 
+    @classmethod
+    def _cache_key(cls, course_id):
+        """
+        Returns the django cache key for the given course's overview.
+        """
+        return f'course_overview.{cls.VERSION}.{course_id}'
+
+    @classmethod
+    def _regeneration_marker_key(cls, course_id):
+        """
+        Returns the django cache key marking the given course's overview as
+        being regenerated.
+        """
+        return f'course_overview.regenerating.{course_id}'
+
+    @classmethod
+    def _cache_overviews(cls, overviews):
+        """
+        Stores the given overviews in the django cache.
+        """
+        cache.set_many(
+            {cls._cache_key(overview.id): overview for overview in overviews},
+            COURSE_OVERVIEW_CACHE_TIMEOUT,
+        )
+
+    @classmethod
+    def invalidate_cache(cls, course_id):
+        """
+        Deletes the given course's overview from the django cache, and again
+        once the current transaction (if any) commits, so that an overview
+        re-cached by another process before the commit does not linger.
+        """
+        cache_key = cls._cache_key(course_id)
+        cache.delete(cache_key)
+        transaction.on_commit(lambda: cache.delete(cache_key))
+
     @classmethod
     def _get_course_has_highlights(cls, course):
         # Avoid circular import here
@@ -713,7 +817,10 @@ class CourseOverview(TimeStampedModel):
         """
         Returns an iterator of CourseTabs.
         """
-        for tab_dict in self.tab_set.all().values():
+        # Iterate the related objects, rather than .values(), so that tabs
+        # prefetched by get_from_ids don't cost another query.
+        for tab_model in self.tab_set.all():
+            tab_dict = {field.attname: getattr(tab_model, field.attname) for field in tab_model._meta.concrete_fields}
             tab = CourseTab.from_json(tab_dict)
             if tab is None:
                 log.warning("Can't instantiate CourseTab from %r", tab_dict)
@@ -1141,7 +1248,19 @@ def _invalidate_overview_cache(**kwargs):  # pylint: disable=unused-argument
     RequestCache('course_overview').clear()
 
 
+def _invalidate_cached_overview(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Invalidate the cached copy of a saved or deleted course overview.
+    """
+    course_id = instance.id if sender is CourseOverview else instance.course_overview_id
+    CourseOverview.invalidate_cache(course_id)
+
+
 post_save.connect(_invalidate_overview_cache, sender=CourseOverview)
 post_save.connect(_invalidate_overview_cache, sender=CourseOverviewImageConfig)
 post_delete.connect(_invalidate_overview_cache, sender=CourseOverview)
 post_delete.connect(_invalidate_overview_cache, sender=CourseOverviewImageConfig)
+post_save.connect(_invalidate_cached_overview, sender=CourseOverview)
+post_save.connect(_invalidate_cached_overview, sender=CourseOverviewImageSet)
+post_delete.connect(_invalidate_cached_overview, sender=CourseOverview)
+post_delete.connect(_invalidate_cached_overview, sender=CourseOverviewImageSet)
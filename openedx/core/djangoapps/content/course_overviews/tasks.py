@@ -2,7 +2,7 @@
 
 import logging
 
-from celery import shared_task
+from celery import chain, shared_task
 from celery_utils.persist_on_failure import LoggedPersistOnFailureTask
 from django.conf import settings
 from edx_django_utils.monitoring import set_code_owner_attribute
@@ -20,6 +20,9 @@ DEFAULT_CHUNK_SIZE = 50
 
 DEFAULT_FORCE_UPDATE = False
 
+# Number of course keys checked against stored overviews per query.
+FILTER_BATCH_SIZE = 1000
+
 
 def chunks(sequence, chunk_size):
     return (sequence[index: index + chunk_size] for index in range(0, len(sequence), chunk_size))
@@ -34,22 +37,68 @@ def _task_options(routing_key):  # lint-amnesty, pylint: disable=missing-functio
     return task_options
 
 
-def enqueue_async_course_overview_update_tasks(  # lint-amnesty, pylint: disable=missing-function-docstring
+def _filter_course_keys(course_keys, skip_up_to_date=False, updated_since=None):
+    """
+    Drops course keys whose stored overview needs no regeneration: those
+    already at the current CourseOverview.VERSION (if skip_up_to_date) and
+    those updated at or after updated_since (if given), which is how an
+    interrupted run is resumed.
+    """
+    if not skip_up_to_date and not updated_since:
+        return course_keys
+
+    skipped = set()
+    for course_key_group in chunks(course_keys, FILTER_BATCH_SIZE):
+        overviews = CourseOverview.objects.filter(id__in=course_key_group)
+        if skip_up_to_date:
+            overviews = overviews.filter(version__gte=CourseOverview.VERSION)
+        if updated_since:
+            overviews = overviews.filter(modified__gte=updated_since)
+        skipped.update(overviews.values_list('id', flat=True))
+
+    log.info('Skipping %d of %d courses whose course overview is up to date.', len(skipped), len(course_keys))
+    return [course_key for course_key in course_keys if course_key not in skipped]
+
+
+def enqueue_async_course_overview_update_tasks(
         course_ids,
         all_courses=False,
         force_update=False,
         chunk_size=DEFAULT_CHUNK_SIZE,
-        routing_key=None
+        routing_key=None,
+        skip_up_to_date=False,
+        updated_since=None,
+        max_concurrency=None,
 ):
+    """
+    Enqueues celery tasks that generate course overviews, chunk_size courses per task.
+
+    When max_concurrency is given, the chunks are split into that many celery
+    chains, so no more than max_concurrency chunks load courses from the
+    modulestore at the same time. Otherwise every chunk is enqueued at once.
+    """
     if all_courses:
         course_keys = [course.id for course in modulestore().get_course_summaries()]
     else:
         course_keys = [CourseKey.from_string(id) for id in course_ids]
 
+    course_keys = _filter_course_keys(course_keys, skip_up_to_date, updated_since)
+    options = _task_options(routing_key)
+
+    if max_concurrency:
+        signatures = [
+            async_course_overview_update.si(
+                *[str(key) for key in course_key_group], force_update=force_update
+            ).set(**options)
+            for course_key_group in chunks(course_keys, chunk_size)
+        ]
+        for index in range(min(max_concurrency, len(signatures))):
+            chain(*signatures[index::max_concurrency]).apply_async()
+        return
+
     for course_key_group in chunks(course_keys, chunk_size):
         course_key_strings = [str(key) for key in course_key_group]
 
-        options = _task_options(routing_key)
         async_course_overview_update.apply_async(
             args=course_key_strings,
             kwargs={'force_update': force_update},
@@ -611,6 +611,64 @@ class CourseOverviewTestCase(CatalogIntegrationMixin, ModuleStoreTestCase, Cache
         assert overviews_by_id[non_existent_course_key] is None
         assert mock_load_from_modulestore.call_count == 3
 
+    @override_settings(ENABLE_ASYNC_COURSE_OVERVIEW_REGENERATION=True)
+    @mock.patch(
+        'openedx.core.djangoapps.content.course_overviews.tasks.enqueue_async_course_overview_update_tasks'
+    )
+    def test_get_from_ids_regenerates_outdated_overviews_async(self, mock_enqueue):
+        """
+        Outdated overviews are returned as stored and regenerated in the background.
+        """
+        course = CourseFactory.create(emit_signals=True)
+        CourseOverview.objects.filter(id=course.id).update(version=CourseOverview.VERSION - 1)
+
+        with mock.patch.object(CourseOverview, 'load_from_module_store') as mock_load_from_modulestore:
+            overviews_by_id = CourseOverview.get_from_ids([course.id])
+
+        assert overviews_by_id[course.id].version == CourseOverview.VERSION - 1
+        assert not mock_load_from_modulestore.called
+        mock_enqueue.assert_called_once_with([str(course.id)], force_update=True)
+
+
+@override_settings(ENABLE_COURSE_OVERVIEW_CACHE=True)
+class CourseOverviewCacheTestCase(ModuleStoreTestCase, CacheIsolationTestCase):
+    """
+    Tests for the django cache of CourseOverviews.
+    """
+    ENABLED_CACHES = ['default']
+
+    def test_get_from_ids_cached(self):
+        courses = [CourseFactory.create(emit_signals=True) for _ in range(2)]
+        course_ids = [course.id for course in courses]
+        CourseOverview.get_from_ids(course_ids)
+
+        # Overviews, image sets and tabs all come from the cache.
+        with self.assertNumQueries(0):
+            overviews_by_id = CourseOverview.get_from_ids(course_ids)
+            for overview in overviews_by_id.values():
+                assert list(overview.tabs)
+
+        # Saving an overview invalidates its cached copy.
+        overview = overviews_by_id[course_ids[0]]
+        overview.display_name = 'Updated name'
+        overview.save()
+        assert CourseOverview.get_from_ids(course_ids)[course_ids[0]].display_name == 'Updated name'
+
+    @override_settings(ENABLE_ASYNC_COURSE_OVERVIEW_REGENERATION=True)
+    @mock.patch(
+        'openedx.core.djangoapps.content.course_overviews.tasks.enqueue_async_course_overview_update_tasks'
+    )
+    def test_get_from_ids_regenerates_outdated_overviews_once(self, mock_enqueue):
+        """
+        An outdated overview is only enqueued for regeneration by the first request that finds it.
+        """
+        course = CourseFactory.create(emit_signals=True)
+        CourseOverview.objects.filter(id=course.id).update(version=CourseOverview.VERSION - 1)
+
+        for _ in range(3):
+            assert CourseOverview.get_from_ids([course.id])[course.id].version == CourseOverview.VERSION - 1
+        mock_enqueue.assert_called_once_with([str(course.id)], force_update=True)
+
 
 @ddt.ddt
 class CourseOverviewImageSetTestCase(ModuleStoreTestCase):
@@ -3,20 +3,26 @@ All Course Outline related business logic. Do not import from this module
 directly. Use openedx.core.djangoapps.content.learning_sequences.api -- that
 __init__.py imports from here, and is a more stable place to import from.
 """
+import hashlib
 import logging
 from collections import defaultdict
 from datetime import datetime
 from typing import Dict, FrozenSet, List, Optional, Union
 
+from django.core.cache import cache
 from django.db import transaction
 from django.db.models.query import QuerySet
-from edx_django_utils.cache import TieredCache
+from edx_django_utils.cache import RequestCache, TieredCache
 from edx_django_utils.monitoring import function_trace, set_custom_attribute
+from edx_toggles.toggles import SettingToggle
 from opaque_keys import OpaqueKey
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 from openedx.core import types
 
+from common.djangoapps.student.models import CourseEnrollment
+from common.djangoapps.student.roles import BulkRoleCache
+
 from ..data import (
     ContentErrorData,
     CourseLearningSequenceData,
@@ -47,9 +53,45 @@ from .processors.milestones import MilestonesOutlineProcessor
 from .processors.schedule import ScheduleOutlineProcessor
 from .processors.special_exams import SpecialExamsOutlineProcessor
 from .processors.visibility import VisibilityOutlineProcessor
+from .serialization import deserialize_course_outline, serialize_course_outline
 
 log = logging.getLogger(__name__)
 
+# These are processors that alter which sequences are visible to students.
+# For instance, certain sequences that are intentionally hidden or not yet
+# released. These do not need to be run for staff users. This is where we
+# would add in pluggability for OutlineProcessors down the road.
+OUTLINE_PROCESSOR_CLASSES = [
+    ('content_gating', ContentGatingOutlineProcessor),
+    ('milestones', MilestonesOutlineProcessor),
+    ('schedule', ScheduleOutlineProcessor),
+    ('special_exams', SpecialExamsOutlineProcessor),
+    ('visibility', VisibilityOutlineProcessor),
+    ('enrollment', EnrollmentOutlineProcessor),
+    ('enrollment_track_partitions', EnrollmentTrackPartitionGroupsOutlineProcessor),
+]
+
+# .. toggle_name: LEARNING_SEQUENCES_USER_OUTLINE_CACHE
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, get_user_course_outline caches each user's outline processor results,
+#   keyed by course outline version and a fingerprint of the user state the processors depend on, so repeated
+#   calls skip the processors entirely. Only used when every processor can fingerprint its inputs (currently,
+#   when the milestones app is disabled).
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_warning: Changes to a user's personalized due dates are only picked up once the cached results expire,
+#   after USER_OUTLINE_CACHE_TIMEOUT seconds.
+USER_OUTLINE_CACHE = SettingToggle('LEARNING_SEQUENCES_USER_OUTLINE_CACHE', default=False, module_name=__name__)
+
+USER_OUTLINE_CACHE_TIMEOUT = 300
+
+COURSE_OUTLINE_CACHE_NAMESPACE = 'learning_sequences.api.get_course_outline'
+
+# Cached course outlines are keyed by published version, so they never go
+# stale and can be kept for much longer than per-user data.
+COURSE_OUTLINE_CACHE_TIMEOUT = 60 * 60 * 24
+
 # Public API...
 __all__ = [
     'get_content_errors',
@@ -57,6 +99,7 @@ __all__ = [
     'get_course_outline',
     'get_user_course_outline',
     'get_user_course_outline_details',
+    'get_user_course_outlines',
     'key_supports_outlines',
     'replace_course_outline',
 ]
@@ -112,12 +155,12 @@ def get_course_outline(course_key: CourseKey) -> CourseOutlineData:
     course_context = _get_course_context_for_outline(course_key)
 
     # Check to see if it's in the cache.
-    cache_key = "learning_sequences.api.get_course_outline.v2.{}.{}".format(
+    cache_key = _course_outline_cache_key(
         course_context.learning_context.context_key, course_context.learning_context.published_version
     )
-    outline_cache_result = TieredCache.get_cached_response(cache_key)
-    if outline_cache_result.is_found:
-        return outline_cache_result.value
+    cached_outline = _get_cached_course_outline(cache_key)
+    if cached_outline is not None:
+        return cached_outline
 
     # Fetch model data, and remember that empty Sections should still be
     # represented (so query CourseSection explicitly instead of relying only on
@@ -189,11 +232,48 @@ def get_course_outline(course_key: CourseKey) -> CourseOutlineData:
         self_paced=course_context.self_paced,
         course_visibility=CourseVisibility(course_context.course_visibility),
     )
-    TieredCache.set_all_tiers(cache_key, outline_data, 300)
+    _cache_course_outline(cache_key, outline_data)
 
     return outline_data
 
 
+def _course_outline_cache_key(course_key: CourseKey, published_version: str) -> str:
+    return f"learning_sequences.api.get_course_outline.v3.{course_key}.{published_version}"
+
+
+def _get_cached_course_outline(cache_key: str) -> Optional[CourseOutlineData]:
+    """
+    Return the cached CourseOutlineData for cache_key, or None.
+
+    Outlines are kept as objects in the request cache, and in their compact
+    serialized form (see serialization.py) in the django cache.
+    """
+    request_cache = RequestCache(COURSE_OUTLINE_CACHE_NAMESPACE)
+    cached_response = request_cache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value
+
+    serialized_outline = cache.get(cache_key)
+    if serialized_outline is None:
+        return None
+    try:
+        course_outline = deserialize_course_outline(serialized_outline)
+    except ValueError:
+        log.warning("Ignoring unreadable cached course outline %s", cache_key)
+        return None
+
+    request_cache.set(cache_key, course_outline)
+    return course_outline
+
+
+def _cache_course_outline(cache_key: str, course_outline: CourseOutlineData):
+    """
+    Store course_outline in the request cache and the django cache.
+    """
+    RequestCache(COURSE_OUTLINE_CACHE_NAMESPACE).set(cache_key, course_outline)
+    cache.set(cache_key, serialize_course_outline(course_outline), COURSE_OUTLINE_CACHE_TIMEOUT)
+
+
 def _get_user_partition_groups_from_qset(upg_qset) -> Dict[int, FrozenSet[int]]:
     """
     Given a QuerySet of UserPartitionGroup, return a mapping of UserPartition
@@ -265,10 +345,60 @@ def get_user_course_outline(course_key: CourseKey,
     See the definition of UserCourseOutlineData for details about the data
     returned.
     """
+    if USER_OUTLINE_CACHE.is_enabled():
+        return _get_cached_user_course_outline(course_key, user, at_time)
     user_course_outline, _ = _get_user_course_outline_and_processors(course_key, user, at_time)
     return user_course_outline
 
 
+@function_trace('learning_sequences.api.get_user_course_outlines')
+def get_user_course_outlines(course_key: CourseKey,
+                             users: List[types.User],
+                             at_time: datetime) -> Dict[int, UserCourseOutlineData]:
+    """
+    Get outlines customized for many users at a particular time.
+
+    This returns the same outlines as calling get_user_course_outline for each
+    user, keyed by user id, but roles and enrollments are fetched for all the
+    users up front and each OutlineProcessor loads its data for all of them at
+    once (see OutlineProcessor.load_data_for_users). Processors that keep the
+    default load_data_for_users (milestones, special exams, visibility and
+    enrollment) make no queries per user, because their data comes from the
+    course outline, settings, or the prefetched roles and enrollments. The
+    number of queries therefore doesn't grow with the number of users, except
+    for milestones lookups while the milestones app is enabled.
+
+    `users` should be saved Django User objects (not the AnonymousUser).
+    """
+    users = list(users)
+    set_custom_attribute('learning_sequences.api.num_users', len(users))
+
+    full_course_outline = get_course_outline(course_key)
+    BulkRoleCache.prefetch(users)
+    CourseEnrollment.bulk_fetch_enrollment_states(users, course_key)
+
+    processors_by_user_id = {
+        user.id: _create_processors(course_key, user, at_time)
+        for user in users
+    }
+    for name, processor_cls in OUTLINE_PROCESSOR_CLASSES:
+        with function_trace(f'learning_sequences.api.outline_processors.{name}.load_data_for_users'):
+            processor_cls.load_data_for_users(
+                [processors[name] for processors in processors_by_user_id.values()],
+                full_course_outline,
+            )
+
+    user_course_outlines = {}
+    for user in users:
+        usage_keys_to_remove, inaccessible_sequences = _apply_processors(
+            processors_by_user_id[user.id], full_course_outline, can_see_all_content(user, course_key)
+        )
+        user_course_outlines[user.id] = _build_user_course_outline(
+            full_course_outline, user, at_time, usage_keys_to_remove, inaccessible_sequences
+        )
+    return user_course_outlines
+
+
 @function_trace('learning_sequences.api.get_user_course_outline_details')
 def get_user_course_outline_details(course_key: CourseKey,
                                     user: types.User,
@@ -316,44 +446,131 @@ def _get_user_course_outline_and_processors(course_key: CourseKey,  # lint-amnes
     full_course_outline = get_course_outline(course_key)
     user_can_see_all_content = can_see_all_content(user, course_key)
 
-    # These are processors that alter which sequences are visible to students.
-    # For instance, certain sequences that are intentionally hidden or not yet
-    # released. These do not need to be run for staff users. This is where we
-    # would add in pluggability for OutlineProcessors down the road.
-    processor_classes = [
-        ('content_gating', ContentGatingOutlineProcessor),
-        ('milestones', MilestonesOutlineProcessor),
-        ('schedule', ScheduleOutlineProcessor),
-        ('special_exams', SpecialExamsOutlineProcessor),
-        ('visibility', VisibilityOutlineProcessor),
-        ('enrollment', EnrollmentOutlineProcessor),
-        ('enrollment_track_partitions', EnrollmentTrackPartitionGroupsOutlineProcessor),
-    ]
+    processors = _create_processors(course_key, user, at_time)
+    usage_keys_to_remove, inaccessible_sequences = _run_processors(
+        processors, full_course_outline, user_can_see_all_content
+    )
+    user_course_outline = _build_user_course_outline(
+        full_course_outline, user, at_time, usage_keys_to_remove, inaccessible_sequences
+    )
 
-    # Run each OutlineProcessor in order to figure out what items we have to
-    # remove from the CourseOutline.
-    processors = {}
-    usage_keys_to_remove = set()
-    inaccessible_sequences = set()
-    for name, processor_cls in processor_classes:
+    return user_course_outline, processors
+
+
+def _get_cached_user_course_outline(course_key: CourseKey,
+                                    user: types.User,
+                                    at_time: datetime) -> UserCourseOutlineData:
+    """
+    Like get_user_course_outline, but reuses the processors' results across
+    calls when every processor can fingerprint the user state it depends on.
+
+    Results are cached per course outline version, user, and combined
+    fingerprint, and are only reused for times between when they were
+    computed and the first time at which a processor's results could change.
+    """
+    set_custom_attribute('learning_sequences.api.user_id', user.id)
+
+    full_course_outline = get_course_outline(course_key)
+    user_can_see_all_content = can_see_all_content(user, course_key)
+    processors = _create_processors(course_key, user, at_time)
+    fingerprints = tuple(processor.cache_fingerprint() for processor in processors.values())
+    if None in fingerprints:
+        set_custom_attribute('learning_sequences.api.user_outline_cache', 'uncacheable')
+        usage_keys_to_remove, inaccessible_sequences = _run_processors(
+            processors, full_course_outline, user_can_see_all_content
+        )
+        return _build_user_course_outline(
+            full_course_outline, user, at_time, usage_keys_to_remove, inaccessible_sequences
+        )
+
+    fingerprint_hash = hashlib.md5(repr((user_can_see_all_content, fingerprints)).encode('utf-8')).hexdigest()
+    cache_key = "learning_sequences.api.get_user_course_outline.v1.{}.{}.{}.{}".format(
+        course_key, full_course_outline.published_version, user.id, fingerprint_hash
+    )
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        computed_at, valid_until, usage_keys_to_remove, inaccessible_sequences = cached_response.value
+        if computed_at <= at_time and (valid_until is None or at_time < valid_until):
+            set_custom_attribute('learning_sequences.api.user_outline_cache', 'hit')
+            return _build_user_course_outline(
+                full_course_outline, user, at_time, usage_keys_to_remove, inaccessible_sequences
+            )
+
+    set_custom_attribute('learning_sequences.api.user_outline_cache', 'miss')
+    usage_keys_to_remove, inaccessible_sequences = _run_processors(
+        processors, full_course_outline, user_can_see_all_content
+    )
+    valid_until = min(
+        filter(None, (processor.cache_valid_until(full_course_outline) for processor in processors.values())),
+        default=None,
+    )
+    TieredCache.set_all_tiers(
+        cache_key,
+        (at_time, valid_until, frozenset(usage_keys_to_remove), frozenset(inaccessible_sequences)),
+        USER_OUTLINE_CACHE_TIMEOUT,
+    )
+    return _build_user_course_outline(
+        full_course_outline, user, at_time, usage_keys_to_remove, inaccessible_sequences
+    )
+
+
+def _create_processors(course_key: CourseKey, user: types.User, at_time: datetime):
+    """
+    Instantiate the outline processors (cheap; no data is loaded yet).
+    """
+    return {
+        name: processor_cls(course_key, user, at_time)
+        for name, processor_cls in OUTLINE_PROCESSOR_CLASSES
+    }
+
+
+def _run_processors(processors, full_course_outline: CourseOutlineData, user_can_see_all_content: bool):
+    """
+    Load data for each processor and collect the usage keys to remove and the
+    sequences to mark inaccessible.
+    """
+    for processor in processors.values():
         # Future optimization: This should be parallelizable (don't rely on a
         # particular ordering).
-        processor = processor_cls(course_key, user, at_time)
-        processors[name] = processor
         processor.load_data(full_course_outline)
-        if not user_can_see_all_content:
-            # function_trace lets us see how expensive each processor is being.
-            with function_trace(f'learning_sequences.api.outline_processors.{name}'):
-                processor_usage_keys_removed = processor.usage_keys_to_remove(full_course_outline)
-                processor_inaccessible_sequences = processor.inaccessible_sequences(full_course_outline)
-                usage_keys_to_remove |= processor_usage_keys_removed
-                inaccessible_sequences |= processor_inaccessible_sequences
 
+    return _apply_processors(processors, full_course_outline, user_can_see_all_content)
+
+
+def _apply_processors(processors, full_course_outline: CourseOutlineData, user_can_see_all_content: bool):
+    """
+    Collect the usage keys to remove and the sequences to mark inaccessible
+    from processors that have already loaded their data.
+    """
+    usage_keys_to_remove = set()
+    inaccessible_sequences = set()
+    if user_can_see_all_content:
+        return usage_keys_to_remove, inaccessible_sequences
+
+    for name, processor in processors.items():
+        # function_trace lets us see how expensive each processor is being.
+        with function_trace(f'learning_sequences.api.outline_processors.{name}'):
+            processor_usage_keys_removed = processor.usage_keys_to_remove(full_course_outline)
+            processor_inaccessible_sequences = processor.inaccessible_sequences(full_course_outline)
+            usage_keys_to_remove |= processor_usage_keys_removed
+            inaccessible_sequences |= processor_inaccessible_sequences
+
+    return usage_keys_to_remove, inaccessible_sequences
+
+
+def _build_user_course_outline(full_course_outline: CourseOutlineData,
+                               user: types.User,
+                               at_time: datetime,
+                               usage_keys_to_remove,
+                               inaccessible_sequences) -> UserCourseOutlineData:
+    """
+    Apply the processors' results to the full course outline.
+    """
     # Open question: Does it make sense to remove a Section if it has no Sequences in it?
     trimmed_course_outline = full_course_outline.remove(usage_keys_to_remove)
     accessible_sequences = frozenset(set(trimmed_course_outline.sequences) - inaccessible_sequences)
 
-    user_course_outline = UserCourseOutlineData(
+    return UserCourseOutlineData(
         base_outline=full_course_outline,
         user=user,
         at_time=at_time,
@@ -374,8 +591,6 @@ def _get_user_course_outline_and_processors(course_key: CourseKey,  # lint-amnes
         }
     )
 
-    return user_course_outline, processors
-
 
 @function_trace('learning_sequences.api.replace_course_outline')
 def replace_course_outline(course_outline: CourseOutlineData,
@@ -407,6 +622,11 @@ def replace_course_outline(course_outline: CourseOutlineData,
         _update_course_section_sequences(course_outline, course_context)
         _update_publish_report(course_outline, content_errors, course_context)
 
+        # Warm the cache with the new version, so the first read after a
+        # publish doesn't have to rebuild the outline from the tables.
+        cache_key = _course_outline_cache_key(course_outline.course_key, course_outline.published_version)
+        transaction.on_commit(lambda: _cache_course_outline(cache_key, course_outline))
+
 
 def _update_course_context(course_outline: CourseOutlineData):
     """
@@ -33,6 +33,15 @@ class OutlineProcessor:
     Some outline processors (like ScheduleOutlineProcessor) may choose to have
     additional methods to return specific metadata to feed into
     UserCourseOutlineDetailsData.
+
+    When outlines are built for many users at once (get_user_course_outlines),
+    load_data_for_users is called instead of load_data. Override it to fetch
+    your data for all users with a fixed number of queries.
+
+    Processors can also make the user outline cacheable by overriding
+    cache_fingerprint (and cache_valid_until, if time matters to them). When
+    every processor provides a fingerprint, a cached user outline can be
+    served without calling load_data at all.
     """
 
     def __init__(self, course_key: CourseKey, user: types.User, at_time: datetime):
@@ -46,6 +55,29 @@ class OutlineProcessor:
         self.user = user
         self.at_time = at_time
 
+    def cache_fingerprint(self):
+        """
+        Return a hashable value capturing every user-specific input this
+        processor's results depend on, or None if they can't be cached.
+
+        This is called *instead of* load_data when looking up a cached user
+        outline, so it must be cheap: request- or django-cached lookups, or a
+        few small queries, never per-sequence ones. The course outline version
+        is already part of the cache key. The default of None means user
+        outlines are never cached while this processor is in use.
+        """
+        return None
+
+    def cache_valid_until(self, full_course_outline: CourseOutlineData):  # pylint: disable=unused-argument
+        """
+        Return the first time after at_time at which this processor's results
+        could change by themselves (e.g. a release date), or None if they do
+        not depend on time.
+
+        Only called after load_data.
+        """
+        return None
+
     def load_data(self, full_course_outline: CourseOutlineData):  # pylint: disable=unused-argument
         """
         Fetch whatever data you need about the course and user here.
@@ -61,6 +93,20 @@ class OutlineProcessor:
         """
         pass  # lint-amnesty, pylint: disable=unnecessary-pass
 
+    @classmethod
+    def load_data_for_users(cls, processors, full_course_outline: CourseOutlineData):
+        """
+        Load data for a list of processors of this class, one per user, that
+        all share the same course and at_time.
+
+        The default implementation calls load_data on each processor in turn,
+        so per-user queries made there are repeated for every user. Override
+        this to fetch data for all users in bulk and hand each processor its
+        share of the results.
+        """
+        for processor in processors:
+            processor.load_data(full_course_outline)
+
     def inaccessible_sequences(self, full_course_outline: CourseOutlineData):  # pylint: disable=unused-argument
         """
         Return a set/frozenset of Sequence UsageKeys that are not accessible.
@@ -27,6 +27,13 @@ class ContentGatingOutlineProcessor(OutlineProcessor):
         self.required_content = None
         self.can_skip_entrance_exam = False
 
+    def cache_fingerprint(self):
+        """
+        Required content comes from milestones, which can't be fingerprinted
+        cheaply, so results are only cacheable when the milestones app is off.
+        """
+        return None if milestones_helpers.ENABLE_MILESTONES_APP.is_enabled() else ()
+
     def load_data(self, full_course_outline):
         """
         Get the required content for the course, and whether
@@ -39,6 +46,24 @@ class ContentGatingOutlineProcessor(OutlineProcessor):
                 self.user, self.course_key
             )
 
+    @classmethod
+    def load_data_for_users(cls, processors, full_course_outline):
+        """
+        Like load_data, but look up who can skip the entrance exam in one query.
+
+        Required content still comes from the milestones app one user at a
+        time, though that's free while the milestones app is disabled.
+        """
+        if not processors:
+            return
+        course_key = processors[0].course_key
+        users_who_can_skip = EntranceExamConfiguration.user_ids_who_can_skip_entrance_exam(
+            [processor.user for processor in processors if processor.user.is_authenticated], course_key
+        )
+        for processor in processors:
+            processor.required_content = milestones_helpers.get_required_content(course_key, processor.user)
+            processor.can_skip_entrance_exam = processor.user.id in users_who_can_skip
+
     def inaccessible_sequences(self, full_course_outline):
         """
         Mark any section that is gated by required content as inaccessible
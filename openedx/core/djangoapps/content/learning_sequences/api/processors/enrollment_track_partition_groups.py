@@ -15,6 +15,8 @@ from xmodule.partitions.partitions import (  # lint-amnesty, pylint: disable=wro
 from xmodule.partitions.partitions_service import get_user_partition_groups  # lint-amnesty, pylint: disable=wrong-import-order
 from xmodule.partitions.partitions import Group  # lint-amnesty, pylint: disable=wrong-import-order
 
+from common.djangoapps.student.models import CourseEnrollment
+
 from .base import OutlineProcessor
 
 log = logging.getLogger(__name__)
@@ -33,6 +35,12 @@ class EnrollmentTrackPartitionGroupsOutlineProcessor(OutlineProcessor):
         self.enrollment_track_groups: Dict[str, Group] = {}
         self.user_group = None
 
+    def cache_fingerprint(self):
+        """
+        The user's enrollment track group follows from their enrollment mode.
+        """
+        return CourseEnrollment.enrollment_mode_for_user(self.user, self.course_key)
+
     def load_data(self, full_course_outline) -> None:
         """
         Pull track groups for this course and which group the user is in.
@@ -47,6 +55,27 @@ class EnrollmentTrackPartitionGroupsOutlineProcessor(OutlineProcessor):
         # TODO: fix type annotation: https://github.com/openedx/tcril-engineering/issues/313
         self.user_group = self.enrollment_track_groups.get(ENROLLMENT_TRACK_PARTITION_ID)  # type: ignore
 
+    @classmethod
+    def load_data_for_users(cls, processors, full_course_outline):
+        """
+        Like load_data, but create the enrollment track partition only once.
+
+        Each user's group follows from their enrollment mode, which
+        get_user_course_outlines has already fetched for all users, and the
+        course's modes, which are request cached.
+        """
+        if not processors:
+            return
+        user_partition = create_enrollment_track_partition_with_course_id(processors[0].course_key)
+        for processor in processors:
+            processor.enrollment_track_groups = get_user_partition_groups(
+                processor.course_key,
+                [user_partition],
+                processor.user,
+                partition_dict_key='id'
+            )
+            processor.user_group = processor.enrollment_track_groups.get(ENROLLMENT_TRACK_PARTITION_ID)  # type: ignore
+
     def _is_user_excluded_by_partition_group(self, user_partition_groups):
         """
         Is the user part of the group to which the block is restricting content?
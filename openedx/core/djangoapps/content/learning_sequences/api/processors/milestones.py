@@ -17,6 +17,13 @@ class MilestonesOutlineProcessor(OutlineProcessor):
     This does not include Entrance Exams (see `ContentGatingOutlineProcessor`),
     or Special Exams (see `SpecialExamsOutlineProcessor`)
     """
+    def cache_fingerprint(self):
+        """
+        Milestone fulfillment can't be fingerprinted cheaply, so results are
+        only cacheable when the milestones app is off and nothing is gated.
+        """
+        return None if milestones_helpers.ENABLE_MILESTONES_APP.is_enabled() else ()
+
     def inaccessible_sequences(self, full_course_outline):
         """
         Returns the set of sequence usage keys for which the
@@ -1,15 +1,19 @@
 # lint-amnesty, pylint: disable=missing-module-docstring
 import logging
-from collections import defaultdict  # lint-amnesty, pylint: disable=unused-import
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Dict
 
+from django.db.models import Count, Max, Q
 from edx_when.api import get_dates_for_course
+from edx_when.models import ContentDate, MissingScheduleError, UserDate
 from opaque_keys.edx.keys import CourseKey  # lint-amnesty, pylint: disable=unused-import
 from openedx.core import types
 
 from common.djangoapps.student.auth import user_has_role
 from common.djangoapps.student.roles import CourseBetaTesterRole
+from openedx.core.djangoapps.schedules.models import Schedule
+from openedx.features.course_experience import RELATIVE_DATES_FLAG
 
 from ...data import ScheduleData, ScheduleItemData, UserCourseOutlineData
 from .base import OutlineProcessor
@@ -42,16 +46,107 @@ class ScheduleOutlineProcessor(OutlineProcessor):
         self._course_end = None
         self._is_beta_tester = False
 
+    def cache_fingerprint(self):
+        """
+        Beyond the dates themselves (see cache_valid_until), results depend on
+        whether the user is a beta tester, and on the user's dates: the course
+        dates come with the published version, and edx-when personalizes them
+        with the user's Schedule start date and date overrides.
+        """
+        is_beta_tester = user_has_role(self.user, CourseBetaTesterRole(self.course_key))
+        if not self.user.is_authenticated:
+            return is_beta_tester, None, None
+        schedule_start = Schedule.objects.filter(
+            enrollment__user_id=self.user.id,
+            enrollment__course_id=self.course_key,
+        ).values_list('start_date', flat=True).first()
+        # Overrides can be deleted as well as changed, so count them too.
+        overrides_version = UserDate.objects.filter(
+            user_id=self.user.id,
+            content_date__course_id=self.course_key,
+        ).aggregate(count=Count('id'), modified=Max('modified'))
+        return is_beta_tester, schedule_start, (overrides_version['count'], overrides_version['modified'])
+
+    def cache_valid_until(self, full_course_outline):
+        """
+        Results change when at_time passes any start, due or end date, with or
+        without the beta tester offset applied.
+        """
+        start_offset = timedelta(days=full_course_outline.days_early_for_beta or 0)
+        upcoming = [
+            boundary
+            for date in self.dates.values()
+            if date is not None
+            for boundary in (date, date - start_offset)
+            if boundary > self.at_time
+        ]
+        return min(upcoming, default=None)
+
     def load_data(self, full_course_outline):
         """
         Pull dates information from edx-when.
 
         Return data format: (usage_key, 'due'): datetime.datetime(2019, 12, 11, 15, 0, tzinfo=<UTC>)
         """
-        self.dates = get_dates_for_course(
-            self.course_key, self.user, subsection_and_higher_only=True,
-            published_version=full_course_outline.published_version
+        self._set_dates(
+            get_dates_for_course(
+                self.course_key, self.user, subsection_and_higher_only=True,
+                published_version=full_course_outline.published_version
+            )
+        )
+
+    @classmethod
+    def load_data_for_users(cls, processors, full_course_outline):
+        """
+        Like load_data, but with a fixed number of queries for all users.
+
+        The course's dates, the users' Schedules and the users' date overrides
+        are each fetched in one query, and every user's dates are then worked
+        out from them the same way get_dates_for_course does for one user.
+        """
+        if not processors:
+            return
+        course_key = processors[0].course_key
+        user_ids = [processor.user.id for processor in processors if processor.user.is_authenticated]
+
+        content_dates = ContentDate.objects.filter(course_id=course_key, active=True).filter(
+            # Same block types as subsection_and_higher_only, including NULLs from before block_type existed.
+            Q(block_type__in=('course', 'chapter', 'sequential')) | Q(block_type__isnull=True)
         )
+        if not RELATIVE_DATES_FLAG.is_enabled(course_key):
+            content_dates = content_dates.filter(policy__rel_date=None)
+        content_dates = list(content_dates.select_related('policy'))
+
+        schedules_by_user_id = {
+            schedule.enrollment.user_id: schedule
+            for schedule in Schedule.objects.filter(
+                enrollment__user_id__in=user_ids,
+                enrollment__course_id=course_key,
+            ).select_related('enrollment')
+        }
+        user_dates_by_user_id = defaultdict(list)
+        for user_date in UserDate.objects.filter(
+            user_id__in=user_ids,
+            content_date__course_id=course_key,
+            content_date__active=True,
+        ).order_by('modified'):
+            user_dates_by_user_id[user_date.user_id].append(user_date)
+
+        for processor in processors:
+            processor._set_dates(  # pylint: disable=protected-access
+                _personalize_dates(
+                    course_key,
+                    content_dates,
+                    schedules_by_user_id.get(processor.user.id),
+                    user_dates_by_user_id[processor.user.id],
+                )
+            )
+
+    def _set_dates(self, dates):
+        """
+        Index the dates from edx-when by usage key and pull out course-level data.
+        """
+        self.dates = dates
 
         for (usage_key, field_name), date in self.dates.items():
             self.keys_to_schedule_fields[usage_key][field_name] = date
@@ -175,3 +270,66 @@ class ScheduleOutlineProcessor(OutlineProcessor):
             sections=sections,
             sequences=sequences,
         )
+
+
+def _personalize_dates(course_key, content_dates, schedule, user_dates):
+    """
+    Return a user's dates, keyed like get_dates_for_course, from the course's
+    ContentDates, the user's Schedule (or None) and the user's UserDates in
+    order of modification.
+    """
+    end_datetime, cutoff_datetime = _get_end_dates(content_dates)
+
+    dates = {}
+    content_dates_by_id = {}
+    for content_date in content_dates:
+        key = (content_date.location.map_into_course(course_key), content_date.field)
+        try:
+            dates[key] = content_date.policy.actual_date(schedule, end_datetime, cutoff_datetime)
+        except MissingScheduleError:
+            # A relative date without a schedule, e.g. for staff who aren't enrolled.
+            pass
+        content_dates_by_id[content_date.id] = (key, content_date)
+
+    for user_date in user_dates:
+        if user_date.content_date_id not in content_dates_by_id:
+            # The override is for a block below the subsection level.
+            continue
+        key, content_date = content_dates_by_id[user_date.content_date_id]
+        if user_date.abs_date:
+            dates[key] = user_date.abs_date
+            continue
+        try:
+            policy_date = content_date.policy.actual_date(schedule)
+        except MissingScheduleError:
+            log.warning("Unable to read date for %s", content_date, exc_info=True)
+            continue
+        if schedule and user_date.rel_date:
+            policy_date += user_date.rel_date
+        dates[key] = policy_date
+
+    return dates
+
+
+def _get_end_dates(content_dates):
+    """
+    Return the course end date, and the latest date a learner can start and
+    still have time for every relative due date before the course ends.
+    """
+    end_dates = [
+        content_date for content_date in content_dates
+        if content_date.location.block_type == 'course' and content_date.field == 'end'
+    ]
+    if not end_dates:
+        return None, None
+
+    end_datetime = end_dates[0].policy.abs_date
+    last_rel_date = max(
+        (
+            content_date.policy.rel_date for content_date in content_dates
+            if content_date.field == 'due' and content_date.policy.rel_date
+        ),
+        default=None,
+    )
+    cutoff_datetime = end_datetime - last_rel_date if last_rel_date else end_datetime
+    return end_datetime, cutoff_datetime
@@ -31,6 +31,13 @@ class SpecialExamsOutlineProcessor(OutlineProcessor):
     """
     Responsible for applying all outline processing related to special exams.
     """
+    def cache_fingerprint(self):
+        """
+        This processor only contributes exam data to outline details, never
+        removes or restricts content, so it doesn't affect cached outlines.
+        """
+        return ()
+
     def load_data(self, full_course_outline):
         """
         Check if special exams are enabled
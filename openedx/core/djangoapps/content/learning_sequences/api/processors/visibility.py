@@ -13,6 +13,12 @@ class VisibilityOutlineProcessor(OutlineProcessor):
     inaccessible. There is no need to implement `load_data` because everything
     we need comes from the CourseOutlineData itself.
     """
+    def cache_fingerprint(self):
+        """
+        Nothing user-specific: results only depend on the course outline.
+        """
+        return ()
+
     def usage_keys_to_remove(self, full_course_outline):
         """
         Remove anything flagged with `hide_from_toc` or `visible_to_staff_only`.
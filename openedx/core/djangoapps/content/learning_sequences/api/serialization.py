@@ -0,0 +1,198 @@
+"""
+Compact, versioned serialization of CourseOutlineData for caching.
+
+Pickling CourseOutlineData stores every UsageKey, attrs instance, and frozenset
+as a full Python object, which makes cached outlines for large courses both
+big and slow to load. This format instead stores plain JSON-compatible lists,
+zlib-compressed:
+
+* UsageKeys that belong to the outline's course are stored as just their
+  (block_type, block_id), and rebuilt from the course key.
+* Visibility, exam, and due date flags are packed into one integer per item.
+* User partition groups are stored as sorted lists, and omitted when empty.
+
+The first byte of the serialized data is the format version. Bump
+SERIALIZATION_VERSION whenever the layout changes, so that data written by an
+older version is rejected (and rebuilt) instead of misread.
+"""
+import json
+import zlib
+from datetime import datetime
+from typing import Dict, FrozenSet
+
+from opaque_keys.edx.keys import CourseKey, UsageKey
+
+from ..data import (
+    CourseLearningSequenceData,
+    CourseOutlineData,
+    CourseSectionData,
+    CourseVisibility,
+    ExamData,
+    VisibilityData
+)
+
+SERIALIZATION_VERSION = 1
+
+# Bit flags for the booleans of sections and sequences.
+_HIDE_FROM_TOC = 1
+_VISIBLE_TO_STAFF_ONLY = 1 << 1
+_INACCESSIBLE_AFTER_DUE = 1 << 2
+_IS_PRACTICE_EXAM = 1 << 3
+_IS_PROCTORED_ENABLED = 1 << 4
+_IS_TIME_LIMITED = 1 << 5
+
+
+def serialize_course_outline(course_outline: CourseOutlineData) -> bytes:
+    """
+    Serialize a CourseOutlineData to compact bytes.
+
+    Use deserialize_course_outline to read it back.
+    """
+    course_key = course_outline.course_key
+    payload = [
+        str(course_key),
+        course_outline.title,
+        course_outline.published_at.isoformat(),
+        course_outline.published_version,
+        course_outline.days_early_for_beta,
+        course_outline.self_paced,
+        course_outline.course_visibility.value,
+        course_outline.entrance_exam_id,
+        [
+            [
+                _encode_usage_key(section.usage_key, course_key),
+                section.title,
+                _visibility_flags(section.visibility),
+                _encode_user_partition_groups(section.user_partition_groups),
+                [
+                    [
+                        _encode_usage_key(seq.usage_key, course_key),
+                        seq.title,
+                        _sequence_flags(seq),
+                        _encode_user_partition_groups(seq.user_partition_groups),
+                    ]
+                    for seq in section.sequences
+                ],
+            ]
+            for section in course_outline.sections
+        ],
+    ]
+    encoded = json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return bytes([SERIALIZATION_VERSION]) + zlib.compress(encoded)
+
+
+def deserialize_course_outline(data: bytes) -> CourseOutlineData:
+    """
+    Rebuild a CourseOutlineData from the output of serialize_course_outline.
+
+    Raises ValueError if the data was written with a different format version,
+    or is corrupt.
+    """
+    if not data or data[0] != SERIALIZATION_VERSION:
+        raise ValueError("Unsupported CourseOutlineData serialization version")
+    try:
+        encoded = zlib.decompress(data[1:])
+    except zlib.error as exc:
+        raise ValueError("Corrupt CourseOutlineData serialization") from exc
+
+    (
+        course_key_str,
+        title,
+        published_at,
+        published_version,
+        days_early_for_beta,
+        self_paced,
+        course_visibility,
+        entrance_exam_id,
+        sections,
+    ) = json.loads(encoded.decode('utf-8'))
+    course_key = CourseKey.from_string(course_key_str)
+
+    return CourseOutlineData(
+        course_key=course_key,
+        title=title,
+        published_at=datetime.fromisoformat(published_at),
+        published_version=published_version,
+        days_early_for_beta=days_early_for_beta,
+        self_paced=self_paced,
+        course_visibility=CourseVisibility(course_visibility),
+        entrance_exam_id=entrance_exam_id,
+        sections=[
+            CourseSectionData(
+                usage_key=_decode_usage_key(section_key, course_key),
+                title=section_title,
+                visibility=_visibility_from_flags(section_flags),
+                user_partition_groups=_decode_user_partition_groups(section_groups),
+                sequences=[
+                    CourseLearningSequenceData(
+                        usage_key=_decode_usage_key(seq_key, course_key),
+                        title=seq_title,
+                        visibility=_visibility_from_flags(seq_flags),
+                        exam=ExamData(
+                            is_practice_exam=bool(seq_flags & _IS_PRACTICE_EXAM),
+                            is_proctored_enabled=bool(seq_flags & _IS_PROCTORED_ENABLED),
+                            is_time_limited=bool(seq_flags & _IS_TIME_LIMITED),
+                        ),
+                        inaccessible_after_due=bool(seq_flags & _INACCESSIBLE_AFTER_DUE),
+                        user_partition_groups=_decode_user_partition_groups(seq_groups),
+                    )
+                    for seq_key, seq_title, seq_flags, seq_groups in sequences
+                ],
+            )
+            for section_key, section_title, section_flags, section_groups, sequences in sections
+        ],
+    )
+
+
+def _encode_usage_key(usage_key: UsageKey, course_key: CourseKey):
+    """
+    Store keys from the outline's own course as [block_type, block_id], and
+    anything else as the full key string.
+    """
+    if course_key.make_usage_key(usage_key.block_type, usage_key.block_id) == usage_key:
+        return [usage_key.block_type, usage_key.block_id]
+    return str(usage_key)
+
+
+def _decode_usage_key(encoded_key, course_key: CourseKey) -> UsageKey:
+    if isinstance(encoded_key, str):
+        return UsageKey.from_string(encoded_key)
+    return course_key.make_usage_key(*encoded_key)
+
+
+def _visibility_flags(visibility: VisibilityData) -> int:
+    return (
+        (_HIDE_FROM_TOC if visibility.hide_from_toc else 0) |
+        (_VISIBLE_TO_STAFF_ONLY if visibility.visible_to_staff_only else 0)
+    )
+
+
+def _sequence_flags(seq: CourseLearningSequenceData) -> int:
+    return (
+        _visibility_flags(seq.visibility) |
+        (_INACCESSIBLE_AFTER_DUE if seq.inaccessible_after_due else 0) |
+        (_IS_PRACTICE_EXAM if seq.exam.is_practice_exam else 0) |
+        (_IS_PROCTORED_ENABLED if seq.exam.is_proctored_enabled else 0) |
+        (_IS_TIME_LIMITED if seq.exam.is_time_limited else 0)
+    )
+
+
+def _visibility_from_flags(flags: int) -> VisibilityData:
+    return VisibilityData(
+        hide_from_toc=bool(flags & _HIDE_FROM_TOC),
+        visible_to_staff_only=bool(flags & _VISIBLE_TO_STAFF_ONLY),
+    )
+
+
+def _encode_user_partition_groups(user_partition_groups: Dict[int, FrozenSet[int]]):
+    return [
+        [partition_id, sorted(group_ids)]
+        for partition_id, group_ids in sorted(user_partition_groups.items())
+    ]
+
+
+def _decode_user_partition_groups(encoded_groups) -> Dict[int, FrozenSet[int]]:
+    return {
+        partition_id: frozenset(group_ids)
+        for partition_id, group_ids in encoded_groups
+    }
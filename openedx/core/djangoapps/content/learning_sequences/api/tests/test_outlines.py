@@ -2,16 +2,20 @@
 Top level API tests. Tests API public contracts only. Do not import/create/mock
 models for this app.
 """
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch
 import unittest
 
 from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
 from django.db.models import signals
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from edx_django_utils.cache import RequestCache
 from edx_proctoring.exceptions import ProctoredExamNotFoundException
 from edx_toggles.toggles.testutils import override_waffle_flag
-from edx_when.api import set_dates_for_course
+from edx_when.api import set_date_for_block, set_dates_for_course
 from opaque_keys.edx.keys import CourseKey
 from opaque_keys.edx.locator import LibraryLocator
 import attr
@@ -19,6 +23,7 @@ import ddt
 import pytest
 
 from openedx.core.djangoapps.course_apps.toggles import EXAMS_IDA
+from openedx.core.djangoapps.schedules.tests.factories import ScheduleFactory
 from openedx.core.djangolib.testing.utils import CacheIsolationTestCase
 from openedx.features.course_experience import COURSE_ENABLE_UNENROLLED_ACCESS_FLAG
 from common.djangoapps.course_modes.models import CourseMode
@@ -45,10 +50,12 @@ from ..outlines import (
     get_course_outline,
     get_user_course_outline,
     get_user_course_outline_details,
+    get_user_course_outlines,
     key_supports_outlines,
     replace_course_outline,
 )
 from ..processors.enrollment_track_partition_groups import EnrollmentTrackPartitionGroupsOutlineProcessor
+from ..processors.schedule import ScheduleOutlineProcessor
 from .test_data import generate_sections
 
 
@@ -791,6 +798,84 @@ class ScheduleTestCase(OutlineProcessorTestCase):
         # Beta tester can access same as student
         assert len(beta_tester_details.outline.accessible_sequences) == 4
 
+    @override_settings(LEARNING_SEQUENCES_USER_OUTLINE_CACHE=True)
+    def test_cached_user_outline(self):
+        at_section_start = datetime(2020, 5, 15, tzinfo=timezone.utc)
+        outline = get_user_course_outline(self.course_key, self.student, at_section_start)
+        assert len(outline.accessible_sequences) == 4
+
+        # Until the next start date, the processors don't need to run again.
+        with patch.object(ScheduleOutlineProcessor, 'load_data') as mock_load_data:
+            outline = get_user_course_outline(
+                self.course_key, self.student, datetime(2020, 5, 15, 12, tzinfo=timezone.utc)
+            )
+        assert not mock_load_data.called
+        assert len(outline.accessible_sequences) == 4
+
+        # Once seq_after has started, the cached results are no longer valid.
+        outline = get_user_course_outline(self.course_key, self.student, datetime(2020, 5, 16, tzinfo=timezone.utc))
+        assert len(outline.accessible_sequences) == 5
+
+    @override_settings(LEARNING_SEQUENCES_USER_OUTLINE_CACHE=True)
+    def test_cached_user_outline_date_override(self):
+        after_due = datetime(2020, 5, 21, tzinfo=timezone.utc)
+        outline = get_user_course_outline(self.course_key, self.student, after_due)
+        assert self.seq_due_key not in outline.accessible_sequences
+
+        # Extending the due date for the user makes the cached results stale.
+        set_date_for_block(
+            self.course_key, self.seq_due_key, 'due', datetime(2020, 5, 25, tzinfo=timezone.utc), user=self.student
+        )
+        outline = get_user_course_outline(self.course_key, self.student, after_due)
+        assert self.seq_due_key in outline.accessible_sequences
+
+    def test_bulk_user_outlines(self):
+        course_outline = attr.evolve(self.outline, days_early_for_beta=1)
+        replace_course_outline(course_outline)
+        at_time = datetime(2020, 5, 14, tzinfo=timezone.utc)
+        users = [self.global_staff, self.student, self.beta_tester]
+
+        outlines = get_user_course_outlines(self.course_key, users, at_time)
+        assert set(outlines) == {user.id for user in users}
+        assert len(outlines[self.global_staff.id].accessible_sequences) == 5
+        assert len(outlines[self.student.id].accessible_sequences) == 0
+        assert len(outlines[self.beta_tester.id].accessible_sequences) == 4
+
+        for user in users:
+            assert outlines[user.id] == get_user_course_outline(self.course_key, user, at_time)
+
+    def test_bulk_user_outlines_num_queries(self):
+        replace_course_outline(self.outline)
+        at_time = datetime(2020, 5, 21, tzinfo=timezone.utc)
+        students = [UserFactory.create() for _ in range(5)]
+        for index, student in enumerate(students):
+            ScheduleFactory.create(
+                enrollment__user=student,
+                enrollment__course_id=self.course_key,
+                start_date=datetime(2020, 5, 10 + index, tzinfo=timezone.utc),
+            )
+            # Personalized dates: one relative to the schedule and one absolute.
+            set_date_for_block(self.course_key, self.seq_due_key, 'due', timedelta(days=index), user=student)
+            set_date_for_block(
+                self.course_key, self.seq_after_key, 'start', datetime(2020, 5, 20 + index, tzinfo=timezone.utc),
+                user=student,
+            )
+
+        # Warm up the caches that aren't per request.
+        get_user_course_outlines(self.course_key, students[:1], at_time)
+
+        RequestCache.clear_all_namespaces()
+        with CaptureQueriesContext(connection) as one_user_queries:
+            get_user_course_outlines(self.course_key, students[:1], at_time)
+
+        RequestCache.clear_all_namespaces()
+        with CaptureQueriesContext(connection) as all_users_queries:
+            outlines = get_user_course_outlines(self.course_key, students, at_time)
+
+        assert len(all_users_queries) == len(one_user_queries)
+        for student in students:
+            assert outlines[student.id] == get_user_course_outline(self.course_key, student, at_time)
+
 
 class SelfPacedTestCase(OutlineProcessorTestCase):  # lint-amnesty, pylint: disable=missing-class-docstring
 
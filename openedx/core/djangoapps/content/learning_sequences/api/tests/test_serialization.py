@@ -0,0 +1,101 @@
+"""
+Tests for the compact CourseOutlineData serialization.
+"""
+import pickle
+from datetime import datetime, timezone
+from unittest import TestCase
+
+import attr
+import pytest
+from opaque_keys.edx.keys import CourseKey
+
+from ...data import CourseOutlineData, CourseVisibility, ExamData, VisibilityData
+from ..serialization import SERIALIZATION_VERSION, deserialize_course_outline, serialize_course_outline
+from .test_data import generate_sections
+
+
+class CourseOutlineSerializationTestCase(TestCase):
+    """
+    Round trip CourseOutlineData through serialize/deserialize.
+    """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.course_key = CourseKey.from_string("course-v1:OpenEdX+Serialize+T1")
+        cls.course_outline = CourseOutlineData(
+            course_key=cls.course_key,
+            title="Serialization Test Course!",
+            published_at=datetime(2020, 5, 20, tzinfo=timezone.utc),
+            published_version="5ebece4b69dd593d82fe2020",
+            entrance_exam_id=str(cls.course_key.make_usage_key('chapter', 'ch_1')),
+            days_early_for_beta=2,
+            sections=generate_sections(cls.course_key, [2, 3]),
+            self_paced=True,
+            course_visibility=CourseVisibility.PUBLIC_OUTLINE,
+        )
+
+    def test_roundtrip(self):
+        assert deserialize_course_outline(serialize_course_outline(self.course_outline)) == self.course_outline
+
+    def test_roundtrip_flags_and_groups(self):
+        section = self.course_outline.sections[0]
+        sequences = [
+            attr.evolve(
+                section.sequences[0],
+                visibility=VisibilityData(hide_from_toc=True, visible_to_staff_only=False),
+                exam=ExamData(is_practice_exam=False, is_proctored_enabled=True, is_time_limited=True),
+                inaccessible_after_due=True,
+                user_partition_groups={50: frozenset([1, 2]), 51: frozenset([3])},
+            ),
+            attr.evolve(
+                section.sequences[1],
+                visibility=VisibilityData(hide_from_toc=False, visible_to_staff_only=True),
+            ),
+        ]
+        course_outline = attr.evolve(
+            self.course_outline,
+            days_early_for_beta=None,
+            entrance_exam_id=None,
+            sections=[
+                attr.evolve(
+                    section,
+                    sequences=sequences,
+                    user_partition_groups={50: frozenset([2])},
+                )
+            ] + self.course_outline.sections[1:],
+        )
+        assert deserialize_course_outline(serialize_course_outline(course_outline)) == course_outline
+
+    def test_foreign_usage_keys(self):
+        """Keys from another course are kept in full."""
+        other_course_key = CourseKey.from_string("course-v1:OpenEdX+Other+T1")
+        course_outline = attr.evolve(
+            self.course_outline,
+            sections=generate_sections(other_course_key, [1]),
+        )
+        assert deserialize_course_outline(serialize_course_outline(course_outline)) == course_outline
+
+    def test_large_outline(self):
+        """A maximum size outline round trips, and is much smaller than its pickle."""
+        course_outline = attr.evolve(
+            self.course_outline,
+            sections=generate_sections(self.course_key, [100] * 10),
+        )
+        assert len(course_outline.sequences) == CourseOutlineData.MAX_SEQUENCE_COUNT
+        serialized = serialize_course_outline(course_outline)
+        assert deserialize_course_outline(serialized) == course_outline
+        assert len(serialized) * 5 < len(pickle.dumps(course_outline))
+
+    def test_unknown_version(self):
+        serialized = serialize_course_outline(self.course_outline)
+        with pytest.raises(ValueError):
+            deserialize_course_outline(bytes([SERIALIZATION_VERSION + 1]) + serialized[1:])
+        with pytest.raises(ValueError):
+            deserialize_course_outline(b'')
+
+    def test_corrupt_data(self):
+        serialized = serialize_course_outline(self.course_outline)
+        with pytest.raises(ValueError):
+            deserialize_course_outline(serialized[:1] + b'not zlib data')
+        with pytest.raises(ValueError):
+            deserialize_course_outline(serialized[:len(serialized) // 2])
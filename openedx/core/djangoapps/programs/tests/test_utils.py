@@ -21,6 +21,7 @@ from testfixtures import LogCapture
 
 from common.djangoapps.course_modes.models import CourseMode
 from common.djangoapps.course_modes.tests.factories import CourseModeFactory
+from common.djangoapps.entitlements.models import CourseEntitlement
 from common.djangoapps.entitlements.tests.factories import CourseEntitlementFactory
 from common.djangoapps.student.tests.factories import AnonymousUserFactory, CourseEnrollmentFactory, UserFactory
 from common.djangoapps.util.date_utils import strftime_localized
@@ -411,6 +412,33 @@ class TestProgramProgressMeter(ModuleStoreTestCase):
         programs = data[:2]
         assert meter.engaged_programs == programs
 
+    def test_entitlements_fetched_once_for_progress(self, mock_get_programs):
+        """
+        Verify that active entitlements are fetched once for all programs and
+        courses, rather than once per course.
+        """
+        course_uuids = [uuid.uuid4() for __ in range(3)]
+        data = [
+            ProgramFactory(courses=[CourseFactory(uuid=str(course_uuid)) for course_uuid in course_uuids[:2]]),
+            ProgramFactory(courses=[CourseFactory(uuid=str(course_uuids[2])), CourseFactory()]),
+        ]
+        mock_get_programs.return_value = data
+        self._create_entitlements(*course_uuids)
+        meter = ProgramProgressMeter(self.site, self.user)
+
+        with mock.patch.object(
+            CourseEntitlement,
+            'get_active_entitlements_by_course_uuid',
+            wraps=CourseEntitlement.get_active_entitlements_by_course_uuid,
+        ) as mock_get_active_entitlements:
+            progress = meter.progress()
+
+        mock_get_active_entitlements.assert_called_once_with(self.user)
+        progress_by_uuid = {program_progress['uuid']: program_progress for program_progress in progress}
+        assert progress_by_uuid[data[0]['uuid']]['in_progress'] == 2
+        assert progress_by_uuid[data[1]['uuid']]['in_progress'] == 1
+        assert progress_by_uuid[data[1]['uuid']]['not_started'] == 1
+
     def test_shared_enrollment_engagement(self, mock_get_programs):
         """
         Verify that correct programs are returned when the user is enrolled in a
@@ -218,19 +218,22 @@ class ProgramProgressMeter:
             defaultdict, programs keyed by course run ID
         """
         inverted_programs = defaultdict(list)
+        course_uuids = set(self.course_uuids)
 
         for program in self.programs:
             for course in program['courses']:
                 course_uuid = course['uuid']
-                if course_uuid in self.course_uuids:
+                if course_uuid in course_uuids:
                     program_list = inverted_programs[course_uuid]
-                    if program not in program_list:
+                    # Programs are added one at a time, so if this program is
+                    # already in the list it's the last item.
+                    if not program_list or program_list[-1] is not program:
                         program_list.append(program)
                 for course_run in course['course_runs']:
                     course_run_id = course_run['key']
-                    if course_run_id in self.course_run_ids:
+                    if course_run_id in self.enrolled_run_modes:
                         program_list = inverted_programs[course_run_id]
-                        if program not in program_list:
+                        if not program_list or program_list[-1] is not program:
                             program_list.append(program)
 
         # Sort programs by title for consistent presentation.
@@ -249,20 +252,17 @@ class ProgramProgressMeter:
         inverted_programs = self.invert_programs()
 
         programs = []
+        # Dicts aren't a hashable type, so track the programs we've already
+        # added by UUID. The list keeps the ordering, which is important here.
+        added_program_uuids = set()
         # Remember that these course run ids are derived from a list of
         # enrollments sorted from most recent to least recent. Iterating
         # over the values in inverted_programs alone won't yield a program
         # ordering consistent with the user's enrollments.
-        for course_run_id in self.course_run_ids:
-            for program in inverted_programs[course_run_id]:
-                # Dicts aren't a hashable type, so we can't use a set. Sets also
-                # aren't ordered, which is important here.
-                if program not in programs:
-                    programs.append(program)
-
-        for course_uuid in self.course_uuids:
-            for program in inverted_programs[course_uuid]:
-                if program not in programs:
+        for key in chain(self.course_run_ids, self.course_uuids):
+            for program in inverted_programs.get(key, []):
+                if program['uuid'] not in added_program_uuids:
+                    added_program_uuids.add(program['uuid'])
                     programs.append(program)
 
         return programs
@@ -280,7 +280,7 @@ class ProgramProgressMeter:
         Returns:
             bool, indicating whether the course is in progress.
         """
-        enrolled_runs = [run for run in course['course_runs'] if run['key'] in self.course_run_ids]
+        enrolled_runs = [run for run in course['course_runs'] if run['key'] in self.enrolled_run_modes]
 
         # Check if the user is enrolled in a required run and mode/seat.
         runs_with_required_mode = [
@@ -327,10 +327,7 @@ class ProgramProgressMeter:
             completed, in_progress, not_started = [], [], []
 
             for course in program_copy['courses']:
-                active_entitlement = CourseEntitlement.get_entitlement_if_active(
-                    user=self.user,
-                    course_uuid=course['uuid']
-                )
+                active_entitlement = self.active_entitlements_by_course_uuid.get(str(course['uuid']))
                 if self._is_course_complete(course):
                     completed.append(course)
                 elif self._is_course_enrolled(course) or active_entitlement:
@@ -368,6 +365,16 @@ class ProgramProgressMeter:
 
         return progress
 
+    @cached_property
+    def active_entitlements_by_course_uuid(self):
+        """
+        Find the user's active entitlements for all courses in one query.
+
+        Returns:
+            dict mapping course UUID strings to the active CourseEntitlement
+        """
+        return CourseEntitlement.get_active_entitlements_by_course_uuid(self.user)
+
     @property
     def completed_programs_with_available_dates(self):
         """
@@ -378,21 +385,26 @@ class ProgramProgressMeter:
         # Query for all user certs up front, for performance reasons (rather than querying per course run).
         user_certificates = GeneratedCertificate.eligible_available_certificates.filter(user=self.user)
         certificates_by_run = {cert.course_id: cert for cert in user_certificates}
+        course_overviews = CourseOverview.get_from_ids([
+            course_id for course_id, certificate in certificates_by_run.items()
+            if CertificateStatuses.is_passing_status(certificate.status)
+        ])
 
         completed = {}
         for program in self.programs:
-            available_date = self._available_date_for_program(program, certificates_by_run)
+            available_date = self._available_date_for_program(program, certificates_by_run, course_overviews)
             if available_date:
                 completed[program['uuid']] = available_date
         return completed
 
-    def _available_date_for_program(self, program_data, certificates):
+    def _available_date_for_program(self, program_data, certificates, course_overviews):
         """
         Calculate the available date for the program based on the courses within it.
 
         Arguments:
             program_data (dict): nested courses and course runs
             certificates (dict): course run key -> certificate mapping
+            course_overviews (dict): course run key -> CourseOverview mapping, for passing certificates
 
         Returns a datetime object or None if the program is not complete.
         """
@@ -415,7 +427,7 @@ class ProgramProgressMeter:
 
                 # Grab the available date and keep it if it's the earliest one for this catalog course.
                 if modes_match and CertificateStatuses.is_passing_status(certificate.status):
-                    course_overview = CourseOverview.get_from_id(key)
+                    course_overview = course_overviews[key]
                     available_date = certificate_api.available_date_for_certificate(
                         course_overview,
                         certificate
@@ -476,8 +488,8 @@ class ProgramProgressMeter:
             Modify the structure of a course run dict to facilitate comparison
             with course run certificates.
             """
-            return {
-                'course_run_id': course_run['key'],
+            return (
+                course_run['key'],
                 # A course run's type is assumed to indicate which mode must be
                 # completed in order for the run to count towards program completion.
                 # This supports the same flexible program construction allowed by the
@@ -485,10 +497,17 @@ class ProgramProgressMeter:
                 # count towards completion of a course in a program). This may change
                 # in the future to make use of the more rigid set of "applicable seat
                 # types" associated with each program type in the catalog.
-                'type': self._course_run_mode_translation(course_run['type']),
-            }
+                self._course_run_mode_translation(course_run['type']),
+            )
+
+        return any(reshape(course_run) in self._completed_run_keys for course_run in course['course_runs'])
 
-        return any(reshape(course_run) in self.completed_course_runs for course_run in course['course_runs'])
+    @cached_property
+    def _completed_run_keys(self):
+        """
+        The (course_run_id, type) pairs of completed_course_runs, for fast lookups.
+        """
+        return {(run['course_run_id'], run['type']) for run in self.completed_course_runs}
 
     @cached_property
     def completed_course_runs(self):
@@ -506,9 +525,9 @@ class ProgramProgressMeter:
         Determine which course runs have been failed by the user.
 
         Returns:
-            list of strings, each a course run ID
+            set of strings, each a course run ID
         """
-        return [run['course_run_id'] for run in self.course_runs_with_state['failed']]
+        return {run['course_run_id'] for run in self.course_runs_with_state['failed']}
 
     @cached_property
     def course_runs_with_state(self):
@@ -521,25 +540,33 @@ class ProgramProgressMeter:
         Returns:
             dict with a list of completed and failed runs
         """
-        course_run_certificates = certificate_api.get_certificates_for_user(self.user.username)
+        # Fetch all of the user's certificates and their courses' overviews up
+        # front, rather than querying per certificate.
+        course_run_certificates = list(GeneratedCertificate.eligible_certificates.filter(user=self.user))
+        course_overviews = CourseOverview.get_from_ids(
+            {certificate.course_id for certificate in course_run_certificates}
+        )
 
         completed_runs, failed_runs = [], []
         for certificate in course_run_certificates:
-            course_key = certificate['course_key']
+            course_key = certificate.course_id
+            course_overview = course_overviews.get(course_key)
+            if course_overview is None and not certificate.download_url:
+                # Like certificate_api.get_certificates_for_user, ignore certificates for unknown courses.
+                continue
+
             course_data = {
                 'course_run_id': str(course_key),
-                'type': self._certificate_mode_translation(certificate['type']),
+                'type': self._certificate_mode_translation(certificate.mode),
             }
 
-            try:
-                course_overview = CourseOverview.get_from_id(course_key)
-            except CourseOverview.DoesNotExist:
+            if course_overview is None:
                 may_certify = True
             else:
                 may_certify = certificate_api.certificates_viewable_for_course(course_overview)
 
             if (
-                CertificateStatuses.is_passing_status(certificate['status'])
+                CertificateStatuses.is_passing_status(certificate.status)
                 and may_certify
             ):
                 completed_runs.append(course_data)
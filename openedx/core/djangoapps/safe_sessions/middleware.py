@@ -76,6 +76,9 @@ Custom Attributes:
 """
 
 import inspect
+import threading
+import time
+from collections import OrderedDict
 from hashlib import sha1, sha256
 from logging import getLogger
 from typing import Union
@@ -154,6 +157,25 @@ LOG_REQUEST_USER_CHANGE_HEADERS_DURATION = getattr(settings, 'LOG_REQUEST_USER_C
 # .. toggle_tickets: https://openedx.atlassian.net/browse/ARCHBOM-1861
 ENFORCE_SAFE_SESSIONS = SettingToggle('ENFORCE_SAFE_SESSIONS', default=True)
 
+# .. toggle_name: SAFE_SESSIONS_VERIFICATION_CACHE
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: Remember safe cookies that were verified for a user in each process, so that later requests
+#   with the same cookie and user skip checking its signature until the signature expires. Also send back the safe
+#   cookie of the request unchanged when the session and user didn't change and the cookie was signed less than
+#   SAFE_COOKIE_RESIGN_AGE seconds ago, instead of signing a new one.
+# .. toggle_warning: Cookies that are sent back unchanged expire up to SAFE_COOKIE_RESIGN_AGE seconds before
+#   SESSION_COOKIE_AGE has passed since the session was last saved.
+# .. toggle_use_cases: opt_in
+# .. toggle_creation_date: 2026-10-19
+SAFE_SESSIONS_VERIFICATION_CACHE = SettingToggle('SAFE_SESSIONS_VERIFICATION_CACHE', default=False)
+
+# Maximum number of verified safe cookies that each process remembers.
+VERIFIED_SAFE_COOKIES_MAX_SIZE = 10000
+
+# Safe cookies signed less than this many seconds ago are not signed again in responses.
+SAFE_COOKIE_RESIGN_AGE = 60 * 60
+
 log = getLogger(__name__)
 
 # RequestCache for conveying information from views back up to the
@@ -188,6 +210,11 @@ class SafeCookieData:
     CURRENT_VERSION = '1'
     SEPARATOR = "|"
 
+    # Signing times of verified safe cookies, by serialized cookie data and user id,
+    # from the least to the most recently used.
+    _verified_signing_times = OrderedDict()
+    _verified_signing_times_lock = threading.Lock()
+
     def __init__(self, version, session_id, key_salt, signature):
         """
         Arguments:
@@ -275,9 +302,18 @@ class SafeCookieData:
         Successful verification implies this cookie data is fresh
         (not expired) and bound to the given user.
         """
+        use_verification_cache = SAFE_SESSIONS_VERIFICATION_CACHE.is_enabled()
+        if use_verification_cache:
+            verified_key = (str(self), str(user_id))
+            signing_time = self._get_verified_signing_time(verified_key)
+            if signing_time is not None and time.time() - signing_time <= settings.SESSION_COOKIE_AGE:
+                return True
+
         try:
             unsigned_data = signing.loads(self.signature, salt=self.key_salt, max_age=settings.SESSION_COOKIE_AGE)
             if unsigned_data == self._compute_digest(user_id):
+                if use_verification_cache:
+                    self._remember_verified(verified_key, self.signing_time())
                 return True
             log.error("SafeCookieData '%r' is not bound to user '%s'.", str(self), user_id)
         except signing.BadSignature as sig_error:
@@ -289,6 +325,37 @@ class SafeCookieData:
             )
         return False
 
+    def signing_time(self):
+        """
+        Returns the time at which the signature was created, in seconds since
+        the epoch. Only meaningful once the signature has been verified.
+        """
+        return signing.b62_decode(self.signature.rsplit(':', 2)[-2])
+
+    @classmethod
+    def _get_verified_signing_time(cls, verified_key):
+        """
+        Returns the signing time of the cookie data if it was verified for the
+        user, marking it as the most recently used, or None.
+        """
+        with cls._verified_signing_times_lock:
+            signing_time = cls._verified_signing_times.get(verified_key)
+            if signing_time is not None:
+                cls._verified_signing_times.move_to_end(verified_key)
+            return signing_time
+
+    @classmethod
+    def _remember_verified(cls, verified_key, signing_time):
+        """
+        Remembers that the cookie data was verified for the user, forgetting
+        the least recently used verified cookie data if there are too many.
+        """
+        with cls._verified_signing_times_lock:
+            cls._verified_signing_times[verified_key] = signing_time
+            cls._verified_signing_times.move_to_end(verified_key)
+            if len(cls._verified_signing_times) > VERIFIED_SAFE_COOKIES_MAX_SIZE:
+                cls._verified_signing_times.popitem(last=False)
+
     def _compute_digest(self, user_id):
         """
         Returns SHA256(version '|' session_id '|' user_id '|') hex string.
@@ -404,6 +471,7 @@ class SafeSessionMiddleware(SessionMiddleware, MiddlewareMixin):
             if safe_cookie_data.verify(user_id):  # Step 4
                 request.safe_cookie_verified_user_id = user_id  # Step 5
                 request.safe_cookie_verified_session_id = request.session.session_key
+                request.safe_cookie_verified_data = safe_cookie_data
                 if LOG_REQUEST_USER_CHANGES:
                     # Although it is non-obvious, this seems to be early enough
                     #   to track the very first setting of request.user for
@@ -457,7 +525,8 @@ class SafeSessionMiddleware(SessionMiddleware, MiddlewareMixin):
                 # Use the user_id marked in the session instead of the
                 # one in the request in case the user is not set in the
                 # request, for example during Anonymous API access.
-                self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
+                if not self._reuse_verified_safe_cookie(request, response.cookies, user_id_in_session):
+                    self.update_with_safe_session_cookie(response.cookies, user_id_in_session)  # Step 3
             except SafeCookieError:
                 _mark_cookie_for_deletion(request)
 
@@ -751,6 +820,28 @@ class SafeSessionMiddleware(SessionMiddleware, MiddlewareMixin):
         # Update the cookie's value with the safe_cookie_data.
         cookies[settings.SESSION_COOKIE_NAME] = str(safe_cookie_data)
 
+    @staticmethod
+    def _reuse_verified_safe_cookie(request, cookies, user_id):
+        """
+        Puts the safe cookie data that the request was verified with back in
+        the session cookie, if it binds the same session and user and was
+        signed recently. Returns whether it did.
+        """
+        if not SAFE_SESSIONS_VERIFICATION_CACHE.is_enabled():
+            return False
+
+        safe_cookie_data = getattr(request, 'safe_cookie_verified_data', None)
+        if (
+            safe_cookie_data is None or
+            safe_cookie_data.session_id != cookies[settings.SESSION_COOKIE_NAME].value or
+            request.safe_cookie_verified_user_id != user_id or
+            time.time() - safe_cookie_data.signing_time() > SAFE_COOKIE_RESIGN_AGE
+        ):
+            return False
+
+        cookies[settings.SESSION_COOKIE_NAME] = str(safe_cookie_data)
+        return True
+
     @staticmethod
     def _get_recent_user_change_cache_key(user_id):
         """ Get cache key for flagging a recent mismatch for the provided user id. """
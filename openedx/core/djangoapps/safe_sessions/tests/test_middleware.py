@@ -223,6 +223,28 @@ class TestSafeSessionProcessResponse(TestSafeSessionsLogMixin, TestCase):
         assert safe_cookie_data.session_id == 'some_session_id'
         assert safe_cookie_data.verify(self.user.id)
 
+    @override_settings(SAFE_SESSIONS_VERIFICATION_CACHE=True)
+    def test_reuse_verified_cookie_data_at_step_3(self):
+        self.request.safe_cookie_verified_user_id = self.user.id
+        self.request.safe_cookie_verified_data = SafeCookieData.create('some_session_id', self.user.id)
+        with patch.object(SafeCookieData, 'create') as mock_create:
+            self.assert_response(set_request_user=True, set_session_cookie=True)
+            assert not mock_create.called
+
+        serialized_cookie_data = self.client.response.cookies[settings.SESSION_COOKIE_NAME].value
+        assert serialized_cookie_data == str(self.request.safe_cookie_verified_data)
+
+    @override_settings(SAFE_SESSIONS_VERIFICATION_CACHE=True)
+    def test_resign_changed_session_at_step_3(self):
+        self.request.safe_cookie_verified_user_id = self.user.id
+        self.request.safe_cookie_verified_data = SafeCookieData.create('old_session_id', self.user.id)
+        self.assert_response(set_request_user=True, set_session_cookie=True)
+
+        serialized_cookie_data = self.client.response.cookies[settings.SESSION_COOKIE_NAME].value
+        safe_cookie_data = SafeCookieData.parse(serialized_cookie_data)
+        assert safe_cookie_data.session_id == 'some_session_id'
+        assert safe_cookie_data.verify(self.user.id)
+
     def test_cant_update_cookie_at_step_3_error(self):
         self.client.response.cookies[settings.SESSION_COOKIE_NAME] = None
         with self.assert_invalid_session_id():
@@ -11,6 +11,7 @@ from unittest.mock import patch
 import pytest
 import ddt
 from django.test import TestCase
+from django.test.utils import override_settings
 
 from ..middleware import SafeCookieData, SafeCookieError
 from .test_utils import TestSafeSessionsLogMixin
@@ -123,6 +124,46 @@ class TestSafeCookieData(TestSafeSessionsLogMixin, TestCase):
             with self.assert_signature_error_logged('Signature age'):
                 assert not self.safe_cookie_data.verify(self.user_id)
 
+    #- Test verify: verification cache -#
+
+    @override_settings(SAFE_SESSIONS_VERIFICATION_CACHE=True)
+    @patch.dict(SafeCookieData._verified_signing_times, clear=True)
+    def test_verify_cached(self):
+        assert self.safe_cookie_data.verify(self.user_id)
+        with patch('django.core.signing.loads') as mock_loads:
+            assert SafeCookieData.parse(str(self.safe_cookie_data)).verify(self.user_id)
+            assert not mock_loads.called
+
+            # The cached verification is only for the user it was verified for.
+            with self.assert_incorrect_user_logged():
+                assert not self.safe_cookie_data.verify('another_user_id')
+
+    @override_settings(SAFE_SESSIONS_VERIFICATION_CACHE=True)
+    @patch.dict(SafeCookieData._verified_signing_times, clear=True)
+    def test_verify_cached_expired_signature(self):
+        assert self.safe_cookie_data.verify(self.user_id)
+        three_weeks_from_now = time() + 60 * 60 * 24 * 7 * 3
+        with patch('time.time', return_value=three_weeks_from_now):
+            with self.assert_signature_error_logged('Signature age'):
+                assert not self.safe_cookie_data.verify(self.user_id)
+
+    @override_settings(SAFE_SESSIONS_VERIFICATION_CACHE=True)
+    @patch.dict(SafeCookieData._verified_signing_times, clear=True)
+    @patch('openedx.core.djangoapps.safe_sessions.middleware.VERIFIED_SAFE_COOKIES_MAX_SIZE', 2)
+    def test_verify_cached_least_recently_used(self):
+        other_safe_cookie_data = SafeCookieData.create('other_session_id', self.user_id)
+        assert self.safe_cookie_data.verify(self.user_id)
+        assert other_safe_cookie_data.verify(self.user_id)
+        # Using the first cookie again makes the other one the least recently used.
+        assert self.safe_cookie_data.verify(self.user_id)
+        new_safe_cookie_data = SafeCookieData.create('new_session_id', self.user_id)
+        assert new_safe_cookie_data.verify(self.user_id)
+
+        assert list(SafeCookieData._verified_signing_times) == [
+            (str(self.safe_cookie_data), self.user_id),
+            (str(new_safe_cookie_data), self.user_id),
+        ]
+
     #- Test verify: incorrect user -#
 
     @ddt.data(None, 'invalid_user_id', -1)
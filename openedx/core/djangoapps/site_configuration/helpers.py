@@ -23,6 +23,13 @@ def get_current_site_configuration():
 
     # Import is placed here to avoid model import at project startup.
     from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
+    from openedx.core.djangoapps.site_configuration.snapshot import (
+        SITE_CONFIGURATION_SNAPSHOT,
+        get_site_configuration_snapshot
+    )
+    if SITE_CONFIGURATION_SNAPSHOT.is_enabled():
+        return get_site_configuration_snapshot().get_configuration_for_site(site.id) if site else None
+
     try:
         return getattr(site, "configuration", None)
     except SiteConfiguration.DoesNotExist:
@@ -8,12 +8,19 @@ from logging import getLogger
 
 from django.contrib.sites.models import Site
 from django.db import models
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from jsonfield.fields import JSONField
 from model_utils.models import TimeStampedModel
 
+from openedx.core.djangoapps.site_configuration.snapshot import (
+    SITE_CONFIGURATION_SNAPSHOT,
+    get_course_org_filter,
+    get_site_configuration_snapshot,
+    invalidate_site_configuration_snapshot
+)
+
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
 
@@ -79,16 +86,14 @@ class SiteConfiguration(models.Model):
             org (str): Org to use to filter SiteConfigurations
             select_related (list or None): A list of values to pass as arguments to select_related
         """
+        if SITE_CONFIGURATION_SNAPSHOT.is_enabled():
+            return get_site_configuration_snapshot().get_configuration_for_org(org)
+
         query = cls.objects.filter(site_values__contains=org, enabled=True).all()
         if select_related is not None:
             query = query.select_related(*select_related)
         for configuration in query:
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            # The value of 'course_org_filter' can be configured as a string representing
-            # a single organization or a list of strings representing multiple organizations.
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            if org in course_org_filter:
+            if org in get_course_org_filter(configuration):
                 return configuration
         return None
 
@@ -121,13 +126,13 @@ class SiteConfiguration(models.Model):
         Returns:
             A set of all organizations present in site configuration.
         """
+        if SITE_CONFIGURATION_SNAPSHOT.is_enabled():
+            return set(get_site_configuration_snapshot().all_orgs)
+
         org_filter_set = set()
 
         for configuration in cls.objects.filter(site_values__contains='course_org_filter', enabled=True).all():
-            course_org_filter = configuration.get_value('course_org_filter', [])
-            if not isinstance(course_org_filter, list):
-                course_org_filter = [course_org_filter]
-            org_filter_set.update(course_org_filter)
+            org_filter_set.update(get_course_org_filter(configuration))
         return org_filter_set
 
     @classmethod
@@ -138,6 +143,8 @@ class SiteConfiguration(models.Model):
         Returns:
             True if given organization is present in site configurations otherwise False.
         """
+        if SITE_CONFIGURATION_SNAPSHOT.is_enabled():
+            return org in get_site_configuration_snapshot().all_orgs
         return org in cls.get_all_orgs()
 
 
@@ -216,3 +223,12 @@ def update_site_configuration_history(sender, instance, created, **kwargs):  # p
             site_values=instance.site_values,
             enabled=instance.enabled,
         )
+
+
+@receiver(post_save, sender=SiteConfiguration)
+@receiver(post_delete, sender=SiteConfiguration)
+def invalidate_snapshot(sender, **kwargs):  # pylint: disable=unused-argument
+    """
+    Make all processes reload the site configuration snapshot.
+    """
+    invalidate_site_configuration_snapshot()
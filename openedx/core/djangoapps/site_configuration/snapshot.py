@@ -0,0 +1,161 @@
+"""
+An in-process snapshot of all site configurations.
+
+Looking up the configuration of an org scans the site_values of every enabled
+site configuration, which gets expensive on installs with many sites. When
+the SITE_CONFIGURATION_SNAPSHOT toggle is enabled, every process instead loads
+all site configurations once, together with an index from org to site
+configuration, and keeps them until the snapshot version changes.
+
+The snapshot version is kept in the django cache, so that it is shared by all
+processes, and is changed whenever a site configuration is saved or deleted,
+and again once the change is committed. Each request checks the version at
+most once.
+
+Note that queryset updates don't send signals, so they don't change the
+snapshot version either.
+"""
+from copy import deepcopy
+from logging import getLogger
+from types import MappingProxyType
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+from edx_django_utils.cache import RequestCache
+from edx_toggles.toggles import SettingToggle
+
+from openedx.core.lib.cache_utils import request_cached
+
+log = getLogger(__name__)
+
+# .. toggle_name: SITE_CONFIGURATION_SNAPSHOT
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, site configurations are read from a snapshot of all site configurations that
+#   each process loads once and reloads whenever a site configuration is saved or deleted, instead of being queried
+#   from the database on every lookup.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+SITE_CONFIGURATION_SNAPSHOT = SettingToggle('SITE_CONFIGURATION_SNAPSHOT', default=False, module_name=__name__)
+
+SNAPSHOT_VERSION_CACHE_KEY = 'site_configuration.snapshot.version'
+SNAPSHOT_VERSION_NAMESPACE = 'site_configuration.snapshot'
+
+_snapshot = None
+
+
+class SiteConfigurationSnapshot:
+    """
+    The site configurations of all sites, and the org index of the enabled
+    ones, at one snapshot version.
+
+    The configurations are shared by all requests of the process, so the
+    lookups return copies of them, which callers are free to modify.
+    """
+
+    def __init__(self, version, configurations):
+        self.version = version
+        self.configurations_by_site_id = MappingProxyType({
+            configuration.site_id: configuration for configuration in configurations
+        })
+
+        configurations_by_org = {}
+        for configuration in configurations:
+            if not configuration.enabled:
+                continue
+            for org in get_course_org_filter(configuration):
+                # Match the database lookup, which returns the first matching configuration.
+                configurations_by_org.setdefault(org, configuration)
+        self.configurations_by_org = MappingProxyType(configurations_by_org)
+        self.all_orgs = frozenset(configurations_by_org)
+
+    def get_configuration_for_site(self, site_id):
+        """
+        Returns a copy of the SiteConfiguration of the given site, or None.
+        """
+        return _copy_configuration(self.configurations_by_site_id.get(site_id))
+
+    def get_configuration_for_org(self, org):
+        """
+        Returns a copy of the enabled SiteConfiguration whose course_org_filter
+        has the given org, or None.
+        """
+        return _copy_configuration(self.configurations_by_org.get(org))
+
+
+def _copy_configuration(configuration):
+    """
+    Returns a copy of the given SiteConfiguration, including its site_values,
+    so that changes to it don't leak into the snapshot.
+    """
+    if configuration is None:
+        return None
+    return deepcopy(configuration)
+
+
+def get_course_org_filter(configuration):
+    """
+    Returns the orgs of the configuration's course_org_filter as a list.
+
+    The value of 'course_org_filter' can be configured as a string representing
+    a single organization or a list of strings representing multiple organizations.
+    """
+    course_org_filter = configuration.get_value('course_org_filter', [])
+    if not isinstance(course_org_filter, list):
+        course_org_filter = [course_org_filter]
+    return course_org_filter
+
+
+def get_site_configuration_snapshot():
+    """
+    Returns the current SiteConfigurationSnapshot, loading it if this process
+    doesn't have the current version yet.
+    """
+    global _snapshot  # pylint: disable=global-statement
+
+    version = _get_snapshot_version()
+    snapshot = _snapshot
+    if snapshot is None or snapshot.version != version:
+        # Import is placed here to avoid model import at project startup.
+        from openedx.core.djangoapps.site_configuration.models import SiteConfiguration
+        configurations = list(SiteConfiguration.objects.select_related('site').order_by('id'))
+        snapshot = _snapshot = SiteConfigurationSnapshot(version, configurations)
+        log.info("Loaded site configuration snapshot %s with %d configurations", version, len(configurations))
+    return snapshot
+
+
+def invalidate_site_configuration_snapshot():
+    """
+    Changes the snapshot version, so that all processes reload the snapshot.
+
+    The version is changed again once the current transaction commits, so that
+    a process which reloaded the snapshot before the change was committed
+    doesn't keep the old configurations.
+    """
+    _bump_snapshot_version()
+    transaction.on_commit(_bump_snapshot_version)
+
+
+def _bump_snapshot_version():
+    """
+    Replaces the snapshot version with a new one.
+    """
+    cache.set(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
+    RequestCache(SNAPSHOT_VERSION_NAMESPACE).clear()
+
+
+@request_cached(SNAPSHOT_VERSION_NAMESPACE)
+def _get_snapshot_version():
+    """
+    Returns the current snapshot version, starting a new one if the cache
+    doesn't have it.
+
+    A random version, rather than a counter, is used so that a version that
+    was evicted from the cache can't be confused with an older snapshot.
+    """
+    version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(SNAPSHOT_VERSION_CACHE_KEY, uuid4().hex, None)
+        version = cache.get(SNAPSHOT_VERSION_CACHE_KEY)
+    return version
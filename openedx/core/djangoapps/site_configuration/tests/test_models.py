@@ -5,7 +5,7 @@ from unittest.mock import patch
 import pytest
 from django.contrib.sites.models import Site
 from django.db import IntegrityError, transaction
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from openedx.core.djangoapps.site_configuration.models import (
     SiteConfiguration,
     SiteConfigurationHistory,
@@ -319,3 +319,71 @@ class SiteConfigurationTests(TestCase):
 
         # Test that the default value is returned if the value for the given key is not found in the configuration
         self.assertCountEqual(SiteConfiguration.get_all_orgs(), expected_orgs)
+
+    @override_settings(SITE_CONFIGURATION_SNAPSHOT=True)
+    def test_site_configuration_snapshot(self):
+        """
+        Test that org lookups are served from the snapshot, which is reloaded after site configurations change.
+        """
+        config1 = SiteConfigurationFactory.create(
+            site=self.site,
+            site_values=self.test_config1
+        )
+        SiteConfigurationFactory.create(
+            site=self.site2,
+            site_values=self.test_config2,
+            enabled=False,
+        )
+        org1 = self.test_config1['course_org_filter']
+        org2 = self.test_config2['course_org_filter']
+
+        self.assertCountEqual(SiteConfiguration.get_all_orgs(), [org1])
+        with self.assertNumQueries(0):
+            assert SiteConfiguration.get_configuration_for_org(org1) == config1
+            assert SiteConfiguration.get_value_for_org(org1, 'university') == self.test_config1['university']
+            assert SiteConfiguration.has_org(org1)
+            assert not SiteConfiguration.has_org(org2)
+
+        config1.site_values = dict(self.test_config1, course_org_filter=[org1, org2])
+        config1.save()
+        self.assertCountEqual(SiteConfiguration.get_all_orgs(), [org1, org2])
+        assert SiteConfiguration.get_configuration_for_org(org2) == config1
+
+        config1.delete()
+        assert SiteConfiguration.get_all_orgs() == set()
+        assert SiteConfiguration.get_configuration_for_org(org1) is None
+
+    @override_settings(SITE_CONFIGURATION_SNAPSHOT=True)
+    def test_site_configuration_snapshot_returns_copies(self):
+        """
+        Test that modifying a configuration returned from the snapshot doesn't change the snapshot.
+        """
+        SiteConfigurationFactory.create(
+            site=self.site,
+            site_values=self.test_config1
+        )
+        org1 = self.test_config1['course_org_filter']
+
+        configuration = SiteConfiguration.get_configuration_for_org(org1)
+        configuration.site_values['university'] = 'Changed University'
+
+        assert SiteConfiguration.get_value_for_org(org1, 'university') == self.test_config1['university']
+
+    @override_settings(SITE_CONFIGURATION_SNAPSHOT=True)
+    def test_site_configuration_snapshot_invalidated_on_commit(self):
+        """
+        Test that a snapshot loaded before a change commits is reloaded once it commits.
+        """
+        org1 = self.test_config1['course_org_filter']
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteConfigurationFactory.create(
+                site=self.site,
+                site_values=self.test_config1
+            )
+            # A concurrent reader loads the snapshot without the uncommitted configuration.
+            with patch.object(SiteConfiguration.objects, 'select_related') as mock_select_related:
+                mock_select_related.return_value.order_by.return_value = []
+                assert not SiteConfiguration.has_org(org1)
+
+        assert SiteConfiguration.has_org(org1)
@@ -27,6 +27,19 @@ from functools import lru_cache
 
 logger = getLogger(__name__)  # pylint: disable=invalid-name
 
+# .. toggle_name: CACHE_THEME_TEMPLATE_LOOKUPS
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, whether a theme overrides a template is remembered for the lifetime of the
+#   process instead of being checked on the filesystem every time the template is rendered.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_warning: Templates added to or removed from a theme are only noticed after a restart.
+CACHE_THEME_TEMPLATE_LOOKUPS = SettingToggle('CACHE_THEME_TEMPLATE_LOOKUPS', default=False, module_name=__name__)
+
+# The number of (theme, template) lookups remembered when CACHE_THEME_TEMPLATE_LOOKUPS is enabled.
+THEME_TEMPLATE_LOOKUP_CACHE_SIZE = 4096
+
 
 @request_cached()
 def get_template_path(relative_path, **kwargs):  # lint-amnesty, pylint: disable=unused-argument
@@ -68,13 +81,35 @@ def get_template_path_with_theme(relative_path):
     template_name = re.sub(r'^/+', '', relative_path)
 
     template_path = theme.template_path / template_name
-    absolute_path = theme.path / "templates" / template_name
-    if absolute_path.exists():
+    if _theme_has_template(str(theme.path / "templates"), template_name):
         return str(template_path)
     else:
         return relative_path
 
 
+def _theme_has_template(theme_templates_dir, template_name):
+    """
+    Returns whether the theme templates directory contains the given template.
+
+    With CACHE_THEME_TEMPLATE_LOOKUPS enabled, both hits and misses are
+    remembered for the lifetime of the process, so templates added to a theme
+    are only found after a restart, just like new themes.
+    """
+    if CACHE_THEME_TEMPLATE_LOOKUPS.is_enabled():
+        return _cached_template_exists(theme_templates_dir, template_name)
+    return _template_exists(theme_templates_dir, template_name)
+
+
+def _template_exists(templates_dir, template_name):
+    """
+    Returns whether the templates directory contains the given template.
+    """
+    return os.path.exists(os.path.join(templates_dir, template_name))
+
+
+_cached_template_exists = lru_cache(maxsize=THEME_TEMPLATE_LOOKUP_CACHE_SIZE)(_template_exists)
+
+
 def get_all_theme_template_dirs():
     """
     Returns template directories for all the themes.
@@ -4,7 +4,24 @@ Django models supporting the Comprehensive Theming subsystem
 
 
 from django.contrib.sites.models import Site
-from django.db import models
+from django.db import models, transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from edx_django_utils.cache import TieredCache
+from edx_toggles.toggles import SettingToggle
+
+# .. toggle_name: CACHE_SITE_THEMES
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: When enabled, the theme of each site is cached instead of being queried from the database on
+#   every request. The cached theme is cleared whenever a SiteTheme is saved or deleted, and again once the change
+#   is committed.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+CACHE_SITE_THEMES = SettingToggle('CACHE_SITE_THEMES', default=False, module_name=__name__)
+
+SITE_THEME_CACHE_KEY_TPL = 'theming.site_theme.{site_id}'
+SITE_THEME_CACHE_TIMEOUT = 60 * 60
 
 
 class SiteTheme(models.Model):
@@ -19,9 +36,18 @@ class SiteTheme(models.Model):
     site = models.ForeignKey(Site, related_name='themes', on_delete=models.CASCADE)
     theme_dir_name = models.CharField(max_length=255)
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # The site as last loaded or saved, so that moving a theme to another site also clears the old site's cache.
+        self._saved_site_id = self.__dict__.get('site_id') if self.pk is not None else None
+
     def __str__(self):
         return self.theme_dir_name
 
+    def save(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super().save(*args, **kwargs)
+        self._saved_site_id = self.site_id
+
     @staticmethod
     def get_theme(site, default=None):
         """
@@ -37,8 +63,24 @@ class SiteTheme(models.Model):
             SiteTheme object for given site or a default site passed in as the argument.
         """
 
-        theme = site.themes.first()
-        return theme or default
+        if not CACHE_SITE_THEMES.is_enabled():
+            theme = site.themes.first()
+            return theme or default
+
+        # Cache the theme's fields rather than the model, and also cache
+        # sites without a theme.
+        cache_key = SITE_THEME_CACHE_KEY_TPL.format(site_id=site.id)
+        cached_response = TieredCache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            theme_fields = cached_response.value
+        else:
+            theme_fields = site.themes.order_by('pk').values_list('id', 'theme_dir_name').first()
+            TieredCache.set_all_tiers(cache_key, theme_fields, SITE_THEME_CACHE_TIMEOUT)
+
+        if theme_fields is None:
+            return default
+        theme_id, theme_dir_name = theme_fields
+        return SiteTheme(id=theme_id, site=site, theme_dir_name=theme_dir_name)
 
     @staticmethod
     def has_theme(site):
@@ -53,3 +95,24 @@ class SiteTheme(models.Model):
             True if given site has an associated site theme in database, returns False otherwise.
         """
         return site.themes.exists()
+
+
+@receiver(post_save, sender=SiteTheme)
+@receiver(post_delete, sender=SiteTheme)
+def clear_cached_site_theme(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Clear the cached theme of the site whose SiteTheme changed, and of the
+    site it belonged to before, if it was moved.
+
+    The cache is cleared again once the current transaction commits, so that
+    a theme cached by a concurrent request before the commit doesn't linger.
+    """
+    site_ids = {instance.site_id, instance._saved_site_id} - {None}  # pylint: disable=protected-access
+    cache_keys = [SITE_THEME_CACHE_KEY_TPL.format(site_id=site_id) for site_id in site_ids]
+
+    def delete_cached_themes():
+        for cache_key in cache_keys:
+            TieredCache.delete_all_tiers(cache_key)
+
+    delete_cached_themes()
+    transaction.on_commit(delete_cached_themes)
@@ -135,6 +135,29 @@ class TestHelpersLMS(TestCase):
         template_path = get_template_path_with_theme('course.html')
         assert template_path == 'course.html'
 
+    @override_settings(CACHE_THEME_TEMPLATE_LOOKUPS=True)
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_remembers_lookups(self):
+        """
+        Tests theme template lookups, including for missing templates, are remembered.
+        """
+        cached_template_exists = theming_helpers._cached_template_exists  # pylint: disable=protected-access
+        for template_name in ('header.html', 'course.html'):
+            template_path = get_template_path_with_theme(template_name)
+            hits = cached_template_exists.cache_info().hits
+            assert get_template_path_with_theme(template_name) == template_path
+            assert cached_template_exists.cache_info().hits == hits + 1
+
+    @with_comprehensive_theme('red-theme')
+    def test_get_template_path_with_theme_lookups_not_remembered_by_default(self):
+        """
+        Tests theme template lookups are not remembered unless CACHE_THEME_TEMPLATE_LOOKUPS is enabled.
+        """
+        cached_template_exists = theming_helpers._cached_template_exists  # pylint: disable=protected-access
+        currsize = cached_template_exists.cache_info().currsize
+        assert get_template_path_with_theme('header.html') == 'red-theme/lms/templates/header.html'
+        assert cached_template_exists.cache_info().currsize == currsize
+
     def test_get_template_path_with_theme_disabled(self):
         """
         Tests default template paths are returned when theme is non theme is enabled.
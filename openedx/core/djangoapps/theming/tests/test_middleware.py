@@ -6,8 +6,10 @@
 from django.contrib.messages.middleware import MessageMiddleware
 from django.contrib.sites.models import Site
 from django.test import RequestFactory, TestCase, override_settings
+from edx_django_utils.cache import TieredCache
 
 from openedx.core.djangoapps.theming.middleware import CurrentSiteThemeMiddleware
+from openedx.core.djangoapps.theming.models import SITE_THEME_CACHE_KEY_TPL, SiteTheme
 from common.djangoapps.student.tests.factories import UserFactory
 
 from ..views import set_user_preview_site_theme
@@ -100,3 +102,65 @@ class TestCurrentSiteThemeMiddleware(TestCase):
         get_request = self.create_mock_get_request(qs_theme=TEST_THEME_NAME)
         assert self.site_theme_middleware.process_request(get_request) is None
         assert get_request.site_theme.theme_dir_name == TEST_THEME_NAME  # lint-amnesty, pylint: disable=no-member
+
+    @override_settings(CACHE_SITE_THEMES=True, DEFAULT_SITE_THEME=None)
+    def test_cached_site_theme(self):
+        """
+        Verify that the cached site theme, or lack of one, is refreshed when
+        the site's theme changes.
+        """
+        TieredCache.dangerous_clear_all_tiers()
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+
+        request = self.create_mock_get_request()
+        self.site_theme_middleware.process_request(request)
+        assert request.site_theme is None  # lint-amnesty, pylint: disable=no-member
+        with self.assertNumQueries(0):
+            assert SiteTheme.get_theme(request.site) is None
+
+        site_theme = SiteTheme.objects.create(site=request.site, theme_dir_name=TEST_THEME_NAME)
+        request = self.create_mock_get_request()
+        self.site_theme_middleware.process_request(request)
+        assert request.site_theme.id == site_theme.id  # lint-amnesty, pylint: disable=no-member
+        assert request.site_theme.theme_dir_name == TEST_THEME_NAME  # lint-amnesty, pylint: disable=no-member
+        with self.assertNumQueries(0):
+            assert SiteTheme.get_theme(request.site).theme_dir_name == TEST_THEME_NAME
+
+        site_theme.delete()
+        assert SiteTheme.get_theme(request.site) is None
+
+    @override_settings(CACHE_SITE_THEMES=True, DEFAULT_SITE_THEME=None)
+    def test_cached_site_theme_cleared_on_commit(self):
+        """
+        Verify that a site theme cached before a change commits is cleared once it commits.
+        """
+        TieredCache.dangerous_clear_all_tiers()
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        site = Site.objects.get_current()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            SiteTheme.objects.create(site=site, theme_dir_name=TEST_THEME_NAME)
+            # A concurrent request caches that the site has no theme.
+            TieredCache.set_all_tiers(SITE_THEME_CACHE_KEY_TPL.format(site_id=site.id), None, 60)
+
+        assert SiteTheme.get_theme(site).theme_dir_name == TEST_THEME_NAME
+
+    @override_settings(CACHE_SITE_THEMES=True, DEFAULT_SITE_THEME=None)
+    def test_cached_site_theme_moved_to_another_site(self):
+        """
+        Verify that moving a theme to another site clears the cached theme of both sites.
+        """
+        TieredCache.dangerous_clear_all_tiers()
+        self.addCleanup(TieredCache.dangerous_clear_all_tiers)
+        site = Site.objects.get_current()
+        other_site = Site.objects.create(domain='other.example.com', name='other.example.com')
+        site_theme = SiteTheme.objects.create(site=site, theme_dir_name=TEST_THEME_NAME)
+        assert SiteTheme.get_theme(site).theme_dir_name == TEST_THEME_NAME
+        assert SiteTheme.get_theme(other_site) is None
+
+        site_theme = SiteTheme.objects.get(pk=site_theme.pk)
+        site_theme.site = other_site
+        site_theme.save()
+
+        assert SiteTheme.get_theme(site) is None
+        assert SiteTheme.get_theme(other_site).theme_dir_name == TEST_THEME_NAME
@@ -7,9 +7,10 @@ from datetime import datetime, timedelta  # lint-amnesty, pylint: disable=wrong-
 
 import ddt
 import pytz
+from django.test import override_settings
 from django.utils import timezone
 from edx_django_utils.cache import RequestCache
-from unittest.mock import Mock  # lint-amnesty, pylint: disable=wrong-import-order
+from unittest.mock import Mock, patch  # lint-amnesty, pylint: disable=wrong-import-order
 from opaque_keys.edx.locator import CourseLocator
 
 from common.djangoapps.course_modes.tests.factories import CourseModeFactory
@@ -394,6 +395,86 @@ class TestContentTypeGatingConfig(CacheIsolationTestCase):  # pylint: disable=mi
         with self.assertNumQueries(0):
             assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
 
+    def test_resolution_table(self):
+        course = CourseOverviewFactory.create(org='test-org')
+        site_cfg = SiteConfigurationFactory.create(
+            site_values={'course_org_filter': course.org}
+        )
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+        ContentTypeGatingConfig.objects.create(site=site_cfg.site, enabled=False)
+        org_config = ContentTypeGatingConfig.objects.create(org=course.org, enabled=True)
+        other_courses = [CourseOverviewFactory.create(org=course.org) for _ in range(20)]
+        for other_course in other_courses:
+            ContentTypeGatingConfig.objects.create(course=other_course, enabled=False)
+
+        expected_configs = ContentTypeGatingConfig.all_current_course_configs()
+
+        with override_settings(STACKED_CONFIG_RESOLUTION_TABLES=True):
+            current = ContentTypeGatingConfig.current(course_key=course.id)
+            assert current.enabled
+            assert current.provenances['enabled'] == Provenance.org
+            assert current.provenances['enabled_as_of'] == Provenance.global_
+
+            # Once the table is loaded, every course resolves from memory
+            with self.assertNumQueries(0):
+                for other_course in other_courses:
+                    current = ContentTypeGatingConfig.current(course_key=other_course.id)
+                    assert not current.enabled
+                    assert current.provenances['enabled'] == Provenance.run
+                assert not ContentTypeGatingConfig.current(site=site_cfg.site).enabled
+
+            assert ContentTypeGatingConfig.all_current_course_configs() == expected_configs
+
+            # Changing any level reloads the table
+            org_config.enabled = False
+            org_config.save()
+            current = ContentTypeGatingConfig.current(course_key=course.id)
+            assert not current.enabled
+            assert current.provenances['enabled'] == Provenance.org
+
+    @override_settings(STACKED_CONFIG_RESOLUTION_TABLES=True)
+    def test_resolution_table_returns_copies(self):
+        course = CourseOverviewFactory.create(org='test-org')
+        ContentTypeGatingConfig.objects.create(course=course, enabled=True, enabled_as_of=datetime(2018, 1, 1))
+
+        current = ContentTypeGatingConfig.current(course_key=course.id)
+        current.enabled = False
+        current.provenances['enabled'] = Provenance.default
+
+        current = ContentTypeGatingConfig.current(course_key=course.id)
+        assert current.enabled
+        assert current.provenances['enabled'] == Provenance.run
+
+    @override_settings(STACKED_CONFIG_RESOLUTION_TABLES=True)
+    def test_resolution_table_memo_is_bounded(self):
+        ContentTypeGatingConfig.objects.create(enabled=True, enabled_as_of=datetime(2018, 1, 1))
+        resolution_table = ContentTypeGatingConfig._resolution_table()  # pylint: disable=protected-access
+
+        with patch('openedx.core.djangoapps.config_model_utils.models.RESOLUTION_TABLE_MEMO_SIZE', 2):
+            for org in ('org-a', 'org-b', 'org-a', 'org-c'):
+                assert ContentTypeGatingConfig.current(org=org).enabled
+
+        # The least recently used lookup was dropped
+        assert list(resolution_table._resolved) == [  # pylint: disable=protected-access
+            (None, 'org-a', None, None),
+            (None, 'org-c', None, None),
+        ]
+
+    def test_resolution_table_invalidated_on_commit(self):
+        course = CourseOverviewFactory.create(org='test-org')
+
+        with override_settings(STACKED_CONFIG_RESOLUTION_TABLES=True):
+            with self.captureOnCommitCallbacks(execute=True):
+                ContentTypeGatingConfig.objects.create(
+                    course=course, enabled=True, enabled_as_of=datetime(2018, 1, 1)
+                )
+                # A concurrent reader loads the table without the uncommitted override
+                with patch.object(ContentTypeGatingConfig.objects, 'current_set', return_value=[]):
+                    RequestCache.clear_all_namespaces()
+                    assert not ContentTypeGatingConfig.current(course_key=course.id).enabled
+
+            assert ContentTypeGatingConfig.current(course_key=course.id).enabled
+
     def _resolve_settings(self, settings):
         if all(setting is None for setting in settings):
             return None
@@ -1,4 +1,4 @@
-/* globals Sequence */
+/* globals Sequence, JavascriptLoader */
 (function() {
     'use strict';
 
@@ -122,5 +122,48 @@
                 });
             });
         });
+
+        describe('Lazy units', function() {
+            var renderUnit = function(url, data, callback) {
+                callback({content: 'Unit 102 content', resources: []});
+                return $.Deferred().resolve().promise();
+            };
+
+            beforeEach(function() {
+                this.sequence.el.append(
+                    '<div class="seq_contents">Unit 101 content</div>',
+                    '<div class="seq_contents" data-lazy="true"></div>'
+                );
+                this.sequence.contents = this.sequence.$('.seq_contents');
+                this.sequence.num_contents = this.sequence.contents.length;
+                this.sequence.render(1);
+                spyOn(JavascriptLoader, 'addFragmentResources').and.returnValue($.Deferred().resolve().promise());
+            });
+
+            it('renders a deferred unit when navigating to it', function() {
+                spyOn($, 'postWithPrefix').and.callFake(renderUnit);
+                this.sequence.render(2);
+
+                expect(JavascriptLoader.addFragmentResources).toHaveBeenCalledWith([]);
+                expect(this.sequence.position).toBe(2);
+                expect(this.sequence.content_container).toHaveText('Unit 102 content');
+                expect(this.sequence.contents.eq(1)).not.toHaveAttr('data-lazy');
+            });
+
+            it('shows an error and retries a deferred unit which failed to render', function() {
+                spyOn($, 'postWithPrefix').and.returnValue($.Deferred().reject().promise());
+                this.sequence.render(2);
+
+                expect(this.sequence.position).toBe(1);
+                expect(this.sequence.content_container.find('.lazy-unit-error')).toExist();
+                expect(this.sequence.contents.eq(1)).toHaveAttr('data-lazy', 'true');
+
+                $.postWithPrefix.and.callFake(renderUnit);
+                this.sequence.content_container.find('.lazy-unit-retry').click();
+
+                expect(this.sequence.position).toBe(2);
+                expect(this.sequence.content_container).toHaveText('Unit 102 content');
+            });
+        });
     });
 }).call(this);
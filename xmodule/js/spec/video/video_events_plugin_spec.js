@@ -9,7 +9,7 @@ import '../helper.js';
         var Logger = window.Logger;
 
         beforeEach(function() {
-            spyOn(Logger, 'log');
+            spyOn(Logger, 'logBatched');
             spyOn(state.videoEventsPlugin, 'getCurrentTime').and.returnValue(10);
         });
 
@@ -24,7 +24,7 @@ import '../helper.js';
 
         it('can emit "load_video" event', function() {
             state.el.trigger('ready');
-            expect(Logger.log).toHaveBeenCalledWith('load_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('load_video', {
                 id: 'id',
                 code: this.code,
                 duration: this.duration
@@ -34,7 +34,7 @@ import '../helper.js';
         it('can emit "play_video" event when emitPlayVideoEvent is true', function() {
             state.videoEventsPlugin.emitPlayVideoEvent = true;
             state.el.trigger('play');
-            expect(Logger.log).toHaveBeenCalledWith('play_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('play_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -46,12 +46,12 @@ import '../helper.js';
         it('can not emit "play_video" event when emitPlayVideoEvent is false', function() {
             state.videoEventsPlugin.emitPlayVideoEvent = false;
             state.el.trigger('play');
-            expect(Logger.log).not.toHaveBeenCalled();
+            expect(Logger.logBatched).not.toHaveBeenCalled();
         });
 
         it('can emit "pause_video" event', function() {
             state.el.trigger('pause');
-            expect(Logger.log).toHaveBeenCalledWith('pause_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('pause_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -62,7 +62,7 @@ import '../helper.js';
 
         it('can emit "complete_video" event when video is marked as complete', function() {
             state.el.trigger('complete');
-            expect(Logger.log).toHaveBeenCalledWith('complete_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('complete_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -72,7 +72,7 @@ import '../helper.js';
 
         it('can emit "speed_change_video" event', function() {
             state.el.trigger('speedchange', ['2.0', '1.0']);
-            expect(Logger.log).toHaveBeenCalledWith('speed_change_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('speed_change_video', {
                 id: 'id',
                 code: this.code,
                 current_time: 10,
@@ -84,7 +84,7 @@ import '../helper.js';
 
         it('can emit "seek_video" event', function() {
             state.el.trigger('seek', [1, 0, 'any']);
-            expect(Logger.log).toHaveBeenCalledWith('seek_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('seek_video', {
                 id: 'id',
                 code: this.code,
                 old_time: 0,
@@ -103,7 +103,7 @@ import '../helper.js';
 
         it('can emit "stop_video" event', function() {
             state.el.trigger('ended');
-            expect(Logger.log).toHaveBeenCalledWith('stop_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('stop_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -111,9 +111,9 @@ import '../helper.js';
             });
             expect(state.videoEventsPlugin.emitPlayVideoEvent).toBeTruthy();
 
-            Logger.log.calls.reset();
+            Logger.logBatched.calls.reset();
             state.el.trigger('stop');
-            expect(Logger.log).toHaveBeenCalledWith('stop_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('stop_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -124,7 +124,7 @@ import '../helper.js';
 
         it('can emit "skip_video" event', function() {
             state.el.trigger('skip', [false]);
-            expect(Logger.log).toHaveBeenCalledWith('skip_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('skip_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -134,7 +134,7 @@ import '../helper.js';
 
         it('can emit "do_not_show_again_video" event', function() {
             state.el.trigger('skip', [true]);
-            expect(Logger.log).toHaveBeenCalledWith('do_not_show_again_video', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('do_not_show_again_video', {
                 id: 'id',
                 code: this.code,
                 currentTime: 10,
@@ -144,7 +144,7 @@ import '../helper.js';
 
         it('can emit "edx.video.language_menu.shown" event', function() {
             state.el.trigger('language_menu:show');
-            expect(Logger.log).toHaveBeenCalledWith('edx.video.language_menu.shown', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('edx.video.language_menu.shown', {
                 id: 'id',
                 code: this.code,
                 duration: this.duration
@@ -153,7 +153,7 @@ import '../helper.js';
 
         it('can emit "edx.video.language_menu.hidden" event', function() {
             state.el.trigger('language_menu:hide');
-            expect(Logger.log).toHaveBeenCalledWith('edx.video.language_menu.hidden', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('edx.video.language_menu.hidden', {
                 id: 'id',
                 code: this.code,
                 language: 'en',
@@ -163,7 +163,7 @@ import '../helper.js';
 
         it('can emit "show_transcript" event', function() {
             state.el.trigger('transcript:show');
-            expect(Logger.log).toHaveBeenCalledWith('show_transcript', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('show_transcript', {
                 id: 'id',
                 code: this.code,
                 current_time: 10,
@@ -173,7 +173,7 @@ import '../helper.js';
 
         it('can emit "hide_transcript" event', function() {
             state.el.trigger('transcript:hide');
-            expect(Logger.log).toHaveBeenCalledWith('hide_transcript', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('hide_transcript', {
                 id: 'id',
                 code: this.code,
                 current_time: 10,
@@ -183,7 +183,7 @@ import '../helper.js';
 
         it('can emit "edx.video.closed_captions.shown" event', function() {
             state.el.trigger('captions:show');
-            expect(Logger.log).toHaveBeenCalledWith('edx.video.closed_captions.shown', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('edx.video.closed_captions.shown', {
                 id: 'id',
                 code: this.code,
                 current_time: 10,
@@ -193,7 +193,7 @@ import '../helper.js';
 
         it('can emit "edx.video.closed_captions.hidden" event', function() {
             state.el.trigger('captions:hide');
-            expect(Logger.log).toHaveBeenCalledWith('edx.video.closed_captions.hidden', {
+            expect(Logger.logBatched).toHaveBeenCalledWith('edx.video.closed_captions.hidden', {
                 id: 'id',
                 code: this.code,
                 current_time: 10,
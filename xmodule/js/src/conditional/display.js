@@ -75,7 +75,7 @@
       // by included scripts are logged to the console but are then ignored assuming
       // that at least the rendered HTML will be in place.
       try {
-        return this.addXBlockFragmentResources(resources).done(function () {
+        return JavascriptLoader.addFragmentResources(resources).done(function () {
           // We give XBlock fragments free-reign to add javascript and CSS to
           // to the page, so XSS escaping doesn't matter much in this context
           console.log("Fragment resources loaded, appending HTML");
@@ -88,87 +88,6 @@
       }
     };
 
-    /**
-    * Dynamically loads all of an XBlock's dependent resources. This is an asynchronous
-    * process so a promise is returned.
-    * @param resources The resources to be rendered
-    * @returns {Promise} A promise representing the rendering process
-    */
-    Conditional.prototype.addXBlockFragmentResources = function(resources) {
-      var self = this;
-      var applyResource;
-      var numResources;
-      var deferred;
-      var numResources = resources.length;
-      var deferred = $.Deferred();
-
-      applyResource = function (index) {
-        var hash, resource, value, promise;
-        if (index >= numResources) {
-          deferred.resolve();
-          return;
-        }
-        resource = resources[index];
-        window.loadedXBlockResources = window.loadedXBlockResources || [];
-        if (_.indexOf(loadedXBlockResources, resource) < 0) {
-          promise = self.loadResource(resource);
-          loadedXBlockResources.push(resource);
-          promise.done(function () {
-            applyResource(index + 1);
-          }).fail(function () {
-            deferred.reject();
-          });
-        } else {
-          applyResource(index + 1);
-        }
-      };
-      applyResource(0);
-      return deferred.promise();
-    };
-
-    /**
-    * Loads the specified resource into the page.
-    * @param resource The resource to be loaded.
-    * @returns {Promise} A promise representing the loading of the resource.
-    */
-    Conditional.prototype.loadResource = function(resource) {
-      // We give XBlock fragments free-reign to add javascript and CSS to
-      // to the page, so XSS escaping doesn't matter much in this context
-      var $head = $('head'),
-      mimetype = resource.mimetype,
-      kind = resource.kind,
-      placement = resource.placement,
-      data = resource.data;
-      var loaded;
-      if (mimetype === 'text/css') {
-        if (kind === 'text') {
-          // xss-lint: disable=javascript-jquery-append,javascript-concat-html
-          $head.append("<style type='text/css'>" + data + '</style>');
-        } else if (kind === 'url') {
-          // xss-lint: disable=javascript-jquery-append,javascript-concat-html
-          $head.append("<link rel='stylesheet' href='" + data + "' type='text/css'>");
-        }
-      } else if (mimetype === 'application/javascript') {
-        if (kind === 'text') {
-            // xss-lint: disable=javascript-jquery-append,javascript-concat-html
-            $head.append('<script>' + data + '</script>');
-        } else if (kind === 'url') {
-          loaded = $.Deferred();
-          $script(data, data, function() {
-              loaded.resolve()
-          });
-          return loaded.promise();
-        }
-      } else if (mimetype === 'text/html') {
-        if (placement === 'head') {
-          // xss-lint: disable=javascript-jquery-append
-          $head.append(data);
-        }
-      }
-      // Return an already resolved promise for synchronous updates
-      return $.Deferred().resolve().promise();
-    };
-
     return Conditional;
 
   })();
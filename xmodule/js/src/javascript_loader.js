@@ -1,3 +1,5 @@
+/* globals _, $script */
+
 (function() {
     'use strict';
 
@@ -85,6 +87,71 @@
             });
         };
 
+        /**
+         * Loads the resources of an XBlock fragment which aren't already in the page, in order.
+         * @param resources The resources of the fragment
+         * @returns {Promise} A promise resolved once all resources are loaded
+         */
+        JavascriptLoader.addFragmentResources = function(resources) {
+            var loaded = $.Deferred(),
+                applyResource;
+            window.loadedXBlockResources = window.loadedXBlockResources || [];
+            applyResource = function(index) {
+                var resource = resources[index];
+                if (index >= resources.length) {
+                    loaded.resolve();
+                    return;
+                }
+                if (_.findWhere(window.loadedXBlockResources, resource)) {
+                    applyResource(index + 1);
+                    return;
+                }
+                window.loadedXBlockResources.push(resource);
+                JavascriptLoader.loadFragmentResource(resource).done(function() {
+                    applyResource(index + 1);
+                });
+            };
+            applyResource(0);
+            return loaded.promise();
+        };
+
+        /**
+         * Loads a resource of an XBlock fragment into the page.
+         * @param resource The resource to load
+         * @returns {Promise} A promise resolved once the resource is loaded
+         */
+        JavascriptLoader.loadFragmentResource = function(resource) {
+            // We give XBlock fragments free-reign to add javascript and CSS to
+            // to the page, so XSS escaping doesn't matter much in this context
+            var $head = $('head'),
+                loaded;
+            if (resource.mimetype === 'text/css') {
+                if (resource.kind === 'text') {
+                    // xss-lint: disable=javascript-jquery-append,javascript-concat-html
+                    $head.append("<style type='text/css'>" + resource.data + '</style>');
+                } else if (resource.kind === 'url') {
+                    // xss-lint: disable=javascript-jquery-append,javascript-concat-html
+                    $head.append("<link rel='stylesheet' href='" + resource.data + "' type='text/css'>");
+                }
+            } else if (resource.mimetype === 'application/javascript') {
+                if (resource.kind === 'text') {
+                    // xss-lint: disable=javascript-jquery-append,javascript-concat-html
+                    $head.append('<script>' + resource.data + '</script>');
+                } else if (resource.kind === 'url') {
+                    loaded = $.Deferred();
+                    $script(resource.data, resource.data, function() {
+                        loaded.resolve();
+                    });
+                    return loaded.promise();
+                }
+            } else if (resource.mimetype === 'text/html' && resource.placement === 'head') {
+                // xss-lint: disable=javascript-jquery-append
+                $head.append(resource.data);
+            }
+            // Return an already resolved promise for synchronous updates
+            return $.Deferred().resolve().promise();
+        };
+
         return JavascriptLoader;
     }());
 }).call(this);
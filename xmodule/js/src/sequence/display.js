@@ -1,5 +1,5 @@
 /* eslint-disable no-underscore-dangle */
-/* globals Logger, interpolate */
+/* globals Logger, interpolate, JavascriptLoader */
 
 (function() {
     'use strict';
@@ -56,6 +56,7 @@
             this.id = this.el.data('id');
             this.getCompletionUrl = runtime.handlerUrl(element, 'get_completion');
             this.gotoPositionUrl = runtime.handlerUrl(element, 'goto_position');
+            this.renderUnitUrl = runtime.handlerUrl(element, 'render_unit');
             this.nextUrl = this.el.data('next-url');
             this.prevUrl = this.el.data('prev-url');
             this.savePosition = this.el.data('save-position');
@@ -227,9 +228,57 @@
             this.updateButtonState(nextButtonClass, this.selectNext, isLastTab, this.nextUrl);
         };
 
+        /**
+         * Renders a unit that was deferred when the sequence was rendered, storing its
+         * content like that of the units rendered up front once its resources are loaded.
+         * The unit stays deferred if it fails to render, so that it is retried.
+         * @param tab The .seq_contents element of the unit
+         * @param position The position of the unit in the sequence
+         * @returns {Promise} A promise resolved once the unit is rendered, or rejected if it failed to render
+         */
+        Sequence.prototype.loadLazyUnit = function(tab, position) {
+            var loaded = $.Deferred();
+            $.postWithPrefix(this.renderUnitUrl, JSON.stringify({position: position}), function(fragment) {
+                JavascriptLoader.addFragmentResources(fragment.resources || []).always(function() {
+                    tab.text(fragment.content).removeAttr('data-lazy').removeData('lazy');
+                    loaded.resolve();
+                });
+            }).fail(function() {
+                loaded.reject();
+            });
+            return loaded.promise();
+        };
+
+        /**
+         * Shows an error in place of a deferred unit which failed to render, with a button to retry.
+         * @param position The position of the unit in the sequence
+         */
+        Sequence.prototype.showLazyUnitError = function(position) {
+            var self = this,
+                $retry = $('<button type="button" class="btn btn-link lazy-unit-retry"></button>')
+                    .text(gettext('Try again'))
+                    .click(function() {
+                        self.render(position);
+                    });
+            this.content_container.empty().append(
+                $('<div class="lazy-unit-error" role="alert"></div>').append(
+                    $('<p></p>').text(gettext('There was an error loading this unit.')),
+                    $retry
+                )
+            );
+        };
+
         Sequence.prototype.render = function(newPosition) {
             var bookmarked, currentTab, sequenceLinks,
                 self = this;
+            if (this.position !== newPosition && this.contents.eq(newPosition - 1).data('lazy')) {
+                this.loadLazyUnit(this.contents.eq(newPosition - 1), newPosition).done(function() {
+                    self.render(newPosition);
+                }).fail(function() {
+                    self.showLazyUnitError(newPosition);
+                });
+                return;
+            }
             if (this.position !== newPosition) {
                 if (this.position) {
                     this.mark_visited(this.position);
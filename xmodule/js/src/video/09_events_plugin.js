@@ -159,7 +159,7 @@
                     code: this.state.isYoutubeType() ? this.state.youtubeId() : this.state.canPlayHLS ? 'hls' : 'html5',
                     duration: this.state.duration
                 }, data, this.options.data);
-                Logger.log(eventName, logInfo);
+                Logger.logBatched(eventName, logInfo);
             }
         };
 
@@ -19,7 +19,7 @@ from pytz import UTC
 from web_fragments.fragment import Fragment
 from xblock.completable import XBlockCompletionMode
 from xblock.core import XBlock
-from xblock.exceptions import NoSuchServiceError
+from xblock.exceptions import JsonHandlerError, NoSuchServiceError
 from xblock.fields import Boolean, Integer, List, Scope, String
 
 from edx_toggles.toggles import WaffleFlag, SettingDictToggle
@@ -71,6 +71,19 @@ TIMED_EXAM_GATING_WAFFLE_FLAG = WaffleFlag(  # lint-amnesty, pylint: disable=tog
 # .. toggle_target_removal_date: None
 SHOW_PROGRESS_BAR = SettingDictToggle("FEATURES", "SHOW_PROGRESS_BAR", default=False, module_name=__name__)
 
+# .. toggle_name: FEATURES['ENABLE_LAZY_SEQUENCE_UNITS']
+# .. toggle_implementation: SettingDictToggle
+# .. toggle_default: False
+# .. toggle_description: Set to True to only render the active unit of a sequence when the sequence is rendered.
+#   The other units are rendered on demand, through the sequence's render_unit handler, when the learner
+#   navigates to them.
+# .. toggle_use_cases: open_edx
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: None
+LAZY_SEQUENCE_UNITS = SettingDictToggle(
+    "FEATURES", "ENABLE_LAZY_SEQUENCE_UNITS", default=False, module_name=__name__
+)
+
 
 class SequenceFields:  # lint-amnesty, pylint: disable=missing-class-docstring
     has_children = True
@@ -273,6 +286,7 @@ class SequenceBlock(
 
     preview_view_js = {
         'js': [
+            resource_filename(__name__, 'js/src/javascript_loader.js'),
             resource_filename(__name__, 'js/src/sequence/display.js'),
         ],
         'xmodule_js': resource_filename(__name__, 'js/src/xmodule.js')
@@ -332,6 +346,34 @@ class SequenceBlock(
                 complete = completion_service.vertical_is_complete(item)
         return {'complete': complete}
 
+    @XBlock.json_handler
+    def render_unit(self, data, _suffix=''):
+        """
+        Renders the unit at the 'position' value in the incoming dict, for units
+        which were deferred when the sequence was rendered.  Returns the rendered
+        fragment as a dict.
+        """
+        # Units are only deferred when student_view renders them, so refuse to
+        # render any unit student_view would have replaced with gated content.
+        context = {}
+        prereq_met, _prereq_meta_info, _banner_text, special_html = self._get_student_view_gate(context)
+        if (
+            not prereq_met or special_html or self.gated_sequence_paywall is not None or
+            self.descendants_are_gated(context)
+        ):
+            raise JsonHandlerError(403, 'The content of this sequence is gated')
+
+        position = data.get('position')
+        children = self.get_children()
+        if not isinstance(position, int) or not 1 <= position <= len(children):
+            raise JsonHandlerError(400, 'Invalid position')
+
+        block = children[position - 1]
+        user = self.runtime.service(self, 'user').get_current_user()
+        context['username'] = user.opt_attrs.get('edx-platform.username')
+        context = self._get_unit_render_context(context, block, self._get_bookmarks_service())
+        return block.render(STUDENT_VIEW, context).to_dict()
+
     @XBlock.json_handler
     def goto_position(self, data, _suffix=''):
         """Sets the xblock position based off the 'position' value in the incoming dict"""
@@ -448,10 +490,28 @@ class SequenceBlock(
         """
         Renders the normal student view of the block in the LMS.
         """
-        _ = self.runtime.service(self, "i18n").ugettext
         context = context or {}
         self._capture_basic_metrics()
+        prereq_met, prereq_meta_info, banner_text, special_html = self._get_student_view_gate(context)
+        if special_html:
+            fragment = Fragment(special_html)
+            add_webpack_to_fragment(fragment, 'SequenceBlockPreview')
+            shim_xmodule_js(fragment, 'Sequence')
+            return fragment
+
+        return self._student_or_public_view(context, prereq_met, prereq_meta_info, banner_text)
+
+    def _get_student_view_gate(self, context):
+        """
+        Checks whether the runtime user meets the prerequisites of this
+        sequential and whether its content is replaced by a special view.
+        Returns the prerequisite status and info, the banner text to display,
+        and the html of the special view to display instead of the content,
+        if any.
+        """
+        _ = self.runtime.service(self, "i18n").ugettext
         banner_text = None
+        special_html = None
         prereq_met = True
         prereq_meta_info = {}
         if self._required_prereq():
@@ -465,15 +525,11 @@ class SequenceBlock(
         if prereq_met:
             special_html_view = self._hidden_content_student_view(context) or self._special_exam_student_view()
             if special_html_view:
-                masquerading_as_specific_student = context.get('specific_masquerade', False)
                 banner_text, special_html = special_html_view
-                if special_html and not masquerading_as_specific_student:
-                    fragment = Fragment(special_html)
-                    add_webpack_to_fragment(fragment, 'SequenceBlockPreview')
-                    shim_xmodule_js(fragment, 'Sequence')
-                    return fragment
+                if context.get('specific_masquerade', False):
+                    special_html = None
 
-        return self._student_or_public_view(context, prereq_met, prereq_meta_info, banner_text)
+        return prereq_met, prereq_meta_info, banner_text, special_html
 
     def public_view(self, context):
         """
@@ -760,12 +816,17 @@ class SequenceBlock(
         from openedx.core.lib.xblock_utils import get_icon
 
         render_blocks = not context.get('exclude_units', False)
+        # Only the active unit is rendered up front in lazy mode, the others are
+        # rendered by the render_unit handler once the learner navigates to them.
+        # The handler renders as the runtime user, so staff masquerading as a
+        # specific learner get all units up front.
+        lazy_units = (
+            render_blocks and view == STUDENT_VIEW and not context.get('specific_masquerade', False) and
+            LAZY_SEQUENCE_UNITS.is_enabled()
+        )
         is_user_authenticated = self.is_user_authenticated(context)
         completion_service = self.runtime.service(self, 'completion')
-        try:
-            bookmarks_service = self.runtime.service(self, 'bookmarks')
-        except NoSuchServiceError:
-            bookmarks_service = None
+        bookmarks_service = self._get_bookmarks_service()
         user = self.runtime.service(self, 'user').get_current_user()
         context['username'] = user.opt_attrs.get(
             'edx-platform.username')
@@ -774,22 +835,15 @@ class SequenceBlock(
             self.display_name_with_default
         ]
         contents = []
-        for block in children:
+        for position, block in enumerate(children, start=1):
             item_type = get_icon(block)
             usage_id = block.scope_ids.usage_id
 
-            show_bookmark_button = False
-            is_bookmarked = False
-
-            if is_user_authenticated and bookmarks_service:
-                show_bookmark_button = True
-                is_bookmarked = bookmarks_service.is_bookmarked(usage_key=usage_id)
-
-            context['show_bookmark_button'] = show_bookmark_button
-            context['bookmarked'] = is_bookmarked
-            context['format'] = getattr(self, 'format', '')
+            self._get_unit_render_context(context, block, bookmarks_service)
+            is_bookmarked = context['bookmarked']
 
-            if render_blocks:
+            is_lazy = lazy_units and position != self.position
+            if render_blocks and not is_lazy:
                 rendered_block = block.render(view, context)
                 fragment.add_fragment_resources(rendered_block)
                 content = rendered_block.content
@@ -804,6 +858,7 @@ class SequenceBlock(
                 ) is not None
             block_info = {
                 'content': content,
+                'lazy': is_lazy,
                 'page_title': getattr(block, 'tooltip_title', ''),
                 'type': item_type,
                 'id': str(usage_id),
@@ -824,6 +879,31 @@ class SequenceBlock(
 
         return contents
 
+    def _get_bookmarks_service(self):
+        """
+        Returns the bookmarks service, or None if the runtime doesn't provide it.
+        """
+        try:
+            return self.runtime.service(self, 'bookmarks')
+        except NoSuchServiceError:
+            return None
+
+    def _get_unit_render_context(self, context, block, bookmarks_service):
+        """
+        Updates the given render context with the values the given child
+        unit is rendered with, and returns it.
+        """
+        show_bookmark_button = False
+        is_bookmarked = False
+        if self.is_user_authenticated(context) and bookmarks_service:
+            show_bookmark_button = True
+            is_bookmarked = bookmarks_service.is_bookmarked(usage_key=block.scope_ids.usage_id)
+
+        context['show_bookmark_button'] = show_bookmark_button
+        context['bookmarked'] = is_bookmarked
+        context['format'] = getattr(self, 'format', '')
+        return context
+
     def _locations_in_subtree(self, node):
         """
         The usage keys for all descendants of an XBlock/XModule as a flat list.
@@ -403,6 +403,66 @@ class SequenceBlockTestCase(XModuleXmlImportTest):
             assert json.loads(completion_return) == {'complete': True}
         self.sequence_3_1.runtime._runtime_services['completion'] = None  # pylint: disable=protected-access
 
+    @patch('xmodule.seq_block.LAZY_SEQUENCE_UNITS.is_enabled', Mock(return_value=True))
+    def test_render_student_view_lazy_units(self):
+        html = self._get_rendered_view(self.sequence_3_1, requested_child='last')
+        self._assert_view_at_position(html, expected_position=3)
+        assert html.count("'lazy': True") == 2
+        assert html.count("'lazy': False") == 1
+
+    def test_render_student_view_without_lazy_units(self):
+        html = self._get_rendered_view(self.sequence_3_1)
+        assert "'lazy': True" not in html
+
+    @patch('xmodule.seq_block.LAZY_SEQUENCE_UNITS.is_enabled', Mock(return_value=True))
+    def test_render_student_view_lazy_units_masquerade(self):
+        html = self._get_rendered_view(self.sequence_3_1, extra_context=dict(specific_masquerade=True))
+        assert "'lazy': True" not in html
+
+    def test_xblock_handler_render_unit_success(self):
+        """Test that a deferred unit can be rendered through ajax call"""
+        request = RequestFactory().post(
+            '/',
+            data=json.dumps({'position': 2}),
+            content_type='application/json',
+        )
+        render_return = self.sequence_3_1.handle('render_unit', request)
+        assert render_return.status_code == 200
+        assert render_return.json['content']
+        assert 'resources' in render_return.json
+
+    def test_xblock_handler_render_unit_bad_position(self):
+        """Test that rendering a unit at an invalid position fails"""
+        request = RequestFactory().post(
+            '/',
+            data=json.dumps({'position': 10}),
+            content_type='application/json',
+        )
+        render_return = self.sequence_3_1.handle('render_unit', request)
+        assert render_return.status_code == 400
+
+    def test_xblock_handler_render_unit_hidden_content_past_due(self):
+        """Test that units of a sequence hidden after its due date can't be rendered"""
+        request = RequestFactory().post(
+            '/',
+            data=json.dumps({'position': 1}),
+            content_type='application/json',
+        )
+        with freeze_time(COURSE_END_DATE):
+            render_return = self.sequence_4_1.handle('render_unit', request)
+        assert render_return.status_code == 403
+
+    @patch('xmodule.seq_block.SequenceBlock._special_exam_student_view', Mock(return_value=('banner', 'exam_html')))
+    def test_xblock_handler_render_unit_special_exam(self):
+        """Test that units of a special exam can't be rendered"""
+        request = RequestFactory().post(
+            '/',
+            data=json.dumps({'position': 1}),
+            content_type='application/json',
+        )
+        render_return = self.sequence_3_1.handle('render_unit', request)
+        assert render_return.status_code == 403
+
     def test_xblock_handler_goto_position_success(self):
         """Test that we can set position through ajax call"""
         assert self.sequence_3_1.position != 5